@@ -3,11 +3,13 @@ from .video.api import router as video_router
 from .lyric.api import router as lyric_router
 from .transcription.api import router as transcription_router
 from .subtitle.api import router as subtitle_router
+from .job.api import router as job_router
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from dataclasses import asdict
 import logging
 
 container = AppContainer()
@@ -16,8 +18,25 @@ container = AppContainer()
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     container.init_resources()
+    await container.http_transport().start()
+    object_store = container.stt.object_store()
+    if object_store is not None:
+        await object_store.start()
     await container.aiosqlite().create_database()
+    # Reports pragmas SQLite did not accept, such as WAL on a network drive
+    await container.aiosqlite().check_pragmas()
+    worker = container.job.worker()
+    await worker.start()
     yield
+    await worker.stop()
+    # Stops the worker processes of the local backends
+    for backend in (container.stt.short_speech_to_text(), container.stt.local_mdx()):
+        if backend is not None:
+            backend.close()
+    await container.video_retrieval().close()
+    await container.http_transport().close()
+    if object_store is not None:
+        await object_store.close()
 
 
 api = FastAPI(
@@ -70,9 +89,44 @@ api.include_router(video_router, prefix="/api/v1")
 api.include_router(lyric_router, prefix="/api/v1")
 api.include_router(transcription_router, prefix="/api/v1")
 api.include_router(subtitle_router, prefix="/api/v1")
+api.include_router(job_router, prefix="/api/v1")
 
 
 # Health Check Endpoint
 @api.get("/api/v1/health", tags=["health"])
 async def health_check():
     return JSONResponse("OK", status_code=200)
+
+
+# Sizing metrics of the yt-dlp pool: a steadily non-zero waiting count means
+# metadata requests arrive faster than the pool can serve them
+@api.get("/api/v1/health/retrieval", tags=["health"])
+async def retrieval_stats():
+    retrieval = container.video_retrieval()
+    cache_stats = retrieval.cache_stats
+    return JSONResponse(
+        {
+            "pool": asdict(retrieval.pool_stats),
+            "cache": asdict(cache_stats) if cache_stats else None,
+        }
+    )
+
+
+# Latency per SQL statement, empty unless aiosqlite.instrumentation is set
+@api.get("/api/v1/health/database", tags=["health"])
+async def database_stats():
+    database = container.aiosqlite()
+    instrumentation = database.instrumentation
+    return JSONResponse(
+        {
+            "pragmas": await database.effective_pragmas(),
+            "queries": (
+                {
+                    statement: asdict(stats)
+                    for statement, stats in instrumentation.stats().items()
+                }
+                if instrumentation
+                else None
+            ),
+        }
+    )
@@ -3,7 +3,11 @@ from .video.container import VideoContainer
 from .lyric.container import LyricContainer
 from .transcription.container import TranscriptionContainer
 from .subtitle.container import SubtitleContainer
+from .job.container import JobContainer
+from .stt.container import STTContainer
 from .database import AIOSqlite
+from .stt.converter import configure_audio_converter
+from .shared.http import HTTPTransport
 
 from dependency_injector import containers, providers
 
@@ -13,10 +17,29 @@ class AppContainer(containers.DeclarativeContainer):
     config.from_yaml("config.yaml")
 
     aiosqlite = providers.Singleton(
-        AIOSqlite, relative_path=config.aiosqlite.relative_path
+        AIOSqlite,
+        relative_path=config.aiosqlite.relative_path,
+        pragmas=config.aiosqlite.pragmas,
+        read_connections=config.aiosqlite.read_connections,
+        echo=config.aiosqlite.echo,
+        instrumentation=config.aiosqlite.instrumentation,
     )
 
-    video_retrieval = providers.Singleton(VideoRetrieval, opts=config.yt_dlp.opts)
+    audio_converter = providers.Resource(
+        configure_audio_converter, config=config.ffmpeg
+    )
+
+    # Connection pool shared by the outbound API clients, started and closed
+    # by the application lifespan
+    http_transport = providers.Singleton(HTTPTransport, config=config.http)
+
+    video_retrieval = providers.Singleton(
+        VideoRetrieval,
+        opts=config.yt_dlp.opts,
+        pool=config.yt_dlp.pool,
+        executor=config.yt_dlp.executor,
+        cache=config.yt_dlp.cache,
+    )
 
     video = providers.Container(
         VideoContainer, database=aiosqlite, retrieval=video_retrieval
@@ -36,3 +59,17 @@ class AppContainer(containers.DeclarativeContainer):
         SubtitleContainer,
         database=aiosqlite,
     )
+
+    stt = providers.Container(
+        STTContainer,
+        config=config.stt,
+        transport=http_transport,
+    )
+
+    job = providers.Container(
+        JobContainer,
+        config=config.job,
+        database=aiosqlite,
+        retrieval=video_retrieval,
+        transcribe=stt.transcribe,
+    )
@@ -1,10 +1,13 @@
 # Core database components
 from .aiosqlite import AIOSqlite, AIOSqliteBase
 from .async_sqlalchemy import AsyncSQLAlchemy, AsyncSQLAlchemyBase
+from .instrumentation import QueryInstrumentation, QueryStats
 
 __all__ = [
     "AIOSqlite",
     "AIOSqliteBase",
     "AsyncSQLAlchemy",
     "AsyncSQLAlchemyBase",
+    "QueryInstrumentation",
+    "QueryStats",
 ]
@@ -1,5 +1,54 @@
 from .async_sqlalchemy import AsyncSQLAlchemy, AsyncSQLAlchemyBase
-from sqlalchemy import event
+from .instrumentation import QueryInstrumentation
+from sqlalchemy import event, text
+
+import logging
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class JournalMode(str, Enum):
+    delete = "delete"
+    truncate = "truncate"
+    persist = "persist"
+    memory = "memory"
+    wal = "wal"
+    off = "off"
+
+
+class Synchronous(str, Enum):
+    off = "off"
+    normal = "normal"
+    full = "full"
+    extra = "extra"
+
+
+class TempStore(str, Enum):
+    default = "default"
+    file = "file"
+    memory = "memory"
+
+
+@dataclass(frozen=True)
+class SQLitePragmaConfig:
+    # WAL lets readers run while a job writes, and commits only append
+    journal_mode: JournalMode = field(default=JournalMode.wal)
+    # With WAL, NORMAL only fsyncs at checkpoints and stays corruption safe
+    synchronous: Synchronous = field(default=Synchronous.normal)
+    # Bytes of the database file read through memory mapping
+    mmap_size: int = field(default=256 * 1024 * 1024)
+    # Page cache per connection, negative values are KiB
+    cache_size: int = field(default=-64 * 1024)
+    temp_store: TempStore = field(default=TempStore.memory)
+    # Milliseconds a connection waits for a lock before failing
+    busy_timeout: int = field(default=5000)
+
+
+# PRAGMA synchronous and temp_store report numbers instead of names
+_SYNCHRONOUS_VALUES = {0: "off", 1: "normal", 2: "full", 3: "extra"}
+_TEMP_STORE_VALUES = {0: "default", 1: "file", 2: "memory"}
 
 
 class AIOSqliteBase(AsyncSQLAlchemyBase):
@@ -11,17 +60,140 @@ class AIOSqliteBase(AsyncSQLAlchemyBase):
 
 
 class AIOSqlite(AsyncSQLAlchemy):
-    def __init__(self, relative_path: str):
+    def __init__(
+        self,
+        relative_path: str,
+        pragmas: dict | None = None,
+        read_connections: int | None = 0,
+        echo: bool | None = False,
+        instrumentation: dict | None = None,
+    ):
         """Initialize AIOSqlite with database path.
 
         Args:
             relative_path: Path to SQLite database file.
+            pragmas: Dictionary containing journal_mode, synchronous,
+                mmap_size, cache_size, temp_store and busy_timeout, applied
+                to every new connection. Missing keys use the defaults of
+                SQLitePragmaConfig.
+            read_connections: Size of a separate pool of read-only
+                connections. Writes then go through a single connection, so
+                they never conflict, while reads run in parallel next to
+                them; this needs WAL. 0 shares one pool for everything, as
+                do in-memory databases, which cannot be opened twice.
+            echo: Log every statement with its parameters, for debugging.
+            instrumentation: Dictionary configuring the QueryInstrumentation,
+                statements are not timed if None.
         """
-        super().__init__("sqlite+aiosqlite:///" + relative_path, AIOSqliteBase)
+        pragmas = dict(pragmas or {})
+        for name, enum in (
+            ("journal_mode", JournalMode),
+            ("synchronous", Synchronous),
+            ("temp_store", TempStore),
+        ):
+            if name in pragmas:
+                pragmas[name] = enum(str(pragmas[name]).lower())
+        self._pragmas = SQLitePragmaConfig(**pragmas)
+
+        read_connections = read_connections or 0
+        if relative_path == ":memory:":
+            read_connections = 0
+        super().__init__(
+            "sqlite+aiosqlite:///" + relative_path,
+            AIOSqliteBase,
+            read_connection_url=(
+                f"sqlite+aiosqlite:///file:{relative_path}?mode=ro&uri=true"
+            ),
+            read_pool_size=read_connections,
+            # The single writer, every other session waits for it in turn
+            engine_options=(
+                {"pool_size": 1, "max_overflow": 0} if read_connections > 0 else None
+            ),
+            echo=bool(echo),
+            instrumentation=(
+                QueryInstrumentation(instrumentation)
+                if instrumentation is not None
+                else None
+            ),
+        )
         event.listen(self._engine.sync_engine, "connect", self._enable_foreign_keys)
+        event.listen(self._engine.sync_engine, "connect", self._apply_pragmas)
+        if self._read_engine is not None:
+            event.listen(
+                self._read_engine.sync_engine, "connect", self._apply_read_pragmas
+            )
+
+    @property
+    def pragmas(self) -> SQLitePragmaConfig:
+        return self._pragmas
 
     def _enable_foreign_keys(self, dbapi_conn, _):
         """Enable foreign keys for SQLite."""
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON;")
         cursor.close()
+
+    def _apply_pragmas(self, dbapi_conn, _):
+        """Apply the configured performance profile to a new connection."""
+        cursor = dbapi_conn.cursor()
+        # Journal mode first, the others are per connection and cheap
+        for name, value in asdict(self._pragmas).items():
+            value = value.value if isinstance(value, Enum) else value
+            cursor.execute(f"PRAGMA {name}={value};")
+        cursor.close()
+
+    def _apply_read_pragmas(self, dbapi_conn, _):
+        """Apply the profile to a read-only connection and forbid writes."""
+        cursor = dbapi_conn.cursor()
+        # The journal mode belongs to the file and is set by the writer
+        for name, value in asdict(self._pragmas).items():
+            if name != "journal_mode":
+                value = value.value if isinstance(value, Enum) else value
+                cursor.execute(f"PRAGMA {name}={value};")
+        cursor.execute("PRAGMA query_only=ON;")
+        cursor.close()
+
+    async def effective_pragmas(self) -> dict[str, str | int | None]:
+        """Read back the pragma values SQLite actually uses.
+
+        SQLite silently keeps another value when one cannot be applied, such
+        as WAL on an in-memory database or mmap beyond its compile-time limit.
+
+        Returns:
+            The effective value of every configured pragma and foreign_keys,
+            None for pragmas that do not apply, like mmap_size in memory.
+        """
+        values: dict[str, str | int | None] = {}
+        async with self._engine.connect() as conn:
+            for name in (*asdict(self._pragmas), "foreign_keys"):
+                result = await conn.execute(text(f"PRAGMA {name}"))
+                values[name] = result.scalar()
+
+        for name, names in (
+            ("synchronous", _SYNCHRONOUS_VALUES),
+            ("temp_store", _TEMP_STORE_VALUES),
+        ):
+            value = values[name]
+            values[name] = names.get(value, value) if isinstance(value, int) else value
+        if isinstance(values["journal_mode"], str):
+            values["journal_mode"] = values["journal_mode"].lower()
+        return values
+
+    async def check_pragmas(self) -> dict[str, str | int | None]:
+        """Log the effective pragma values and warn about ignored ones.
+
+        Returns:
+            The effective values, as returned by effective_pragmas.
+        """
+        values = await self.effective_pragmas()
+        logger.info(
+            "SQLite pragmas: "
+            + ", ".join(f"{name}={value}" for name, value in values.items())
+        )
+        for name, expected in asdict(self._pragmas).items():
+            expected = expected.value if isinstance(expected, Enum) else expected
+            if values[name] is not None and values[name] != expected:
+                logger.warning(
+                    f"SQLite kept {name}={values[name]} instead of {expected}"
+                )
+        return values
@@ -1,8 +1,12 @@
+from .instrumentation import QueryInstrumentation
+from .migration import upgrade_schema
+
 import asyncio
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
+    AsyncEngine,
     AsyncSession,
     async_scoped_session,
     async_sessionmaker,
@@ -19,26 +23,62 @@ class AsyncSQLAlchemyBase(DeclarativeBase, MappedAsDataclass, AsyncAttrs):
 
 
 class AsyncSQLAlchemy:
-    def __init__(self, connection_url: str, base: type[DeclarativeBase]):
+    def __init__(
+        self,
+        connection_url: str,
+        base: type[DeclarativeBase],
+        read_connection_url: str | None = None,
+        read_pool_size: int = 0,
+        engine_options: dict | None = None,
+        echo: bool = False,
+        instrumentation: QueryInstrumentation | None = None,
+    ):
         """Initialize AsyncSQLAlchemy with connection URL and base class.
 
         Args:
             connection_url: Database connection URL.
             base: SQLAlchemy declarative base class.
+            read_connection_url: Optional URL of a read-only view of the same
+                database. With it, read_session uses a separate pool of
+                read_pool_size connections, otherwise reads share the writer.
+            read_pool_size: Number of read-only connections.
+            engine_options: Extra create_async_engine options of the writer.
+            echo: Log every statement with its parameters, for debugging.
+            instrumentation: Optional recorder of statement latencies,
+                attached to every engine.
         """
         self._connection_url = connection_url
-        self._engine = create_async_engine(connection_url, echo=True)
-        self._session_factory = async_scoped_session(
-            async_sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self._engine,
-                expire_on_commit=False,
-            ),
-            scopefunc=asyncio.current_task,
+        self._engine = create_async_engine(
+            connection_url, echo=echo, **(engine_options or {})
         )
+        self._session_factory = _scoped_session_factory(self._engine)
+
+        self._read_engine: AsyncEngine | None = None
+        self._read_session_factory = None
+        if read_connection_url is not None and read_pool_size > 0:
+            self._read_engine = create_async_engine(
+                read_connection_url,
+                echo=echo,
+                pool_size=read_pool_size,
+                max_overflow=0,
+            )
+            self._read_session_factory = _scoped_session_factory(self._read_engine)
         self._base = base
 
+        self._instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.attach(self._engine.sync_engine)
+            if self._read_engine is not None:
+                instrumentation.attach(self._read_engine.sync_engine)
+
+    @property
+    def instrumentation(self) -> QueryInstrumentation | None:
+        return self._instrumentation
+
+    @property
+    def has_read_pool(self) -> bool:
+        return self._read_engine is not None
+
     @asynccontextmanager
     async def session(
         self,
@@ -53,15 +93,39 @@ class AsyncSQLAlchemy:
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def read_session(
+        self,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Open a session for queries that do not write.
+
+        It comes from the read-only pool when one is configured, so long
+        reads never wait for the writer, and from the writer otherwise.
+        """
+        if self._read_session_factory is None:
+            async with self.session() as session:
+                yield session
+            return
+
+        session = self._read_session_factory()
+        try:
+            yield session
+        finally:
+            # Nothing to commit, closing ends the read transaction
+            await session.close()
+
     async def create_database(self) -> None:
         # Ensure all models are imported before creating tables
         self._register_models()
         async with self._engine.begin() as conn:
             await conn.run_sync(self._base.metadata.create_all)
+            # Existing tables are left alone by create_all
+            await conn.run_sync(upgrade_schema, self._base.metadata)
 
     def _register_models(self) -> None:
         """Import all models to register them with SQLAlchemy."""
         try:
+            from ..job.model import Job  # noqa: F401 # type: ignore
             from ..lyric.model import Lyric  # noqa: F401 # type: ignore
             from ..subtitle.model import Subtitle  # noqa: F401 # type: ignore
             from ..transcription.model import Transcription  # noqa: F401 # type: ignore
@@ -81,3 +145,15 @@ class AsyncSQLAlchemy:
         async with self._engine.begin() as conn:
             await conn.run_sync(self._base.metadata.drop_all)
             await conn.run_sync(self._base.metadata.create_all)
+
+
+def _scoped_session_factory(engine: AsyncEngine) -> async_scoped_session:
+    return async_scoped_session(
+        async_sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=engine,
+            expire_on_commit=False,
+        ),
+        scopefunc=asyncio.current_task,
+    )
@@ -0,0 +1,209 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import logging
+import random
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# Statements beyond the limit are counted under this key
+OTHER_STATEMENTS = "<other>"
+# Only the start of long statements is logged, they can embed whole subtitles
+_LOGGED_STATEMENT_SIZE = 500
+_STARTED_AT = "query_started_at"
+
+
+@dataclass(frozen=True)
+class QueryInstrumentationConfig:
+    # Share of statements recorded in the histograms
+    sample_rate: float = field(default=1.0)
+    # Statements at least this slow are logged, sampled or not; None disables
+    slow_query_seconds: float | None = field(default=0.25)
+    buckets: tuple[float, ...] = field(default=DEFAULT_BUCKETS)
+    # Distinct statements tracked, bounds memory with generated SQL
+    max_statements: int = field(default=200)
+
+
+@dataclass(frozen=True)
+class QueryStats:
+    count: int
+    total_seconds: float
+    max_seconds: float
+    # Counts per bucket of the configuration, plus one for slower statements
+    buckets: tuple[int, ...]
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+
+
+@dataclass
+class _Histogram:
+    buckets: list[int]
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class QueryInstrumentation:
+    """Records per-statement latency of SQLAlchemy engines.
+
+    Timing hooks into the before_cursor_execute and after_cursor_execute
+    events, so parameters are never formatted. A sample of the statements
+    goes into a latency histogram per SQL string; every statement slower
+    than ``slow_query_seconds`` is logged with its parameter count.
+    """
+
+    def __init__(self, config: dict | None = None):
+        """Initialize QueryInstrumentation with configuration.
+
+        Args:
+            config: Dictionary containing sample_rate, slow_query_seconds,
+                buckets and max_statements.
+
+        Raises:
+            ValueError: If sample_rate is not in [0, 1] or buckets are not
+                increasing.
+        """
+        config = dict(config or {})
+        if "buckets" in config:
+            config["buckets"] = tuple(config["buckets"])
+        self._config = QueryInstrumentationConfig(**config)
+
+        if not 0 <= self._config.sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        buckets = self._config.buckets
+        if not buckets or any(
+            b <= a for a, b in zip(buckets, buckets[1:], strict=False)
+        ):
+            raise ValueError("buckets must be increasing.")
+
+        self._histograms: dict[str, _Histogram] = {}
+        # Events fire on the aiosqlite worker threads of every connection
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> QueryInstrumentationConfig:
+        return self._config
+
+    def attach(self, engine: Engine) -> None:
+        """Start timing the statements of an engine.
+
+        Args:
+            engine: The engine, the sync_engine of an AsyncEngine.
+        """
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._discard)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_STARTED_AT, []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info[_STARTED_AT].pop()
+        elapsed = time.perf_counter() - started_at
+        self.record(statement, elapsed, parameters)
+
+    def _discard(self, exception_context):
+        # A failed statement never reaches _after, its start would be left
+        # on the pooled connection
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(_STARTED_AT):
+            conn.info[_STARTED_AT].pop()
+
+    def record(self, statement: str, elapsed: float, parameters=None) -> None:
+        """Account one executed statement.
+
+        Args:
+            statement: The SQL string, with placeholders.
+            elapsed: Execution time in seconds.
+            parameters: The bound parameters, only their count is logged.
+        """
+        config = self._config
+        if (
+            config.slow_query_seconds is not None
+            and elapsed >= config.slow_query_seconds
+        ):
+            logger.warning(
+                f"Slow query took {elapsed * 1000:.1f}ms with "
+                f"{_parameter_count(parameters)} parameters: "
+                f"{statement[:_LOGGED_STATEMENT_SIZE]}"
+            )
+
+        if config.sample_rate < 1 and random.random() >= config.sample_rate:  # noqa: S311
+            return
+
+        with self._lock:
+            histogram = self._histograms.get(statement)
+            if histogram is None:
+                if len(self._histograms) >= config.max_statements:
+                    statement = OTHER_STATEMENTS
+                histogram = self._histograms.setdefault(
+                    statement, _Histogram(buckets=[0] * (len(config.buckets) + 1))
+                )
+            histogram.count += 1
+            histogram.total_seconds += elapsed
+            histogram.max_seconds = max(histogram.max_seconds, elapsed)
+            histogram.buckets[bisect_left(config.buckets, elapsed)] += 1
+
+    def stats(self) -> dict[str, QueryStats]:
+        """Summarize the recorded statements.
+
+        Percentiles are the upper bound of the bucket they fall into, or the
+        maximum for the overflow bucket.
+
+        Returns:
+            Statistics per SQL string.
+        """
+        with self._lock:
+            histograms = {
+                statement: _Histogram(
+                    buckets=list(histogram.buckets),
+                    count=histogram.count,
+                    total_seconds=histogram.total_seconds,
+                    max_seconds=histogram.max_seconds,
+                )
+                for statement, histogram in self._histograms.items()
+            }
+
+        return {
+            statement: QueryStats(
+                count=histogram.count,
+                total_seconds=histogram.total_seconds,
+                max_seconds=histogram.max_seconds,
+                buckets=tuple(histogram.buckets),
+                p50_seconds=self._percentile(histogram, 0.50),
+                p95_seconds=self._percentile(histogram, 0.95),
+                p99_seconds=self._percentile(histogram, 0.99),
+            )
+            for statement, histogram in histograms.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def _percentile(self, histogram: _Histogram, percentile: float) -> float:
+        target = percentile * histogram.count
+        seen = 0
+        for index, count in enumerate(histogram.buckets):
+            seen += count
+            if count and seen >= target:
+                if index < len(self._config.buckets):
+                    return min(self._config.buckets[index], histogram.max_seconds)
+                break
+        return histogram.max_seconds
+
+
+def _parameter_count(parameters) -> int:
+    if parameters is None:
+        return 0
+    if isinstance(parameters, list):
+        # executemany, count the parameters of every row
+        return sum(len(row) for row in parameters)
+    return len(parameters)
@@ -0,0 +1,54 @@
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.engine import Connection
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def upgrade_schema(conn: Connection, metadata: MetaData) -> list[str]:
+    """Bring tables created by an older version up to date with the models.
+
+    create_all skips tables that already exist, including their indexes, so
+    databases created before an index or column was added never get it. This
+    adds missing indexes and missing nullable columns; other columns cannot
+    be added without a value for the existing rows and are only reported.
+
+    Args:
+        conn: Connection inside the transaction creating the tables.
+        metadata: Metadata of all registered models.
+
+    Returns:
+        Descriptions of the applied changes.
+    """
+    inspector = inspect(conn)
+    applied: list[str] = []
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in columns:
+                continue
+            if not column.nullable:
+                logger.error(
+                    f"Column {table.name}.{column.name} is missing and cannot be "
+                    "added to existing rows, recreate the table"
+                )
+                continue
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+            )
+            applied.append(f"column {table.name}.{column.name}")
+
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes:
+                index.create(conn)
+                applied.append(f"index {index.name}")
+
+    for change in applied:
+        logger.info(f"Schema upgraded: added {change}")
+    return applied
@@ -0,0 +1,98 @@
+from ..shared.supported import Platform
+from ..video.model import Video
+from .aiosqlite import AIOSqlite, JournalMode, Synchronous
+
+import logging
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+
+@pytest.mark.asyncio
+async def test_default_profile_is_applied(tmp_path):
+    database = AIOSqlite(relative_path=str(tmp_path / "main.db"))
+    await database.create_database()
+
+    values = await database.effective_pragmas()
+
+    assert values == {
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "temp_store": "memory",
+        "busy_timeout": 5000,
+        "foreign_keys": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_configured_pragmas(tmp_path):
+    database = AIOSqlite(
+        relative_path=str(tmp_path / "main.db"),
+        pragmas={"journal_mode": "DELETE", "synchronous": "full", "cache_size": 500},
+    )
+
+    assert database.pragmas.journal_mode == JournalMode.delete
+    assert database.pragmas.synchronous == Synchronous.full
+    values = await database.effective_pragmas()
+    assert values["journal_mode"] == "delete"
+    assert values["synchronous"] == "full"
+    assert values["cache_size"] == 500
+
+
+def test_invalid_pragma_value():
+    with pytest.raises(ValueError):
+        AIOSqlite(relative_path=":memory:", pragmas={"journal_mode": "fast"})
+
+
+@pytest.mark.asyncio
+async def test_check_warns_about_ignored_pragmas(caplog):
+    # In-memory databases cannot use WAL
+    database = AIOSqlite(relative_path=":memory:")
+
+    with caplog.at_level(logging.INFO, logger="app.database.aiosqlite"):
+        values = await database.check_pragmas()
+
+    assert values["journal_mode"] == "memory"
+    assert "SQLite pragmas: journal_mode=memory" in caplog.text
+    assert "SQLite kept journal_mode=memory instead of wal" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_reads_use_a_read_only_pool(tmp_path):
+    database = AIOSqlite(relative_path=str(tmp_path / "main.db"), read_connections=2)
+    await database.create_database()
+    assert database.has_read_pool
+
+    async with database.session() as session:
+        session.add(
+            Video(
+                platform=Platform.youtube,
+                video_id="testestest",
+                channel_id="channel123",
+                channel_name="Test Channel",
+                title="Test Video",
+                duration_seconds=100,
+                thumbnail_url="http://example.com/thumbnail.jpg",
+            )
+        )
+
+    async with database.read_session() as session:
+        assert (await session.execute(text("PRAGMA query_only"))).scalar() == 1
+        count = await session.execute(text("SELECT count(*) FROM videos"))
+        assert count.scalar() == 1
+
+        with pytest.raises(OperationalError):
+            await session.execute(text("DELETE FROM videos"))
+
+
+@pytest.mark.asyncio
+async def test_in_memory_database_shares_one_pool():
+    database = AIOSqlite(relative_path=":memory:", read_connections=2)
+    await database.reset_database()
+
+    assert not database.has_read_pool
+    async with database.read_session() as session:
+        count = await session.execute(text("SELECT count(*) FROM videos"))
+        assert count.scalar() == 0
@@ -0,0 +1,90 @@
+from .aiosqlite import AIOSqlite
+from .instrumentation import OTHER_STATEMENTS, QueryInstrumentation
+
+import logging
+import pytest
+from sqlalchemy import text
+
+
+def test_records_histogram_and_percentiles():
+    instrumentation = QueryInstrumentation({"buckets": [0.01, 0.1, 1.0]})
+
+    for _ in range(90):
+        instrumentation.record("SELECT 1", 0.005)
+    for _ in range(10):
+        instrumentation.record("SELECT 1", 0.05)
+    instrumentation.record("SELECT 1", 2.0)
+
+    stats = instrumentation.stats()["SELECT 1"]
+    assert stats.count == 101
+    assert stats.buckets == (90, 10, 0, 1)
+    assert stats.max_seconds == 2.0
+    assert stats.p50_seconds == 0.01
+    assert stats.p95_seconds == 0.1
+    assert stats.p99_seconds == 0.1
+
+
+def test_sampling_skips_histograms():
+    instrumentation = QueryInstrumentation({"sample_rate": 0})
+
+    instrumentation.record("SELECT 1", 0.001)
+
+    assert instrumentation.stats() == {}
+
+
+def test_slow_queries_are_logged_without_values(caplog):
+    instrumentation = QueryInstrumentation(
+        {"sample_rate": 0, "slow_query_seconds": 0.1}
+    )
+
+    with caplog.at_level(logging.WARNING, logger="app.database.instrumentation"):
+        instrumentation.record("INSERT INTO t VALUES (?, ?)", 0.2, ("lyrics", 1))
+        instrumentation.record("SELECT 1", 0.01)
+
+    assert len(caplog.records) == 1
+    assert "200.0ms with 2 parameters: INSERT INTO t" in caplog.text
+    assert "lyrics" not in caplog.text
+
+
+def test_distinct_statements_are_bounded():
+    instrumentation = QueryInstrumentation({"max_statements": 2})
+
+    for index in range(4):
+        instrumentation.record(f"SELECT {index}", 0.001)
+
+    assert set(instrumentation.stats()) == {"SELECT 0", "SELECT 1", OTHER_STATEMENTS}
+    assert instrumentation.stats()[OTHER_STATEMENTS].count == 2
+
+
+def test_invalid_config():
+    with pytest.raises(ValueError):
+        QueryInstrumentation({"sample_rate": 2})
+    with pytest.raises(ValueError):
+        QueryInstrumentation({"buckets": [0.1, 0.01]})
+
+
+@pytest.mark.asyncio
+async def test_engine_statements_are_timed():
+    database = AIOSqlite(relative_path=":memory:", instrumentation={})
+    await database.reset_database()
+
+    async with database.session() as session:
+        await session.execute(text("SELECT count(*) FROM videos"))
+
+    assert database.instrumentation is not None
+    stats = database.instrumentation.stats()
+    assert stats["SELECT count(*) FROM videos"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_leave_no_start_time():
+    database = AIOSqlite(relative_path=":memory:", instrumentation={})
+    await database.reset_database()
+
+    async with database.session() as session:
+        with pytest.raises(Exception, match="no such table"):
+            await session.execute(text("SELECT * FROM missing"))
+        connection = await session.connection()
+        info = await connection.run_sync(lambda conn: dict(conn.info))
+
+    assert not info.get("query_started_at")
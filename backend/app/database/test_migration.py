@@ -0,0 +1,80 @@
+from ..lyric.model import Lyric
+from ..subtitle.model import Subtitle
+from ..transcription.model import Transcription
+from .aiosqlite import AIOSqlite
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.functions import count
+
+
+async def _query_plan(database: AIOSqlite, query: Select) -> str:
+    compiled = query.compile(
+        dialect=database._engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    async with database.session() as session:
+        result = await session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        return "\n".join(row.detail for row in result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model", [Lyric, Transcription, Subtitle])
+async def test_video_filters_use_the_index(model):
+    database = AIOSqlite(relative_path=":memory:")
+    await database.reset_database()
+    index = f"ix_{model.__tablename__}_video_instance_id"
+
+    listing = Select(model).where(model.video_instance_id == 1).limit(10)
+    total = Select(count(model.instance_id)).where(model.video_instance_id == 1)
+
+    for query in (listing, total):
+        plan = await _query_plan(database, query)
+        assert index in plan
+        assert f"SCAN {model.__tablename__}" not in plan.replace(" USING", "\n")
+
+
+@pytest.mark.asyncio
+async def test_upgrade_adds_indexes_and_nullable_columns(tmp_path):
+    path = tmp_path / "main.db"
+    database = AIOSqlite(relative_path=str(path))
+    await database.create_database()
+    # Roll the schema back to what an older version created
+    async with database.session() as session:
+        for table in ("lyrics", "transcriptions", "subtitles"):
+            await session.execute(text(f"DROP INDEX ix_{table}_video_instance_id"))
+        await session.execute(text("ALTER TABLE jobs DROP COLUMN caption_score"))
+
+    upgraded = AIOSqlite(relative_path=str(path))
+    await upgraded.create_database()
+
+    async with upgraded._engine.connect() as conn:
+
+        def _schema(sync_conn):
+            inspector = inspect(sync_conn)
+            return (
+                {
+                    table: [index["name"] for index in inspector.get_indexes(table)]
+                    for table in ("lyrics", "transcriptions", "subtitles")
+                },
+                [column["name"] for column in inspector.get_columns("jobs")],
+            )
+
+        indexes, job_columns = await conn.run_sync(_schema)
+
+    for table, names in indexes.items():
+        assert f"ix_{table}_video_instance_id" in names
+    assert "caption_score" in job_columns
+
+
+@pytest.mark.asyncio
+async def test_upgrade_of_current_schema_changes_nothing(tmp_path):
+    from .migration import upgrade_schema
+
+    database = AIOSqlite(relative_path=str(tmp_path / "main.db"))
+    await database.create_database()
+
+    async with database._engine.begin() as conn:
+        applied = await conn.run_sync(upgrade_schema, database._base.metadata)
+
+    assert applied == []
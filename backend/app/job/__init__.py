@@ -0,0 +1,16 @@
+from .api import router, create_job, get_job_by_instance_id
+from .container import JobContainer
+from .service import JobService
+from .worker import JobWorker
+from .dto import Job, CreateJob
+
+__all__ = [
+    "router",
+    "create_job",
+    "get_job_by_instance_id",
+    "JobContainer",
+    "JobService",
+    "JobWorker",
+    "Job",
+    "CreateJob",
+]
@@ -0,0 +1,52 @@
+from .container import JobContainer
+from .service import JobService
+from .dto import CreateJob, Job
+from .exception import NotFoundThingError
+
+from fastapi.routing import APIRouter
+from fastapi import Depends, status
+from fastapi.responses import JSONResponse
+from dependency_injector.wiring import inject, Provide
+
+router = APIRouter(prefix="/job", tags=["job"])
+
+
+@router.post(
+    "/",
+    response_model=Job,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={404: {"description": "Not found"}},
+)
+@inject
+async def create_job(
+    dto: CreateJob,
+    service: JobService = Depends(Provide[JobContainer.service]),
+) -> Job | JSONResponse:
+    """Enqueue a transcription job and return immediately.
+
+    Poll `GET /job/{instance_id}` until the status is completed or failed.
+    """
+    try:
+        return await service.create_job(dto)
+    except NotFoundThingError as e:
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+
+@router.get(
+    "/{instance_id}",
+    response_model=Job,
+    responses={404: {"description": "Not found"}},
+)
+@inject
+async def get_job_by_instance_id(
+    instance_id: int,
+    service: JobService = Depends(Provide[JobContainer.service]),
+) -> Job | JSONResponse:
+    result = await service.get_job_by_instance_id(instance_id)
+    if result is None:
+        # return None with 404 status code
+        return JSONResponse(content=None, status_code=status.HTTP_404_NOT_FOUND)
+    return result
@@ -0,0 +1,115 @@
+from ..shared.supported import Language
+from ..shared.vtt import parse_vtt
+from ..video_retrieval.type import Captions
+
+import re
+from dataclasses import dataclass, field
+
+# Cues like "[Music]" or "♪" mark that something is playing, not what is sung
+_NON_LYRIC = re.compile(r"\[[^\]]*\]|\([^)]*\)|[♪♫♬\s]")
+
+
+@dataclass(frozen=True)
+class CaptionQualityConfig:
+    # Captions scoring at least this are used instead of transcribing
+    min_score: float = field(default=0.6)
+    # Weight of auto-generated captions, uploaded ones weigh 1
+    generated_weight: float = field(default=0.5)
+    # Share of the video covered by lyric cues that counts as complete, below
+    # one because intros, outros and breaks have nothing to caption
+    full_coverage: float = field(default=0.5)
+    # Weight when no language was requested and the captions have none
+    unknown_language_weight: float = field(default=0.5)
+
+
+@dataclass(frozen=True)
+class CaptionQuality:
+    score: float
+    source: float
+    coverage: float
+    language: float
+
+
+class CaptionScorer:
+    """Rates how far platform captions can replace a transcription.
+
+    The score is the product of three factors in the 0..1 range: the source,
+    uploaded or auto-generated; the share of the video covered by cues with
+    actual text, relative to ``full_coverage``; and whether the language
+    matches the requested one.
+    """
+
+    def __init__(self, config: dict | None = None):
+        """Initialize CaptionScorer with configuration.
+
+        Args:
+            config: Dictionary containing min_score, generated_weight,
+                full_coverage and unknown_language_weight.
+
+        Raises:
+            ValueError: If full_coverage is not in (0, 1].
+        """
+        self._config = CaptionQualityConfig(**(config or {}))
+        if not 0 < self._config.full_coverage <= 1:
+            raise ValueError("full_coverage must be in (0, 1].")
+
+    @property
+    def config(self) -> CaptionQualityConfig:
+        return self._config
+
+    def score(
+        self,
+        captions: Captions,
+        duration_seconds: float,
+        target_language: Language | None = None,
+    ) -> CaptionQuality:
+        """Score captions of a video.
+
+        Args:
+            captions: The captions to rate.
+            duration_seconds: Duration of the video.
+            target_language: The requested language, any if None.
+
+        Returns:
+            The overall score and its factors.
+        """
+        config = self._config
+        source = config.generated_weight if captions.generated else 1.0
+
+        coverage = 0.0
+        if duration_seconds > 0:
+            covered = _covered_seconds(captions.transcription.content)
+            coverage = min(covered / duration_seconds / config.full_coverage, 1.0)
+
+        language = captions.transcription.language
+        if target_language is not None:
+            language_factor = 1.0 if language == target_language else 0.0
+        else:
+            language_factor = 1.0 if language else config.unknown_language_weight
+
+        return CaptionQuality(
+            score=source * coverage * language_factor,
+            source=source,
+            coverage=coverage,
+            language=language_factor,
+        )
+
+    def accepts(self, quality: CaptionQuality) -> bool:
+        return quality.score >= self._config.min_score
+
+
+def _covered_seconds(content: str) -> float:
+    spans = sorted(
+        (cue.start, cue.end)
+        for cue in parse_vtt(content)
+        if cue.end > cue.start and _NON_LYRIC.sub("", cue.text)
+    )
+
+    # Auto-generated captions overlap their neighbours, count time only once
+    merged: list[list[float]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return sum(end - start for start, end in merged)
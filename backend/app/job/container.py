@@ -0,0 +1,54 @@
+from ..transcription.repository import TranscriptionRepository
+from ..video.repository import VideoRepository
+from .repository import JobRepository
+from .service import JobService
+from .worker import JobWorker
+
+from dependency_injector import containers, providers
+
+
+class JobContainer(containers.DeclarativeContainer):
+    # Dependencies injected from parent container
+    config = providers.Configuration()
+    database = providers.Dependency()
+    retrieval = providers.Dependency()
+    transcribe = providers.Dependency()
+
+    # Repositories
+    repository = providers.Factory(
+        JobRepository,
+        database=database.provided,
+    )
+
+    video_repository = providers.Factory(
+        VideoRepository,
+        database=database.provided,
+    )
+
+    transcription_repository = providers.Factory(
+        TranscriptionRepository,
+        database=database.provided,
+    )
+
+    # One worker per process owns the stage queues
+    worker = providers.Singleton(
+        JobWorker,
+        repository=repository,
+        video_repository=video_repository,
+        transcription_repository=transcription_repository,
+        retrieval=retrieval,
+        transcribe=transcribe.provider,
+        config=config.concurrency,
+        captions=config.captions,
+    )
+
+    # Service
+    service = providers.Factory(
+        JobService,
+        repository=repository,
+        worker=worker,
+    )
+
+    wiring_config = containers.WiringConfiguration(
+        modules=[".api"],
+    )
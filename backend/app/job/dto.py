@@ -0,0 +1,87 @@
+from ..shared.supported import Language
+from .model import JobStage, JobStatus
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Job:
+    """Represents a transcription job running in the background."""
+
+    instance_id: int = field(
+        metadata={"description": "Unique job record ID.", "example": 1}
+    )
+    video_instance_id: int = field(
+        metadata={"description": "Video instance ID to transcribe.", "example": 1}
+    )
+    status: JobStatus = field(
+        metadata={"description": "Current status of the job.", "example": "queued"}
+    )
+    stage: JobStage = field(
+        metadata={
+            "description": "Pipeline stage the job reached.",
+            "example": "download",
+        }
+    )
+    language: Language | None = field(
+        default=None,
+        metadata={
+            "description": "Requested language, detected if empty.",
+            "example": "ko",
+        },
+    )
+    prompt: str | None = field(
+        default=None,
+        metadata={"description": "Prompt guiding the transcription.", "example": None},
+    )
+    error: str | None = field(
+        default=None,
+        metadata={"description": "Error message of a failed job.", "example": None},
+    )
+    caption_score: float | None = field(
+        default=None,
+        metadata={
+            "description": "Quality of the platform captions, used if high enough.",
+            "example": 0.9,
+        },
+    )
+    separation_skipped: bool | None = field(
+        default=None,
+        metadata={
+            "description": "Whether vocal separation was found unnecessary.",
+            "example": False,
+        },
+    )
+    separation_reason: str | None = field(
+        default=None,
+        metadata={
+            "description": "Why separation was run or skipped.",
+            "example": "bass",
+        },
+    )
+    transcription_instance_id: int | None = field(
+        default=None,
+        metadata={
+            "description": "Transcription created by a completed job.",
+            "example": 1,
+        },
+    )
+
+
+@dataclass(frozen=True)
+class CreateJob:
+    """Request schema for enqueueing a new transcription job."""
+
+    video_instance_id: int = field(
+        metadata={"description": "Video instance ID to transcribe.", "example": 1}
+    )
+    language: Language | None = field(
+        default=None,
+        metadata={
+            "description": "Requested language, detected if empty.",
+            "example": "ko",
+        },
+    )
+    prompt: str | None = field(
+        default=None,
+        metadata={"description": "Prompt guiding the transcription.", "example": None},
+    )
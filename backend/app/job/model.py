@@ -0,0 +1,50 @@
+from ..database import AIOSqliteBase
+from ..shared.supported import Language
+
+from enum import Enum
+from sqlalchemy.sql.schema import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class JobStage(str, Enum):
+    captions = "captions"
+    download = "download"
+    separation = "separation"
+    transcription = "transcription"
+
+
+class Job(AIOSqliteBase):
+    __tablename__ = "jobs"
+
+    instance_id: Mapped[int] = mapped_column(
+        primary_key=True, autoincrement=True, init=False
+    )
+    video_instance_id: Mapped[int] = mapped_column(
+        ForeignKey("videos.instance_id"),
+    )
+    language: Mapped[Language | None] = mapped_column(default=None)
+    prompt: Mapped[str | None] = mapped_column(default=None)
+    status: Mapped[JobStatus] = mapped_column(default=JobStatus.queued)
+    stage: Mapped[JobStage] = mapped_column(default=JobStage.download)
+    error: Mapped[str | None] = mapped_column(default=None)
+    # Quality of the platform captions, None if there were none to score
+    caption_score: Mapped[float | None] = mapped_column(default=None)
+    # Outcome of the separation policy, None until the stage has run
+    separation_skipped: Mapped[bool | None] = mapped_column(default=None)
+    separation_reason: Mapped[str | None] = mapped_column(default=None)
+    transcription_instance_id: Mapped[int | None] = mapped_column(
+        ForeignKey("transcriptions.instance_id"), default=None
+    )
+
+    def __repr__(self):
+        return (
+            f"<Job instance_id={self.instance_id} status={self.status.value} "
+            f"stage={self.stage.value} video_instance_id={self.video_instance_id}>"
+        )
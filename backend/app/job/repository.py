@@ -0,0 +1,115 @@
+from ..database.async_sqlalchemy import AsyncSQLAlchemy
+from ..shared.exception import UnknownError
+from .model import Job as JobModel, JobStage, JobStatus
+from .dto import Job as JobDTO, CreateJob
+from .exception import NotFoundThing, NotFoundThingError
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import Select
+
+
+class JobRepository:
+    def __init__(self, database: AsyncSQLAlchemy):
+        """Initialize JobRepository with database connection.
+
+        Args:
+            database: AsyncSQLAlchemy database instance.
+        """
+        self._session_factory = database.session
+        self._read_session_factory = database.read_session
+
+    async def create_job(self, dto: CreateJob) -> JobDTO:
+        async with self._session_factory() as session:
+            model = JobModel(
+                video_instance_id=dto.video_instance_id,
+                language=dto.language,
+                prompt=dto.prompt,
+            )
+            session.add(model)
+            try:
+                await session.commit()
+            except IntegrityError as e:
+                error_message = str(e.orig)
+                # Check if it's a foreign key constraint failure
+                if "FOREIGN KEY constraint failed" in error_message:
+                    raise NotFoundThingError(NotFoundThing.VideoInstance) from e
+                raise UnknownError(e) from e
+            except Exception as e:
+                raise UnknownError(e) from e
+            return JobDTO(**model.to_dict())
+
+    async def get_job_by_instance_id(self, instance_id: int) -> JobDTO | None:
+        async with self._read_session_factory() as session:
+            model = await session.get(JobModel, instance_id)
+            if model is None:
+                return None
+            return JobDTO(**model.to_dict())
+
+    async def update_job(
+        self,
+        instance_id: int,
+        status: JobStatus | None = None,
+        stage: JobStage | None = None,
+        error: str | None = None,
+        transcription_instance_id: int | None = None,
+        caption_score: float | None = None,
+        separation_skipped: bool | None = None,
+        separation_reason: str | None = None,
+    ) -> JobDTO:
+        """Move a job forward in the pipeline.
+
+        Args:
+            instance_id: The job to update.
+            status: New status, unchanged if None.
+            stage: New stage, unchanged if None.
+            error: Error message to record, unchanged if None.
+            transcription_instance_id: Created transcription, unchanged if None.
+            caption_score: Quality of the platform captions, unchanged if None.
+            separation_skipped: Separation policy outcome, unchanged if None.
+            separation_reason: Separation policy reason, unchanged if None.
+
+        Returns:
+            The updated job.
+
+        Raises:
+            NotFoundThingError: If the job does not exist.
+        """
+        async with self._session_factory() as session:
+            model = await session.get(JobModel, instance_id)
+            if model is None:
+                raise NotFoundThingError(NotFoundThing.JobInstance)
+
+            if status is not None:
+                model.status = status
+            if stage is not None:
+                model.stage = stage
+            if error is not None:
+                model.error = error
+            if transcription_instance_id is not None:
+                model.transcription_instance_id = transcription_instance_id
+            if caption_score is not None:
+                model.caption_score = caption_score
+            if separation_skipped is not None:
+                model.separation_skipped = separation_skipped
+            if separation_reason is not None:
+                model.separation_reason = separation_reason
+
+            try:
+                await session.commit()
+            except Exception as e:
+                raise UnknownError(e) from e
+            return JobDTO(**model.to_dict())
+
+    async def get_unfinished_jobs(self) -> list[JobDTO]:
+        """Get queued and running jobs, oldest first.
+
+        Returns:
+            Jobs that have neither completed nor failed.
+        """
+        async with self._read_session_factory() as session:
+            result = await session.execute(
+                Select(JobModel)
+                .where(JobModel.status.in_([JobStatus.queued, JobStatus.running]))
+                .order_by(JobModel.instance_id)
+            )
+            return [JobDTO(**model.to_dict()) for model in result.scalars()]
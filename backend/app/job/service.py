@@ -0,0 +1,23 @@
+from .dto import CreateJob, Job
+from .repository import JobRepository
+from .worker import JobWorker
+
+
+class JobService:
+    def __init__(self, repository: JobRepository, worker: JobWorker):
+        """Initialize JobService with repository and worker dependencies.
+
+        Args:
+            repository: JobRepository instance for data access.
+            worker: JobWorker running the enqueued jobs.
+        """
+        self._repository = repository
+        self._worker = worker
+
+    async def create_job(self, dto: CreateJob) -> Job:
+        job = await self._repository.create_job(dto)
+        self._worker.enqueue(job)
+        return job
+
+    async def get_job_by_instance_id(self, instance_id: int) -> Job | None:
+        return await self._repository.get_job_by_instance_id(instance_id)
@@ -0,0 +1,83 @@
+from ..database import AIOSqlite
+from ..shared.supported import Language, Platform
+from .container import JobContainer
+from .api import router
+
+import asyncio
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
+from unittest.mock import MagicMock
+
+database = AIOSqlite(relative_path=":memory:")
+container = JobContainer(
+    database=database, retrieval=MagicMock(), transcribe=MagicMock()
+)
+container.init_resources()
+asyncio.run(database.create_database())
+
+app = FastAPI()
+app.include_router(router)
+
+
+@pytest_asyncio.fixture
+async def client():
+    await database.reset_database()
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest_asyncio.fixture
+async def video_id():
+    """Create a test video in the database to use for foreign key constraints"""
+    from ..video.model import Video
+
+    async with database.session() as session:
+        video = Video(
+            platform=Platform.youtube,
+            video_id="testestest",
+            channel_id="channel123",
+            channel_name="Test Channel",
+            title="Test Video",
+            duration_seconds=100,
+            thumbnail_url="http://example.com/thumbnail.jpg",
+        )
+        session.add(video)
+        await session.commit()
+        return video.instance_id
+
+
+@pytest.mark.asyncio
+async def test_create_job_success(client: AsyncClient, video_id: int):
+    response = await client.post(
+        "/job/",
+        json={"video_instance_id": video_id, "language": Language.korean.value},
+    )
+    assert response.status_code == 202
+    response_data = response.json()
+    assert response_data["instance_id"] >= 1
+    assert response_data["status"] == "queued"
+    assert response_data["stage"] == "download"
+    assert response_data["language"] == Language.korean.value
+
+
+@pytest.mark.asyncio
+async def test_create_job_video_not_found(client: AsyncClient):
+    response = await client.post("/job/", json={"video_instance_id": 9999})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_job_by_instance_id(client: AsyncClient, video_id: int):
+    created = await client.post("/job/", json={"video_instance_id": video_id})
+    instance_id = created.json()["instance_id"]
+
+    response = await client.get(f"/job/{instance_id}")
+    assert response.status_code == 200
+    assert response.json() == created.json()
+
+
+@pytest.mark.asyncio
+async def test_get_job_by_instance_id_not_found(client: AsyncClient):
+    response = await client.get("/job/9999")
+    assert response.status_code == 404
@@ -0,0 +1,94 @@
+from ..shared.data import SubtitleExtension, Transcription
+from ..shared.supported import Language
+from ..video_retrieval.type import Captions
+from .captions import CaptionScorer
+
+import pytest
+
+
+def _captions(
+    content: str, generated: bool = False, language: Language | None = Language.english
+) -> Captions:
+    return Captions(
+        transcription=Transcription(
+            content=content, extension=SubtitleExtension.VTT, language=language
+        ),
+        generated=generated,
+    )
+
+
+LYRICS = (
+    "WEBVTT\n\n"
+    "00:00:00.000 --> 00:00:30.000\nfirst verse\n\n"
+    "00:00:30.000 --> 00:01:00.000\nchorus\n"
+)
+
+
+def test_caption_scorer_accepts_uploaded_captions():
+    scorer = CaptionScorer()
+
+    quality = scorer.score(_captions(LYRICS), 100, Language.english)
+
+    assert quality.source == 1.0
+    assert quality.coverage == 1.0
+    assert quality.score == 1.0
+    assert scorer.accepts(quality)
+
+
+def test_caption_scorer_weights_generated_captions():
+    scorer = CaptionScorer({"generated_weight": 0.5})
+
+    quality = scorer.score(_captions(LYRICS, generated=True), 100, Language.english)
+
+    assert quality.score == pytest.approx(0.5)
+    assert not scorer.accepts(quality)
+
+
+def test_caption_scorer_measures_coverage():
+    scorer = CaptionScorer({"full_coverage": 0.5})
+    # Overlapping cues count once, 0..40 of 200 seconds
+    content = (
+        "WEBVTT\n\n"
+        "00:00:00.000 --> 00:00:30.000\nverse\n\n"
+        "00:00:20.000 --> 00:00:40.000\nverse again\n"
+    )
+
+    quality = scorer.score(_captions(content), 200)
+
+    assert quality.coverage == pytest.approx(40 / 200 / 0.5)
+
+
+def test_caption_scorer_ignores_non_lyric_cues():
+    scorer = CaptionScorer()
+    content = (
+        "WEBVTT\n\n"
+        "00:00:00.000 --> 00:01:00.000\n[Music]\n\n"
+        "00:01:00.000 --> 00:01:30.000\n♪ ♪\n"
+    )
+
+    quality = scorer.score(_captions(content), 90)
+
+    assert quality.coverage == 0.0
+    assert quality.score == 0.0
+
+
+def test_caption_scorer_rejects_other_language():
+    scorer = CaptionScorer()
+
+    quality = scorer.score(_captions(LYRICS), 100, Language.japanese)
+
+    assert quality.language == 0.0
+    assert not scorer.accepts(quality)
+
+
+def test_caption_scorer_weights_unknown_language():
+    scorer = CaptionScorer({"unknown_language_weight": 0.5})
+
+    quality = scorer.score(_captions(LYRICS, language=None), 100)
+
+    assert quality.score == pytest.approx(0.5)
+
+
+def test_caption_scorer_validates_full_coverage():
+    with pytest.raises(ValueError):
+        CaptionScorer({"full_coverage": 0})
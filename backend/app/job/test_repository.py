@@ -0,0 +1,112 @@
+from ..database import AIOSqlite
+from ..shared.supported import Language, Platform
+from ..video.model import Video
+from .repository import JobRepository
+from .dto import CreateJob, Job
+from .exception import NotFoundThing, NotFoundThingError
+from .model import JobStage, JobStatus
+
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def database() -> AIOSqlite:
+    database = AIOSqlite(relative_path=":memory:")
+    await database.reset_database()
+    async with database.session() as session:
+        session.add(
+            Video(
+                platform=Platform.youtube,
+                video_id="testestest",
+                channel_id="channel123",
+                channel_name="Test Channel",
+                title="Test Video",
+                duration_seconds=100,
+                thumbnail_url="http://example.com/thumbnail.jpg",
+            )
+        )
+    return database
+
+
+@pytest_asyncio.fixture
+async def job_repository(database: AIOSqlite) -> JobRepository:
+    return JobRepository(database=database)
+
+
+@pytest_asyncio.fixture
+async def normal_job(job_repository: JobRepository) -> Job:
+    return await job_repository.create_job(
+        CreateJob(video_instance_id=1, language=Language.korean, prompt="lyrics")
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_repository_create_job(normal_job: Job):
+    assert normal_job.instance_id == 1
+    assert normal_job.status == JobStatus.queued
+    assert normal_job.stage == JobStage.download
+    assert normal_job.language == Language.korean
+    assert normal_job.prompt == "lyrics"
+    assert normal_job.transcription_instance_id is None
+
+
+@pytest.mark.asyncio
+async def test_job_repository_create_job_with_invalid_video(
+    job_repository: JobRepository,
+):
+    with pytest.raises(NotFoundThingError) as not_found_exception:
+        await job_repository.create_job(CreateJob(video_instance_id=9999))
+
+    assert not_found_exception.value.thing == NotFoundThing.VideoInstance
+
+
+@pytest.mark.asyncio
+async def test_job_repository_get_job_by_instance_id(
+    normal_job: Job, job_repository: JobRepository
+):
+    job = await job_repository.get_job_by_instance_id(normal_job.instance_id)
+    assert job == normal_job
+    assert await job_repository.get_job_by_instance_id(9999) is None
+
+
+@pytest.mark.asyncio
+async def test_job_repository_update_job(
+    normal_job: Job, job_repository: JobRepository
+):
+    job = await job_repository.update_job(
+        normal_job.instance_id, status=JobStatus.running, stage=JobStage.separation
+    )
+    assert job.status == JobStatus.running
+    assert job.stage == JobStage.separation
+
+    job = await job_repository.update_job(
+        normal_job.instance_id, status=JobStatus.failed, error="boom"
+    )
+    assert job.stage == JobStage.separation
+    assert job.error == "boom"
+
+
+@pytest.mark.asyncio
+async def test_job_repository_update_job_not_found(job_repository: JobRepository):
+    with pytest.raises(NotFoundThingError) as not_found_exception:
+        await job_repository.update_job(9999, status=JobStatus.running)
+
+    assert not_found_exception.value.thing == NotFoundThing.JobInstance
+
+
+@pytest.mark.asyncio
+async def test_job_repository_get_unfinished_jobs(job_repository: JobRepository):
+    jobs = [
+        await job_repository.create_job(CreateJob(video_instance_id=1))
+        for _ in range(4)
+    ]
+    await job_repository.update_job(jobs[0].instance_id, status=JobStatus.completed)
+    await job_repository.update_job(jobs[1].instance_id, status=JobStatus.failed)
+    await job_repository.update_job(jobs[2].instance_id, status=JobStatus.running)
+
+    unfinished = await job_repository.get_unfinished_jobs()
+    assert [job.instance_id for job in unfinished] == [
+        jobs[2].instance_id,
+        jobs[3].instance_id,
+    ]
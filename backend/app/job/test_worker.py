@@ -0,0 +1,400 @@
+from ..database import AIOSqlite
+from ..shared.data import (
+    Audio,
+    AudioExtension,
+    AudioStream,
+    SubtitleExtension,
+    Transcription,
+)
+from ..shared.supported import Language, Platform
+from ..stt.process import Separation, Transcribe
+from ..stt.separation_policy import SeparationDecision
+from ..transcription.repository import TranscriptionRepository
+from ..video.model import Video
+from ..video.repository import VideoRepository
+from ..video_retrieval.exception import SubtitleNotFoundError
+from ..video_retrieval.type import Captions
+from .dto import CreateJob
+from .model import JobStage, JobStatus
+from .repository import JobRepository
+from .worker import JobWorker
+
+import asyncio
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+VOCALS = Audio(binary=b"vocals", extension=AudioExtension.OGG)
+ORIGINAL = Audio(binary=b"original", extension=AudioExtension.AAC)
+NORMALIZED = Audio(binary=b"normalized", extension=AudioExtension.OPUS)
+
+
+@pytest_asyncio.fixture
+async def database() -> AIOSqlite:
+    database = AIOSqlite(relative_path=":memory:")
+    await database.reset_database()
+    await _add_video(database)
+    return database
+
+
+@pytest_asyncio.fixture
+async def file_database(tmp_path) -> AIOSqlite:
+    # Every session gets its own connection, so concurrent stages cannot
+    # interleave their transactions the way they do on the shared :memory:
+    database = AIOSqlite(relative_path=str(tmp_path / "main.db"))
+    await database.create_database()
+    await _add_video(database)
+    return database
+
+
+async def _add_video(database: AIOSqlite) -> None:
+    async with database.session() as session:
+        session.add(
+            Video(
+                platform=Platform.youtube,
+                video_id="testestest",
+                channel_id="channel123",
+                channel_name="Test Channel",
+                title="Test Video",
+                duration_seconds=100,
+                thumbnail_url="http://example.com/thumbnail.jpg",
+            )
+        )
+
+
+@pytest.fixture
+def retrieval() -> MagicMock:
+    retrieval = MagicMock()
+    retrieval.stream_audio_of_video = AsyncMock(
+        side_effect=lambda _: AudioStream.from_audio(ORIGINAL)
+    )
+    return retrieval
+
+
+@pytest.fixture
+def transcribe() -> MagicMock:
+    transcribe = MagicMock(spec=Transcribe)
+    transcribe.normalize = AsyncMock(return_value=NORMALIZED)
+    transcribe.remove_background = AsyncMock(return_value=VOCALS)
+
+    async def _separate(audio: Audio) -> Separation:
+        vocals = await transcribe.remove_background(audio)
+        return Separation(vocals, SeparationDecision(separate=True, reason="bass"))
+
+    transcribe.separate = AsyncMock(side_effect=_separate)
+    transcribe.transcribe = AsyncMock(
+        return_value=Transcription(
+            content="WEBVTT\n",
+            extension=SubtitleExtension.VTT,
+            language=Language.japanese,
+        )
+    )
+    return transcribe
+
+
+def _worker(
+    database: AIOSqlite,
+    retrieval: MagicMock,
+    transcribe: MagicMock,
+    captions: dict | None = None,
+    **config,
+) -> JobWorker:
+    return JobWorker(
+        repository=JobRepository(database),
+        video_repository=VideoRepository(database),
+        transcription_repository=TranscriptionRepository(database),
+        retrieval=retrieval,
+        transcribe=lambda: transcribe,
+        config=config,
+        captions=captions,
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_worker_runs_pipeline(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    worker = _worker(database, retrieval, transcribe)
+    repository = JobRepository(database)
+    job = await repository.create_job(CreateJob(video_instance_id=1, prompt="song"))
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    retrieval.stream_audio_of_video.assert_called_once_with(
+        "https://www.youtube.com/watch?v=testestest"
+    )
+    transcribe.normalize.assert_awaited_once()
+    stream = transcribe.normalize.await_args.args[0]
+    assert isinstance(stream, AudioStream)
+    assert stream.extension == ORIGINAL.extension
+    transcribe.remove_background.assert_awaited_once_with(NORMALIZED)
+    transcribe.transcribe.assert_awaited_once_with(VOCALS, None, "song", 100)
+
+    finished = await repository.get_job_by_instance_id(job.instance_id)
+    assert finished is not None
+    assert finished.status == JobStatus.completed
+    assert finished.stage == JobStage.transcription
+    assert finished.transcription_instance_id == 1
+    assert finished.separation_skipped is False
+    assert finished.separation_reason == "bass"
+
+    transcription = await TranscriptionRepository(
+        database
+    ).get_transcription_by_instance_id(1)
+    assert transcription is not None
+    assert transcription.language == Language.japanese
+    assert transcription.video_instance_id == 1
+
+
+@pytest.mark.asyncio
+async def test_job_worker_reads_download_without_normalizer(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    # Without a normalizer the stream comes back untouched
+    transcribe.normalize = AsyncMock(side_effect=lambda audio: audio)
+    worker = _worker(database, retrieval, transcribe)
+    job = await JobRepository(database).create_job(CreateJob(video_instance_id=1))
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    transcribe.remove_background.assert_awaited_once_with(ORIGINAL)
+
+
+@pytest.mark.asyncio
+async def test_job_worker_records_failure(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    transcribe.remove_background = AsyncMock(side_effect=RuntimeError("uvr down"))
+    worker = _worker(database, retrieval, transcribe)
+    repository = JobRepository(database)
+    job = await repository.create_job(CreateJob(video_instance_id=1))
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    failed = await repository.get_job_by_instance_id(job.instance_id)
+    assert failed is not None
+    assert failed.status == JobStatus.failed
+    assert failed.stage == JobStage.separation
+    assert failed.error == "uvr down"
+    transcribe.transcribe.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_job_worker_fails_without_language(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    transcribe.transcribe = AsyncMock(
+        return_value=Transcription(content="WEBVTT\n", extension=SubtitleExtension.VTT)
+    )
+    worker = _worker(database, retrieval, transcribe)
+    repository = JobRepository(database)
+    job = await repository.create_job(CreateJob(video_instance_id=1))
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    failed = await repository.get_job_by_instance_id(job.instance_id)
+    assert failed is not None
+    assert failed.status == JobStatus.failed
+    assert failed.transcription_instance_id is None
+
+
+@pytest.mark.asyncio
+async def test_job_worker_requeues_unfinished_jobs_on_start(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    repository = JobRepository(database)
+    job = await repository.create_job(CreateJob(video_instance_id=1))
+    await repository.update_job(
+        job.instance_id, status=JobStatus.running, stage=JobStage.separation
+    )
+    worker = _worker(database, retrieval, transcribe)
+
+    await worker.start()
+    await worker.join()
+    await worker.stop()
+
+    finished = await repository.get_job_by_instance_id(job.instance_id)
+    assert finished is not None
+    assert finished.status == JobStatus.completed
+    retrieval.stream_audio_of_video.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_job_worker_limits_stage_concurrency(
+    file_database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    running = 0
+    peak = 0
+    slots_full = asyncio.Event()
+
+    async def _remove_background(audio: Audio) -> Audio:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        if running == 2:
+            slots_full.set()
+        # Held until both slots are taken, so the peak does not depend on timing
+        await slots_full.wait()
+        await asyncio.sleep(0.01)
+        running -= 1
+        return VOCALS
+
+    transcribe.remove_background = AsyncMock(side_effect=_remove_background)
+    worker = _worker(
+        file_database,
+        retrieval,
+        transcribe,
+        download_concurrency=4,
+        separation_concurrency=2,
+    )
+    repository = JobRepository(file_database)
+
+    await worker.start()
+    for _ in range(6):
+        worker.enqueue(await repository.create_job(CreateJob(video_instance_id=1)))
+    await worker.join()
+    await worker.stop()
+
+    assert peak == 2
+    assert transcribe.transcribe.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_job_worker_records_skipped_separation(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    transcribe.separate = AsyncMock(
+        return_value=Separation(
+            ORIGINAL, SeparationDecision(separate=False, reason="clean_vocals")
+        )
+    )
+    worker = _worker(database, retrieval, transcribe)
+    repository = JobRepository(database)
+    job = await repository.create_job(CreateJob(video_instance_id=1))
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    transcribe.transcribe.assert_awaited_once_with(ORIGINAL, None, None, 100)
+    finished = await repository.get_job_by_instance_id(job.instance_id)
+    assert finished is not None
+    assert finished.separation_skipped is True
+    assert finished.separation_reason == "clean_vocals"
+
+
+def test_job_worker_rejects_invalid_concurrency(
+    retrieval: MagicMock, transcribe: MagicMock
+):
+    with pytest.raises(ValueError):
+        _worker(MagicMock(), retrieval, transcribe, separation_concurrency=0)
+
+
+def _captions(generated: bool, end_seconds: float) -> Captions:
+    return Captions(
+        transcription=Transcription(
+            content=f"WEBVTT\n\n00:00:00.000 --> {end_seconds:06.3f}\nlyrics\n",
+            extension=SubtitleExtension.VTT,
+            language=Language.japanese,
+        ),
+        generated=generated,
+    )
+
+
+@pytest.mark.asyncio
+async def test_job_worker_finishes_with_platform_captions(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    captions = _captions(generated=False, end_seconds=80)
+    retrieval.retrieval_captions_of_video = AsyncMock(return_value=captions)
+    worker = _worker(database, retrieval, transcribe, captions={})
+    repository = JobRepository(database)
+    job = await repository.create_job(
+        CreateJob(video_instance_id=1, language=Language.japanese)
+    )
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    retrieval.retrieval_captions_of_video.assert_awaited_once_with(
+        "https://www.youtube.com/watch?v=testestest", Language.japanese
+    )
+    retrieval.stream_audio_of_video.assert_not_called()
+    transcribe.separate.assert_not_awaited()
+    transcribe.transcribe.assert_not_awaited()
+
+    finished = await repository.get_job_by_instance_id(job.instance_id)
+    assert finished is not None
+    assert finished.status == JobStatus.completed
+    assert finished.stage == JobStage.captions
+    assert finished.caption_score == pytest.approx(1.0)
+    assert finished.transcription_instance_id == 1
+
+    transcription = await TranscriptionRepository(
+        database
+    ).get_transcription_by_instance_id(1)
+    assert transcription is not None
+    assert transcription.content == captions.transcription.content
+
+
+@pytest.mark.asyncio
+async def test_job_worker_transcribes_when_captions_score_low(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    # Generated captions covering a fifth of the video
+    retrieval.retrieval_captions_of_video = AsyncMock(
+        return_value=_captions(generated=True, end_seconds=20)
+    )
+    worker = _worker(database, retrieval, transcribe, captions={})
+    repository = JobRepository(database)
+    job = await repository.create_job(CreateJob(video_instance_id=1))
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    transcribe.transcribe.assert_awaited_once()
+    finished = await repository.get_job_by_instance_id(job.instance_id)
+    assert finished is not None
+    assert finished.status == JobStatus.completed
+    assert finished.stage == JobStage.transcription
+    assert finished.caption_score == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+async def test_job_worker_transcribes_without_captions(
+    database: AIOSqlite, retrieval: MagicMock, transcribe: MagicMock
+):
+    retrieval.retrieval_captions_of_video = AsyncMock(
+        side_effect=SubtitleNotFoundError("none")
+    )
+    worker = _worker(database, retrieval, transcribe, captions={})
+    repository = JobRepository(database)
+    job = await repository.create_job(CreateJob(video_instance_id=1))
+
+    await worker.start()
+    worker.enqueue(job)
+    await worker.join()
+    await worker.stop()
+
+    transcribe.transcribe.assert_awaited_once()
+    finished = await repository.get_job_by_instance_id(job.instance_id)
+    assert finished is not None
+    assert finished.status == JobStatus.completed
+    assert finished.caption_score is None
@@ -0,0 +1,311 @@
+from ..shared.data import Audio, AudioStream, Transcription
+from ..shared.exception import UnsupportedPlatformError
+from ..shared.supported import Platform
+from ..stt.process import Transcribe
+from ..transcription.dto import CreateTranscription
+from ..transcription.repository import TranscriptionRepository
+from ..video.dto import Video
+from ..video.repository import VideoRepository
+from ..video_retrieval.exception import SubtitleNotFoundError
+from ..video_retrieval.retrieval import VideoRetrieval
+from .captions import CaptionScorer
+from .dto import Job
+from .exception import NotFoundThing, NotFoundThingError
+from .model import JobStage, JobStatus
+from .repository import JobRepository
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+_StageItem = tuple[Job, Audio | None]
+
+
+class _StageOutcome(Enum):
+    # Returned by a handler that completed the job before the last stage
+    finished = "finished"
+
+
+@dataclass(frozen=True)
+class JobWorkerConfig:
+    captions_concurrency: int = field(default=2)
+    download_concurrency: int = field(default=2)
+    separation_concurrency: int = field(default=1)
+    transcription_concurrency: int = field(default=2)
+
+
+class JobWorker:
+    """Runs transcription jobs through captions, download, separation and STT.
+
+    Every stage has its own pool of asyncio tasks pulling from a queue, so a
+    slow separation backend does not stop downloads or transcriptions of other
+    jobs. The queues in front of separation and transcription are bounded by
+    the concurrency of their stage, which keeps at most a few decoded tracks
+    in memory when an upstream stage is faster than a downstream one.
+
+    The captions stage looks for captions uploaded to the platform first. If
+    they score high enough the job is completed with them and never reaches
+    the download, so a whole separation and transcription is saved.
+    """
+
+    def __init__(
+        self,
+        repository: JobRepository,
+        video_repository: VideoRepository,
+        transcription_repository: TranscriptionRepository,
+        retrieval: VideoRetrieval,
+        transcribe: Callable[[], Transcribe],
+        config: dict | None = None,
+        captions: dict | None = None,
+    ):
+        """Initialize JobWorker with its collaborators.
+
+        Args:
+            repository: JobRepository storing job progress.
+            video_repository: VideoRepository resolving the job's video.
+            transcription_repository: TranscriptionRepository storing results.
+            retrieval: VideoRetrieval downloading the audio of videos.
+            transcribe: Callable returning the Transcribe process. It is only
+                called once a job reaches separation, so the STT backends are
+                not required to enqueue jobs.
+            config: Dictionary containing captions_concurrency,
+                download_concurrency, separation_concurrency and
+                transcription_concurrency.
+            captions: Dictionary configuring the CaptionScorer, platform
+                captions are never used if None.
+
+        Raises:
+            ValueError: If a concurrency is not a positive integer.
+        """
+        self._config = JobWorkerConfig(**(config or {}))
+        for stage, concurrency in self._concurrency.items():
+            if concurrency < 1:
+                raise ValueError(f"{stage.value} concurrency must be positive.")
+
+        self._repository = repository
+        self._video_repository = video_repository
+        self._transcription_repository = transcription_repository
+        self._retrieval = retrieval
+        self._transcribe = transcribe
+        self._caption_scorer = CaptionScorer(captions) if captions is not None else None
+
+        self._queues: dict[JobStage, asyncio.Queue[_StageItem]] = {
+            JobStage.captions: asyncio.Queue(),
+            JobStage.download: asyncio.Queue(),
+            JobStage.separation: asyncio.Queue(
+                maxsize=self._config.separation_concurrency
+            ),
+            JobStage.transcription: asyncio.Queue(
+                maxsize=self._config.transcription_concurrency
+            ),
+        }
+        self._handlers: dict[
+            JobStage,
+            Callable[[Job, Audio | None], Awaitable[Audio | _StageOutcome | None]],
+        ] = {
+            JobStage.captions: self._try_captions,
+            JobStage.download: self._download,
+            JobStage.separation: self._separate,
+            JobStage.transcription: self._transcribe_and_save,
+        }
+        self._tasks: list[asyncio.Task[None]] = []
+        # Jobs somewhere in the pipeline, to avoid running one twice
+        self._in_pipeline: set[int] = set()
+
+    @property
+    def config(self) -> JobWorkerConfig:
+        return self._config
+
+    @property
+    def _concurrency(self) -> dict[JobStage, int]:
+        return {
+            JobStage.captions: self._config.captions_concurrency,
+            JobStage.download: self._config.download_concurrency,
+            JobStage.separation: self._config.separation_concurrency,
+            JobStage.transcription: self._config.transcription_concurrency,
+        }
+
+    async def start(self) -> None:
+        """Start the stage tasks and requeue jobs left over from a restart.
+
+        Audio is not persisted between stages, so interrupted jobs start over
+        from the first stage.
+        """
+        if self._tasks:
+            return
+
+        stages = list(JobStage)
+        for index, stage in enumerate(stages):
+            sink = self._queues[stages[index + 1]] if index + 1 < len(stages) else None
+            for _ in range(self._concurrency[stage]):
+                self._tasks.append(asyncio.create_task(self._run_stage(stage, sink)))
+
+        for job in await self._repository.get_unfinished_jobs():
+            self.enqueue(job)
+
+    async def stop(self) -> None:
+        """Cancel the stage tasks, leaving unfinished jobs for the next start."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Whatever was in flight is picked up from the database on next start
+        for queue in self._queues.values():
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+        self._in_pipeline.clear()
+
+    def enqueue(self, job: Job) -> None:
+        """Schedule a job for the first stage of the pipeline.
+
+        Jobs that are already in the pipeline are ignored.
+
+        Args:
+            job: The job to run.
+        """
+        if job.instance_id in self._in_pipeline:
+            return
+        self._in_pipeline.add(job.instance_id)
+        # Without a scorer the captions stage would only pass the job along
+        first = JobStage.captions if self._caption_scorer else JobStage.download
+        self._queues[first].put_nowait((job, None))
+
+    async def join(self) -> None:
+        """Wait until every enqueued job has left the pipeline."""
+        # Items move forward before they are marked done, so joining the
+        # queues in stage order cannot miss a job in flight
+        for stage in JobStage:
+            await self._queues[stage].join()
+
+    async def _run_stage(
+        self, stage: JobStage, sink: asyncio.Queue[_StageItem] | None
+    ) -> None:
+        source = self._queues[stage]
+        handler = self._handlers[stage]
+        while True:
+            job, audio = await source.get()
+            try:
+                await self._repository.update_job(
+                    job.instance_id, status=JobStatus.running, stage=stage
+                )
+                result = await handler(job, audio)
+                if result is _StageOutcome.finished:
+                    self._in_pipeline.discard(job.instance_id)
+                elif sink is not None:
+                    # Blocks while the next stage is saturated
+                    await sink.put((job, result))
+                else:
+                    self._in_pipeline.discard(job.instance_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Job {job.instance_id} failed at {stage.value}")
+                self._in_pipeline.discard(job.instance_id)
+                await self._fail(job, e)
+            finally:
+                source.task_done()
+
+    async def _fail(self, job: Job, error: Exception) -> None:
+        try:
+            await self._repository.update_job(
+                job.instance_id,
+                status=JobStatus.failed,
+                error=str(error) or repr(error),
+            )
+        except Exception:
+            logger.exception(f"Could not record the failure of job {job.instance_id}")
+
+    async def _get_video(self, job: Job) -> Video:
+        video = await self._video_repository.get_video_by_instance_id(
+            job.video_instance_id
+        )
+        if video is None:
+            raise NotFoundThingError(NotFoundThing.VideoInstance)
+        return video
+
+    async def _try_captions(self, job: Job, _: Audio | None) -> _StageOutcome | None:
+        assert self._caption_scorer is not None
+        video = await self._get_video(job)
+        try:
+            captions = await self._retrieval.retrieval_captions_of_video(
+                _video_url(video), job.language
+            )
+        except SubtitleNotFoundError:
+            return None
+        except Exception:
+            # Captions are an optimization, transcribing still works
+            logger.warning(
+                f"Could not fetch captions for job {job.instance_id}", exc_info=True
+            )
+            return None
+
+        quality = self._caption_scorer.score(
+            captions, video.duration_seconds, job.language
+        )
+        await self._repository.update_job(job.instance_id, caption_score=quality.score)
+        if not self._caption_scorer.accepts(quality):
+            return None
+
+        await self._save_transcription(job, captions.transcription)
+        return _StageOutcome.finished
+
+    async def _download(self, job: Job, _: Audio | None) -> Audio:
+        video = await self._get_video(job)
+        # Streamed into the normalizer, only the transcoded track is buffered
+        stream = await self._retrieval.stream_audio_of_video(_video_url(video))
+        # Transcoded once here, so no later stage has to convert it again
+        normalized = await self._transcribe().normalize(stream)
+        if isinstance(normalized, AudioStream):
+            # Without a normalizer the download is passed on as it is
+            return await normalized.read()
+        return normalized
+
+    async def _separate(self, job: Job, audio: Audio | None) -> Audio:
+        assert audio is not None
+        separation = await self._transcribe().separate(audio)
+        await self._repository.update_job(
+            job.instance_id,
+            separation_skipped=not separation.decision.separate,
+            separation_reason=separation.decision.reason,
+        )
+        return separation.audio
+
+    async def _transcribe_and_save(self, job: Job, audio: Audio | None) -> None:
+        assert audio is not None
+        # The duration lets short videos go to a faster STT backend
+        video = await self._get_video(job)
+        transcription = await self._transcribe().transcribe(
+            audio, job.language, job.prompt, video.duration_seconds
+        )
+        await self._save_transcription(job, transcription)
+
+    async def _save_transcription(self, job: Job, transcription: Transcription) -> None:
+        language = job.language or transcription.language
+        if language is None:
+            raise ValueError("The language of the transcription could not be detected.")
+
+        created = await self._transcription_repository.create_transcription(
+            CreateTranscription(
+                language=language,
+                content=transcription.content,
+                subtitle_extension=transcription.extension,
+                video_instance_id=job.video_instance_id,
+            )
+        )
+        await self._repository.update_job(
+            job.instance_id,
+            status=JobStatus.completed,
+            transcription_instance_id=created.instance_id,
+        )
+
+
+def _video_url(video: Video) -> str:
+    if video.platform != Platform.youtube:
+        raise UnsupportedPlatformError(video.platform.value)
+    return f"https://www.youtube.com/watch?v={video.video_id}"
@@ -1,6 +1,7 @@
 from .container import LyricContainer
 from .service import LyricService
-from ..shared.pagination import PaginatedResponse
+from ..shared.exception import InvalidCursorError
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 from .dto import AddLyric, Lyric
 
 from fastapi.routing import APIRouter
@@ -26,6 +27,38 @@ async def add_lyric(
         )
 
 
+# Declared before /{instance_id}, which would otherwise match "cursor"
+@router.get(
+    "/cursor",
+    response_model=CursorPaginatedResponse[Lyric],
+    responses={400: {"description": "Invalid cursor"}},
+)
+@inject
+async def get_lyrics_by_cursor(
+    after: str | None = Query(
+        None, description="Cursor of the page, next_cursor of the previous one"
+    ),
+    size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    video_instance_id: int | None = Query(
+        None, description="Filter by video instance ID"
+    ),
+    service: LyricService = Depends(Provide[LyricContainer.service]),
+) -> CursorPaginatedResponse[Lyric] | JSONResponse:
+    """Get a keyset paginated list of lyrics, in instance ID order.
+
+    - **after**: Opaque cursor, omitted for the first page
+    - **size**: Items per page (1-100, default 10)
+    - **video_instance_id**: Optional filter by video instance ID
+    """
+    try:
+        return await service.get_cursor_paginated_lyrics(after, size, video_instance_id)
+    except InvalidCursorError as e:
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+
 @router.get(
     "/{instance_id}",
     response_model=Lyric,
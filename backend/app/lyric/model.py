@@ -1,4 +1,4 @@
-from sqlalchemy.sql.schema import ForeignKey
+from sqlalchemy.sql.schema import ForeignKey, Index
 
 from ..database import AIOSqliteBase
 from ..shared.supported import Language
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
 
 class Lyric(AIOSqliteBase):
     __tablename__ = "lyrics"
+    # Lists filter by video and page by instance_id
+    __table_args__ = (
+        Index("ix_lyrics_video_instance_id", "video_instance_id", "instance_id"),
+    )
 
     instance_id: Mapped[int] = mapped_column(
         primary_key=True, autoincrement=True, init=False
@@ -2,7 +2,12 @@ from ..database.async_sqlalchemy import AsyncSQLAlchemy
 from ..shared.exception import UnknownError
 from .model import Lyric as LyricModel
 from .dto import Lyric as LyricDTO, AddLyric
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+)
 from .exception import NotFoundThing, NotFoundThingError
 
 from sqlalchemy.exc import IntegrityError
@@ -18,6 +23,7 @@ class LyricRepository:
             database: AsyncSQLAlchemy database instance.
         """
         self._session_factory = database.session
+        self._read_session_factory = database.read_session
 
     async def add_lyric(self, dto: AddLyric) -> LyricDTO:
         async with self._session_factory() as session:
@@ -40,7 +46,7 @@ class LyricRepository:
             return LyricDTO(**model.to_dict())
 
     async def get_lyric_by_instance_id(self, instance_id: int) -> LyricDTO | None:
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             model = await session.get(LyricModel, instance_id)
             if model is None:
                 return None
@@ -49,7 +55,7 @@ class LyricRepository:
     async def get_paginated_lyrics(
         self, page: int = 1, size: int = 10, video_instance_id: int | None = None
     ) -> PaginatedResponse[LyricDTO]:
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             # Calculate offset based on page and size
             offset = (page - 1) * size
 
@@ -78,3 +84,32 @@ class LyricRepository:
             items = [LyricDTO(**model.to_dict()) for model in result.scalars()]
 
             return PaginatedResponse(items=items, total=total, page=page, size=size)
+
+    async def get_cursor_paginated_lyrics(
+        self,
+        after: str | None = None,
+        size: int = 10,
+        video_instance_id: int | None = None,
+    ) -> CursorPaginatedResponse[LyricDTO]:
+        after_instance_id = decode_cursor(after) if after is not None else 0
+        async with self._read_session_factory() as session:
+            # Seek past the cursor, one extra row tells if another page follows
+            query = (
+                Select(LyricModel)
+                .where(LyricModel.instance_id > after_instance_id)
+                .order_by(LyricModel.instance_id)
+                .limit(size + 1)
+            )
+            if video_instance_id is not None:
+                query = query.where(LyricModel.video_instance_id == video_instance_id)
+            result = await session.execute(query)
+
+            models = list(result.scalars())
+            items = [LyricDTO(**model.to_dict()) for model in models[:size]]
+            next_cursor = (
+                encode_cursor(items[-1].instance_id) if len(models) > size else None
+            )
+
+            return CursorPaginatedResponse(
+                items=items, size=size, next_cursor=next_cursor
+            )
@@ -1,6 +1,6 @@
 from .dto import AddLyric, Lyric
 from .repository import LyricRepository
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 
 
 class LyricService:
@@ -24,3 +24,13 @@ class LyricService:
         return await self._lyric_repository.get_paginated_lyrics(
             page, size, video_instance_id
         )
+
+    async def get_cursor_paginated_lyrics(
+        self,
+        after: str | None = None,
+        size: int = 10,
+        video_instance_id: int | None = None,
+    ) -> CursorPaginatedResponse[Lyric]:
+        return await self._lyric_repository.get_cursor_paginated_lyrics(
+            after, size, video_instance_id
+        )
@@ -184,3 +184,38 @@ async def test_get_paginated_lyrics(client: AsyncClient):
     # Test with invalid parameters (should use defaults)
     response = await client.get("/lyric/?page=0&size=0")
     assert response.status_code == 422  # FastAPI validation error
+
+
+@pytest.mark.asyncio
+async def test_get_lyrics_by_cursor(client: AsyncClient):
+    for i in range(15):
+        data = AddLyric(
+            video_instance_id=1,
+            content=f"paginated lyric {i}",
+            language=Language.english,
+        )
+        await client.post("/lyric/", json={**data.__dict__})
+
+    response = await client.get("/lyric/cursor?size=10&video_instance_id=1")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["size"] == 10
+    assert len(data["items"]) == 10
+    assert data["next_cursor"] is not None
+
+    response = await client.get(
+        f"/lyric/cursor?size=10&video_instance_id=1&after={data['next_cursor']}"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["content"] for item in data["items"]] == [
+        f"paginated lyric {i}" for i in range(10, 15)
+    ]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_lyrics_by_invalid_cursor(client: AsyncClient):
+    response = await client.get("/lyric/cursor?after=invalid")
+    assert response.status_code == 400
+    assert "Invalid cursor" in response.json()["error"]
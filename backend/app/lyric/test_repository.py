@@ -1,4 +1,5 @@
 from ..database import AIOSqlite
+from ..shared.exception import InvalidCursorError
 from ..shared.supported import Language
 from ..video_retrieval.retrieval import VideoRetrieval
 from ..video_retrieval.type import VideoInfo
@@ -174,3 +175,54 @@ async def test_lyric_repository_get_paginated_lyrics(
     assert paginated.size == 10
     assert paginated.total == 16
     assert len(paginated.items) == 0
+
+
+@pytest.mark.asyncio
+async def test_lyric_repository_get_cursor_paginated_lyrics(
+    lyric_repository: LyricRepository, normal_lyric: Lyric
+):
+    for i in range(15):  # 16 lyrics with normal_lyric
+        await lyric_repository.add_lyric(
+            AddLyric(
+                language=Language.english,
+                content=f"Lyric content {i}",
+                video_instance_id=1,
+            )
+        )
+
+    instance_ids = []
+    cursor = None
+    for expected_size in (5, 5, 5, 1):
+        paginated = await lyric_repository.get_cursor_paginated_lyrics(
+            after=cursor, size=5, video_instance_id=1
+        )
+        assert paginated.size == 5
+        assert len(paginated.items) == expected_size
+        instance_ids += [lyric.instance_id for lyric in paginated.items]
+        cursor = paginated.next_cursor
+
+    assert cursor is None
+    assert instance_ids == list(range(1, 17))
+
+
+@pytest.mark.asyncio
+async def test_lyric_repository_get_cursor_paginated_lyrics_exact_last_page(
+    lyric_repository: LyricRepository, normal_lyric: Lyric
+):
+    paginated = await lyric_repository.get_cursor_paginated_lyrics(size=1)
+    assert len(paginated.items) == 1
+    assert paginated.next_cursor is None
+
+    paginated = await lyric_repository.get_cursor_paginated_lyrics(
+        video_instance_id=9999
+    )
+    assert paginated.items == []
+    assert paginated.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_lyric_repository_get_cursor_paginated_lyrics_invalid_cursor(
+    lyric_repository: LyricRepository,
+):
+    with pytest.raises(InvalidCursorError):
+        await lyric_repository.get_cursor_paginated_lyrics(after="invalid")
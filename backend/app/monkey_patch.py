@@ -0,0 +1,36 @@
+"""Monkey-patches the process for the gevent retrieval backend.
+
+Nothing but the standard library and PyYAML is imported here, so the patch can
+be applied before the application imports sockets, ssl or asyncio.
+"""
+
+import yaml
+
+
+def configured_backend(path: str = "config.yaml") -> str:
+    """Read the retrieval executor backend without importing the application.
+
+    Args:
+        path: The configuration file read by the application container.
+
+    Returns:
+        The configured backend, "thread" if none is set.
+    """
+    with open(path) as file:
+        config = yaml.safe_load(file) or {}
+    executor = (config.get("yt_dlp") or {}).get("executor") or {}
+    return executor.get("backend") or "thread"
+
+
+def patch() -> None:
+    """Patch the process for gevent and drive asyncio through its hub."""
+    import gevent.monkey
+
+    gevent.monkey.patch_all()
+
+    # Imported after patching, asyncio pulls in socket and ssl
+    import asyncio
+
+    import asyncio_gevent
+
+    asyncio.set_event_loop_policy(asyncio_gevent.EventLoopPolicy())
@@ -0,0 +1,101 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    # Calls pass through
+    closed = "closed"
+    # Calls are rejected until the recovery time has passed
+    open = "open"
+    # A single trial call decides whether to close or open again
+    half_open = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    # Consecutive failures that open the circuit
+    failure_threshold: int = field(default=5)
+    recovery_seconds: float = field(default=30.0)
+
+
+class CircuitBreaker:
+    """Stops sending calls to a dependency that keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    rejects calls for ``recovery_seconds``. It then lets one trial call
+    through: a success closes the circuit, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        config: dict | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize CircuitBreaker in the closed state.
+
+        Args:
+            config: Dictionary containing failure_threshold and
+                recovery_seconds.
+            clock: Returns the current time in seconds.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        self._config = CircuitBreakerConfig(**(config or {}))
+        if self._config.failure_threshold < 1:
+            raise ValueError("failure_threshold must be a positive integer.")
+        if self._config.recovery_seconds < 0:
+            raise ValueError("recovery_seconds must not be negative.")
+
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.closed
+        if self._clock() - self._opened_at < self._config.recovery_seconds:
+            return CircuitState.open
+        return CircuitState.half_open
+
+    @property
+    def available(self) -> bool:
+        """Whether a call would currently be allowed, without claiming it."""
+        state = self.state
+        if state == CircuitState.half_open:
+            return not self._trial_in_flight
+        return state == CircuitState.closed
+
+    def allow(self) -> bool:
+        """Claim permission for a call.
+
+        Returns:
+            True if the call may proceed. In the half-open state only the
+            first caller gets through, as the trial call.
+        """
+        if not self.available:
+            return False
+        if self.state == CircuitState.half_open:
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the limit is reached."""
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self._config.failure_threshold:
+            self._opened_at = self._clock()
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Forget an allowed call that ended without an outcome, e.g. cancelled."""
+        self._trial_in_flight = False
@@ -1,7 +1,14 @@
 from .supported import Language
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
+from tempfile import SpooledTemporaryFile
+
+# Size of the chunks moved between processes when audio is streamed
+AUDIO_CHUNK_SIZE = 64 * 1024
+# Streams spooled to a temporary file stay in memory up to this many bytes
+AUDIO_SPOOL_MAX_MEMORY_SIZE = 8 * 1024 * 1024
 
 
 class AudioExtension(Enum):
@@ -9,6 +16,10 @@ class AudioExtension(Enum):
     MP3 = "mp3"
     OGG = "ogg"
     WAV = "wav"
+    FLAC = "flac"
+    # Opus in an Ogg container, the name ffmpeg gives to its muxer
+    OPUS = "opus"
+    WEBM = "webm"
 
 
 class SubtitleExtension(str, Enum):
@@ -22,6 +33,74 @@ class Audio:
     extension: AudioExtension
 
 
+@dataclass(frozen=True)
+class AudioStream:
+    """Audio whose bytes arrive in chunks instead of being held in memory.
+
+    A stream can only be consumed once, either by iterating ``chunks`` or by
+    calling one of the helpers below.
+    """
+
+    chunks: AsyncIterator[bytes]
+    extension: AudioExtension
+
+    @classmethod
+    def from_audio(
+        cls, audio: Audio, chunk_size: int = AUDIO_CHUNK_SIZE
+    ) -> "AudioStream":
+        """Wrap in-memory audio so it can be fed to streaming consumers.
+
+        Args:
+            audio: The audio to stream.
+            chunk_size: Size of the yielded chunks in bytes.
+
+        Returns:
+            An AudioStream yielding views over the original binary.
+        """
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            view = memoryview(audio.binary)
+            for offset in range(0, len(view), chunk_size):
+                yield bytes(view[offset : offset + chunk_size])
+
+        return cls(chunks=_chunks(), extension=audio.extension)
+
+    async def read(self) -> Audio:
+        """Consume the whole stream into an in-memory Audio.
+
+        Returns:
+            The audio with all chunks joined.
+        """
+        buffer = bytearray()
+        async for chunk in self.chunks:
+            buffer += chunk
+        return Audio(binary=bytes(buffer), extension=self.extension)
+
+    async def spool(
+        self, max_memory_size: int = AUDIO_SPOOL_MAX_MEMORY_SIZE
+    ) -> SpooledTemporaryFile:
+        """Consume the stream into a spooled temporary file.
+
+        Small streams stay in memory; anything larger than ``max_memory_size``
+        rolls over to disk so peak memory stays bounded.
+
+        Args:
+            max_memory_size: Bytes kept in memory before rolling over to disk.
+
+        Returns:
+            The temporary file, rewound to the beginning. The caller closes it.
+        """
+        spooled = SpooledTemporaryFile(max_size=max_memory_size)  # noqa: SIM115
+        try:
+            async for chunk in self.chunks:
+                spooled.write(chunk)
+        except BaseException:
+            spooled.close()
+            raise
+        spooled.seek(0)
+        return spooled
+
+
 @dataclass(frozen=True)
 class Transcription:
     content: str
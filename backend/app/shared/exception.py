@@ -18,3 +18,14 @@ class UnknownError(Exception):
         """
         super().__init__(f"Unknown exception: {exception}")
         self.exception = exception
+
+
+class InvalidCursorError(ValueError):
+    def __init__(self, cursor: str):
+        """Initialize InvalidCursorError.
+
+        Args:
+            cursor: The cursor that could not be decoded.
+        """
+        super().__init__(f"Invalid cursor: {cursor}")
+        self.cursor = cursor
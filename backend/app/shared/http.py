@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
+
+
+@dataclass(frozen=True)
+class HTTPTransportConfig:
+    # Upper bound of open connections, in total and per host
+    limit: int = field(default=100)
+    limit_per_host: int = field(default=32)
+    # Idle connections are kept for reuse this long
+    keepalive_timeout: float = field(default=60.0)
+    ttl_dns_cache: int = field(default=300)
+    connect_timeout: float = field(default=10.0)
+    # Requests in flight per endpoint, overridable per endpoint URL
+    endpoint_concurrency: int = field(default=8)
+    endpoint_limits: dict[str, int] = field(default_factory=dict)
+
+
+class HTTPTransport:
+    """One pooled aiohttp session shared by every outbound API client.
+
+    Clients pass the base URL of their endpoint with every request; requests to
+    the same endpoint are limited by a semaphore so one busy backend cannot take
+    every pooled connection. Responses are released as soon as the request
+    context exits.
+    """
+
+    def __init__(self, config: dict | None = None):
+        """Initialize HTTPTransport with configuration.
+
+        The session is created by ``start`` or on the first request, since
+        aiohttp needs a running event loop.
+
+        Args:
+            config: Dictionary containing limit, limit_per_host,
+                keepalive_timeout, ttl_dns_cache, connect_timeout,
+                endpoint_concurrency and endpoint_limits.
+
+        Raises:
+            ValueError: If a connection or concurrency limit is not positive.
+        """
+        self._config = HTTPTransportConfig(**(config or {}))
+        limits = [
+            self._config.limit,
+            self._config.limit_per_host,
+            self._config.endpoint_concurrency,
+            *self._config.endpoint_limits.values(),
+        ]
+        if any(limit < 1 for limit in limits):
+            raise ValueError("Connection and concurrency limits must be positive.")
+
+        self._session: ClientSession | None = None
+        self._limiters: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def config(self) -> HTTPTransportConfig:
+        return self._config
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    async def start(self) -> None:
+        """Create the connection pool and session."""
+        if not self.closed:
+            return
+        connector = TCPConnector(
+            limit=self._config.limit,
+            limit_per_host=self._config.limit_per_host,
+            keepalive_timeout=self._config.keepalive_timeout,
+            ttl_dns_cache=self._config.ttl_dns_cache,
+        )
+        self._session = ClientSession(
+            connector=connector,
+            timeout=ClientTimeout(total=None, connect=self._config.connect_timeout),
+        )
+
+    async def close(self) -> None:
+        """Close the session and every pooled connection."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def limiter(self, endpoint: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting requests to an endpoint.
+
+        Args:
+            endpoint: Base URL of the endpoint.
+
+        Returns:
+            The semaphore shared by every request to the endpoint.
+        """
+        limiter = self._limiters.get(endpoint)
+        if limiter is None:
+            limiter = asyncio.Semaphore(
+                self._config.endpoint_limits.get(
+                    endpoint, self._config.endpoint_concurrency
+                )
+            )
+            self._limiters[endpoint] = limiter
+        return limiter
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, endpoint: str, path: str, **kwargs: Any
+    ) -> AsyncIterator[ClientResponse]:
+        """Send a request to an endpoint, holding one of its slots.
+
+        Args:
+            method: HTTP method.
+            endpoint: Base URL of the endpoint.
+            path: Path appended to the endpoint.
+            **kwargs: Passed on to ``ClientSession.request``.
+
+        Yields:
+            The response, released when the context exits.
+        """
+        await self.start()
+        assert self._session is not None
+        async with (
+            self.limiter(endpoint),
+            self._session.request(
+                method, endpoint.rstrip("/") + path, **kwargs
+            ) as response,
+        ):
+            yield response
@@ -1,3 +1,8 @@
+from .exception import InvalidCursorError
+
+import base64
+import binascii
+import json
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
@@ -23,3 +28,63 @@ class PaginatedResponse(Generic[T]):
     size: int = field(
         metadata={"description": "Number of items per page.", "example": 20}
     )
+
+
+@dataclass(frozen=True)
+class CursorPaginatedResponse(Generic[T]):
+    """A page of a keyset paginated list, continued with its cursor.
+
+    Unlike PaginatedResponse, fetching the next page costs the same however
+    deep it is, since the query seeks past the last seen instance_id instead
+    of skipping rows.
+    """
+
+    items: list[T] = field(
+        metadata={"description": "List of items on the page.", "example": []}
+    )
+    size: int = field(
+        metadata={"description": "Maximum number of items per page.", "example": 20}
+    )
+    next_cursor: str | None = field(
+        default=None,
+        metadata={
+            "description": "Cursor of the next page, null on the last page.",
+            "example": "eyJpbnN0YW5jZV9pZCI6IDIwfQ",
+        },
+    )
+
+
+def encode_cursor(instance_id: int) -> str:
+    """Encode the position after an item as an opaque cursor.
+
+    Args:
+        instance_id: Instance ID of the last item of a page.
+
+    Returns:
+        URL safe cursor of the next page.
+    """
+    payload = json.dumps({"instance_id": instance_id}).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor made by encode_cursor.
+
+    Args:
+        cursor: The cursor received from a client.
+
+    Returns:
+        Instance ID the next page starts after.
+
+    Raises:
+        InvalidCursorError: If the cursor was not made by encode_cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        instance_id = payload["instance_id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(cursor) from e
+    if type(instance_id) is not int or instance_id < 0:
+        raise InvalidCursorError(cursor)
+    return instance_id
@@ -0,0 +1,44 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work; everyone arriving while it is
+    still running awaits the same result or exception. Nothing is cached once
+    the call finishes. A caller that is cancelled only stops waiting, the
+    shared work keeps running for the others.
+    """
+
+    def __init__(self):
+        """Initialize SingleFlight without calls in flight."""
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """Run the function unless a call with the same key is in flight.
+
+        Args:
+            key: Identifies calls that can share a result.
+            function: Starts the work when no call for the key is running.
+
+        Returns:
+            The result of the call in flight.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(function())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
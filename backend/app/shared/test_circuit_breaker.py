@@ -0,0 +1,81 @@
+from .circuit_breaker import CircuitBreaker, CircuitState
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker({"failure_threshold": 2, "recovery_seconds": 10}, clock)
+
+
+def test_opens_after_consecutive_failures(breaker):
+    breaker.record_failure()
+    assert breaker.state == CircuitState.closed
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.open
+    assert not breaker.available
+    assert not breaker.allow()
+
+
+def test_success_resets_the_failure_count(breaker):
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.closed
+
+
+def test_half_open_allows_a_single_trial(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+
+    assert breaker.state == CircuitState.half_open
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.closed
+
+
+def test_failed_trial_opens_the_circuit_again(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.open
+    clock.now = 19
+    assert not breaker.available
+    clock.now = 20
+    assert breaker.available
+
+
+def test_released_trial_lets_another_call_through(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_invalid_config_is_rejected():
+    with pytest.raises(ValueError, match="failure_threshold"):
+        CircuitBreaker({"failure_threshold": 0})
@@ -0,0 +1,79 @@
+from .http import HTTPTransport
+
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+@pytest_asyncio.fixture
+async def server():
+    in_flight = 0
+    peak = 0
+
+    async def _handler(request: web.Request) -> web.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response({"path": request.path, "peak": peak})
+
+    app = web.Application()
+    app.router.add_post("/{tail:.*}", _handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_transport_joins_endpoint_and_path(server: TestServer):
+    transport = HTTPTransport()
+    endpoint = str(server.make_url("/v2/endpoint/"))
+
+    async with transport.request("POST", endpoint, "/runsync", json={}) as response:
+        body = await response.json()
+
+    await transport.close()
+    assert body["path"] == "/v2/endpoint/runsync"
+    assert transport.closed
+
+
+@pytest.mark.asyncio
+async def test_transport_limits_requests_per_endpoint(server: TestServer):
+    endpoint = str(server.make_url("/v2/endpoint"))
+    transport = HTTPTransport({"endpoint_limits": {endpoint: 2}})
+    await transport.start()
+
+    async def _post() -> int:
+        async with transport.request("POST", endpoint, "/run") as response:
+            return (await response.json())["peak"]
+
+    peaks = await asyncio.gather(*(_post() for _ in range(6)))
+    await transport.close()
+
+    assert max(peaks) == 2
+
+
+@pytest.mark.asyncio
+async def test_transport_reuses_connections(server: TestServer):
+    transport = HTTPTransport({"limit_per_host": 1})
+    endpoint = str(server.make_url("/"))
+
+    for _ in range(3):
+        async with transport.request("POST", endpoint, "/run") as response:
+            await response.read()
+
+    assert transport._session is not None
+    connector = transport._session.connector
+    assert connector is not None
+    # Released connections go back to the pool instead of being closed
+    assert sum(len(conns) for conns in connector._conns.values()) == 1
+    await transport.close()
+
+
+def test_transport_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        HTTPTransport({"endpoint_concurrency": 0})
@@ -0,0 +1,27 @@
+from .exception import InvalidCursorError
+from .pagination import decode_cursor, encode_cursor
+
+import pytest
+
+
+@pytest.mark.parametrize("instance_id", [0, 1, 20, 2**40])
+def test_cursor_round_trip(instance_id: int):
+    cursor = encode_cursor(instance_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == instance_id
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        encode_cursor(1)[:-2],
+        "eyJpbnN0YW5jZV9pZCI6ICIxIn0",  # instance_id is a string
+        "eyJhZnRlciI6IDF9",  # no instance_id
+        "WzFd",  # a list
+    ],
+)
+def test_decode_cursor_rejects_invalid(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
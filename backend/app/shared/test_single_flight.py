@@ -0,0 +1,77 @@
+from .single_flight import SingleFlight
+
+import asyncio
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def _work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(single_flight.do("key", _work) for _ in range(10)))
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert single_flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_separates_keys_and_does_not_cache():
+    single_flight = SingleFlight()
+    calls: list[str] = []
+
+    async def _work(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0)
+        return key
+
+    await asyncio.gather(
+        single_flight.do("a", lambda: _work("a")),
+        single_flight.do("b", lambda: _work("b")),
+    )
+    await single_flight.do("a", lambda: _work("a"))
+
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exceptions():
+    single_flight = SingleFlight()
+
+    async def _fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        single_flight.do("key", _fail),
+        single_flight.do("key", _fail),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_caller_does_not_cancel_others():
+    single_flight = SingleFlight()
+
+    async def _work() -> str:
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.create_task(single_flight.do("key", _work))
+    second = asyncio.create_task(single_flight.do("key", _work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
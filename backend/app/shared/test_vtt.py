@@ -0,0 +1,54 @@
+from .vtt import Cue, format_vtt, parse_vtt
+
+import pytest
+
+
+def test_parse_vtt():
+    content = """WEBVTT
+
+NOTE generated for testing
+
+1
+00:00:01.000 --> 00:00:04.500 align:start
+Hello
+world
+
+01:02.250 --> 01:03.000
+Second cue
+"""
+    assert parse_vtt(content) == [
+        Cue(start=1.0, end=4.5, text="Hello\nworld"),
+        Cue(start=62.25, end=63.0, text="Second cue"),
+    ]
+
+
+def test_parse_vtt_accepts_crlf_and_comma_separator():
+    content = "WEBVTT\r\n\r\n00:00:01,000 --> 00:00:02,000\r\nHi\r\n"
+    assert parse_vtt(content) == [Cue(start=1.0, end=2.0, text="Hi")]
+
+
+def test_parse_vtt_invalid_timestamp():
+    with pytest.raises(ValueError, match="Invalid WebVTT timestamp"):
+        parse_vtt("WEBVTT\n\nnot --> a timestamp\ntext\n")
+
+
+def test_format_vtt_round_trip():
+    cues = [
+        Cue(start=0.0, end=1.5, text="First"),
+        Cue(start=3723.004, end=3724.0, text="Later"),
+    ]
+    content = format_vtt(cues)
+
+    assert content.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:01.500\nFirst")
+    assert "01:02:03.004 --> 01:02:04.000" in content
+    assert parse_vtt(content) == cues
+
+
+def test_format_vtt_without_cues():
+    assert format_vtt([]) == "WEBVTT\n"
+
+
+def test_cue_shifted():
+    cue = Cue(start=1.0, end=2.0, text="x")
+    assert cue.shifted(10.0) == Cue(start=11.0, end=12.0, text="x")
+    assert cue.midpoint == 1.5
@@ -0,0 +1,106 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+_HEADER = "WEBVTT"
+_TIMING_SEPARATOR = "-->"
+_SKIPPED_BLOCKS = ("NOTE", "STYLE", "REGION")
+
+
+@dataclass(frozen=True)
+class Cue:
+    """A single WebVTT cue with times in seconds."""
+
+    start: float
+    end: float
+    text: str
+
+    @property
+    def midpoint(self) -> float:
+        return (self.start + self.end) / 2
+
+    def shifted(self, offset: float) -> "Cue":
+        """Move the cue by the given number of seconds.
+
+        Args:
+            offset: Seconds added to both start and end.
+
+        Returns:
+            The shifted cue.
+        """
+        return replace(self, start=self.start + offset, end=self.end + offset)
+
+
+def parse_vtt(content: str) -> list[Cue]:
+    """Parse WebVTT content into cues.
+
+    Cue identifiers, cue settings and NOTE/STYLE/REGION blocks are ignored.
+
+    Args:
+        content: WebVTT document.
+
+    Returns:
+        The cues in document order.
+
+    Raises:
+        ValueError: If a timing line cannot be parsed.
+    """
+    cues: list[Cue] = []
+    normalized = content.replace("\r\n", "\n").replace("\r", "\n")
+    for block in normalized.split("\n\n"):
+        lines = [line for line in block.split("\n") if line.strip()]
+        if not lines or lines[0].startswith((_HEADER, *_SKIPPED_BLOCKS)):
+            continue
+
+        timing_index = next(
+            (i for i, line in enumerate(lines) if _TIMING_SEPARATOR in line), None
+        )
+        if timing_index is None:
+            continue
+
+        start, _, rest = lines[timing_index].partition(_TIMING_SEPARATOR)
+        end = rest.split()[0] if rest.split() else ""
+        cues.append(
+            Cue(
+                start=_parse_timestamp(start.strip()),
+                end=_parse_timestamp(end),
+                text="\n".join(lines[timing_index + 1 :]),
+            )
+        )
+    return cues
+
+
+def format_vtt(cues: Iterable[Cue]) -> str:
+    """Format cues as a WebVTT document.
+
+    Args:
+        cues: Cues to write, in the order they should appear.
+
+    Returns:
+        WebVTT document.
+    """
+    blocks = [_HEADER]
+    for cue in cues:
+        blocks.append(
+            f"{_format_timestamp(cue.start)} {_TIMING_SEPARATOR} "
+            f"{_format_timestamp(cue.end)}\n{cue.text}"
+        )
+    return "\n\n".join(blocks) + "\n"
+
+
+def _parse_timestamp(value: str) -> float:
+    try:
+        parts = value.replace(",", ".").split(":")
+        seconds = float(parts[-1])
+        minutes = int(parts[-2]) if len(parts) >= 2 else 0
+        hours = int(parts[-3]) if len(parts) >= 3 else 0
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"Invalid WebVTT timestamp: {value!r}") from e
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _format_timestamp(seconds: float) -> str:
+    milliseconds = max(round(seconds * 1000), 0)
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    seconds_part, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds_part:02d}.{milliseconds:03d}"
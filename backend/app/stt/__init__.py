@@ -1,5 +1,5 @@
 from .abstract import BackgroundRemover, SpeechToText
-from ..shared.data import Audio, AudioExtension, Transcription
+from ..shared.data import Audio, AudioExtension, AudioStream, Transcription
 from .process import Transcribe
 
 __all__ = [
@@ -7,6 +7,7 @@ __all__ = [
     "SpeechToText",
     "Audio",
     "AudioExtension",
+    "AudioStream",
     "Transcription",
     "Transcribe",
 ]
@@ -1,6 +1,13 @@
-from ..shared.data import Audio, Transcription, AudioExtension, SubtitleExtension
+from ..shared.data import (
+    Audio,
+    AudioStream,
+    Transcription,
+    AudioExtension,
+    SubtitleExtension,
+)
 from ..shared.supported import Language
-from .converter import convert_audio_extension
+from .converter import convert_audio_extension, convert_audio_stream
+from .upload import AudioUploader
 
 from abc import ABC, abstractmethod
 
@@ -9,6 +16,8 @@ class _AudioWorker(ABC):
     """Abstract base class for audio processing services."""
 
     _supported_audio_extensions: tuple[AudioExtension, ...]
+    # How audio is sent to a remote worker, None for workers running locally
+    _uploader: AudioUploader | None = None
 
     @abstractmethod
     def __init__(self, config: dict):
@@ -26,12 +35,31 @@ class _AudioWorker(ABC):
         """
         return self._supported_audio_extensions
 
-    async def _convert_audio(self, audio: Audio) -> Audio:
+    @property
+    def uploader(self) -> AudioUploader | None:
+        """Get the strategy sending audio to the service, if it is remote.
+
+        :return: The audio uploader, or None when no audio leaves the process.
+        """
+        return self._uploader
+
+    async def _convert_audio(self, audio: Audio | AudioStream) -> Audio:
         """Convert the given audio data to a supported audio format if necessary.
 
+        Streamed audio is piped through ffmpeg and only materialized once, after
+        conversion, so the unconverted track is never held in memory.
+
         :param audio: The audio data to process.
         :return: The processed audio data.
         """
+        if isinstance(audio, AudioStream):
+            if audio.extension not in self.supported_audio_extensions:
+                audio = convert_audio_stream(
+                    origin_stream=audio,
+                    target_extension=self.supported_audio_extensions[0],
+                )
+            return await audio.read()
+
         target_audio: Audio = audio
         if audio.extension not in self.supported_audio_extensions:
             target_audio = await convert_audio_extension(
@@ -53,7 +81,7 @@ class BackgroundRemover(_AudioWorker):
         """
         pass
 
-    async def remove_background(self, audio: Audio) -> Audio:
+    async def remove_background(self, audio: Audio | AudioStream) -> Audio:
         """Remove the background noise from the given audio.
 
         :param audio: The audio data from which to remove background noise.
@@ -70,6 +98,18 @@ class BackgroundRemover(_AudioWorker):
         """
         return self._output_audio_extension
 
+    @property
+    def cache_parameters(self) -> tuple[str, ...]:
+        """Get the parameters that, with the input audio, determine the output.
+
+        Results of the same input are only reused while these stay the same, so
+        implementations add anything that changes the separated audio, such as
+        the model or endpoint.
+
+        :return: The identifying parameters.
+        """
+        return (type(self).__name__, self.output_audio_extension.value)
+
 
 class SpeechToText(_AudioWorker):
     _output_subtitle_extension: SubtitleExtension
@@ -90,7 +130,7 @@ class SpeechToText(_AudioWorker):
 
     async def transcribe(
         self,
-        audio: Audio,
+        audio: Audio | AudioStream,
         target_language: Language | None = None,
         prompt: str | None = None,
     ) -> Transcription:
@@ -1,3 +1,6 @@
+from .cached import CachedBackgroundRemover
+from .local_mdx import LocalMDX
 from .runpod_uvr import RunpodUVR
+from .vocal_filter import FFmpegVocalFilter
 
-__all__ = ["RunpodUVR"]
+__all__ = ["CachedBackgroundRemover", "FFmpegVocalFilter", "LocalMDX", "RunpodUVR"]
@@ -0,0 +1,52 @@
+from ..abstract import BackgroundRemover
+from ..cache import AudioCache, content_hash
+from ...shared.data import Audio, AudioStream
+
+import asyncio
+
+
+class CachedBackgroundRemover(BackgroundRemover):
+    """Remembers separated vocal stems of any background remover on disk.
+
+    Results are keyed by the content hash of the input audio and the wrapped
+    remover's cache parameters, so re-processing the same track skips both the
+    format conversion and the separation.
+    """
+
+    def __init__(self, config: dict, background_remover: BackgroundRemover):
+        """Initialize CachedBackgroundRemover with configuration.
+
+        Args:
+            config: Dictionary containing directory and max_bytes of the cache.
+            background_remover: The background remover whose output is cached.
+        """
+        self._cache = AudioCache(config)
+        self._background_remover = background_remover
+        self._supported_audio_extensions = background_remover.supported_audio_extensions
+        self._output_audio_extension = background_remover.output_audio_extension
+
+    @property
+    def cache(self) -> AudioCache:
+        return self._cache
+
+    @property
+    def cache_parameters(self) -> tuple[str, ...]:
+        return self._background_remover.cache_parameters
+
+    async def remove_background(self, audio: Audio | AudioStream) -> Audio:
+        if isinstance(audio, AudioStream):
+            # The content has to be known to look it up
+            audio = await audio.read()
+
+        source_hash = await asyncio.to_thread(content_hash, audio.binary)
+        key = AudioCache.key(source_hash, *self.cache_parameters)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        vocals = await self._background_remover.remove_background(audio)
+        await self._cache.put(key, vocals)
+        return vocals
+
+    async def _remove_background(self, audio: Audio) -> Audio:
+        return await self._background_remover._remove_background(audio)
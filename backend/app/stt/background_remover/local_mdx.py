@@ -0,0 +1,223 @@
+from ..abstract import BackgroundRemover
+from ...shared.data import Audio, AudioExtension
+from ..pcm import PCMAudio, decode_pcm
+from ..process_pool import ProcessPool, load_once
+
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# MDX-Net models are trained on 44.1 kHz audio
+MDX_SAMPLE_RATE = 44100
+
+
+@dataclass(frozen=True)
+class LocalMDXConfig:
+    # Path of an MDX-Net vocal model exported to ONNX
+    model_path: str
+    # STFT parameters the model was trained with
+    n_fft: int = field(default=6144)
+    hop_length: int = field(default=1024)
+    dim_f: int = field(default=3072)
+    dim_t: int = field(default=256)
+    # Gain correction of the model output
+    compensate: float = field(default=1.0)
+    # Worker processes, each holding its own ONNX Runtime session
+    processes: int = field(default=1)
+    # Threads per process, 0 for the ONNX Runtime default
+    cpu_threads: int = field(default=0)
+
+
+@dataclass(frozen=True)
+class _ModelOptions:
+    model_path: str
+    cpu_threads: int
+    n_fft: int
+    hop_length: int
+    dim_f: int
+    compensate: float
+
+
+def _create_session(options: _ModelOptions) -> Any:
+    import onnxruntime
+
+    session_options = onnxruntime.SessionOptions()
+    if options.cpu_threads:
+        session_options.intra_op_num_threads = options.cpu_threads
+    return onnxruntime.InferenceSession(
+        options.model_path, session_options, providers=["CPUExecutionProvider"]
+    )
+
+
+def _window(n_fft: int) -> np.ndarray:
+    # Periodic Hann window, as used by torch.stft when the models were trained
+    return np.hanning(n_fft + 1)[:-1].astype(np.float32)
+
+
+def stft(waves: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """Compute the centered short-time Fourier transform of each channel.
+
+    Args:
+        waves: Samples shaped (channels, samples).
+        n_fft: FFT size.
+        hop_length: Samples between consecutive frames.
+
+    Returns:
+        Complex spectrogram shaped (channels, n_fft // 2 + 1, frames).
+    """
+    padded = np.pad(waves, ((0, 0), (n_fft // 2, n_fft // 2)), mode="reflect")
+    frame_count = 1 + (padded.shape[-1] - n_fft) // hop_length
+    indices = np.arange(n_fft)[None, :] + hop_length * np.arange(frame_count)[:, None]
+    frames = padded[:, indices] * _window(n_fft)
+    return np.fft.rfft(frames, axis=-1).transpose(0, 2, 1)
+
+
+def istft(
+    spectrogram: np.ndarray, n_fft: int, hop_length: int, length: int
+) -> np.ndarray:
+    """Invert ``stft`` by windowed overlap-add.
+
+    Args:
+        spectrogram: Complex spectrogram shaped (channels, bins, frames).
+        n_fft: FFT size.
+        hop_length: Samples between consecutive frames.
+        length: Number of samples to return.
+
+    Returns:
+        Samples shaped (channels, length).
+    """
+    window = _window(n_fft)
+    frames = np.fft.irfft(spectrogram.transpose(0, 2, 1), n=n_fft, axis=-1) * window
+    frame_count = frames.shape[1]
+    size = n_fft + hop_length * (frame_count - 1)
+
+    waves = np.zeros((frames.shape[0], size), dtype=np.float32)
+    norm = np.zeros(size, dtype=np.float32)
+    for index in range(frame_count):
+        start = index * hop_length
+        waves[:, start : start + n_fft] += frames[:, index]
+        norm[start : start + n_fft] += window * window
+
+    waves /= np.where(norm > 1e-8, norm, 1.0)
+    return waves[:, n_fft // 2 : n_fft // 2 + length]
+
+
+def _separate_chunk(options: _ModelOptions, samples: bytes) -> bytes:
+    session = load_once(_create_session, options)
+
+    mono = np.frombuffer(samples, dtype=np.float32)
+    # The models expect stereo, the vocals are only used as mono
+    spectrogram = stft(np.stack([mono, mono]), options.n_fft, options.hop_length)
+    spectrogram = spectrogram[:, : options.dim_f]
+    frame_count = spectrogram.shape[-1]
+
+    # (channel, real/imaginary, bin, frame) flattened to the model's 4 inputs
+    model_input = np.stack([spectrogram.real, spectrogram.imag], axis=1).reshape(
+        1, 4, options.dim_f, frame_count
+    )
+    model_output = session.run(
+        None, {session.get_inputs()[0].name: model_input.astype(np.float32)}
+    )[0].reshape(2, 2, options.dim_f, frame_count)
+
+    vocals = np.zeros((2, options.n_fft // 2 + 1, frame_count), dtype=np.complex64)
+    vocals[:, : options.dim_f] = model_output[:, 0] + 1j * model_output[:, 1]
+    waves = istft(vocals, options.n_fft, options.hop_length, len(mono))
+    return (waves.mean(axis=0) * options.compensate).astype(np.float32).tobytes()
+
+
+class LocalMDX(BackgroundRemover):
+    """Separates vocals on the CPU with an MDX-Net model in ONNX format.
+
+    The track is cut into chunks of the model's input size, overlapping by
+    half an FFT window on both sides so the edges of each chunk can be
+    discarded. Chunks are separated in a bounded pool of worker processes,
+    each loading the model once, and stitched back together. Requires the
+    ``local-separation`` extra.
+    """
+
+    # Any input is decoded to PCM by ffmpeg before separation
+    _supported_audio_extensions = tuple(AudioExtension)
+    _output_audio_extension = AudioExtension.WAV
+
+    def __init__(self, config: dict, executor: Executor | None = None):
+        """Initialize LocalMDX with configuration.
+
+        Args:
+            config: Dictionary containing model_path, n_fft, hop_length, dim_f,
+                dim_t, compensate, processes and cpu_threads.
+            executor: Executor running the model, a process pool of
+                ``processes`` workers is created on first use if None.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        self._config = LocalMDXConfig(**config)
+
+        if not self._config.model_path:
+            raise ValueError("model_path must be provided in the configuration.")
+        if self._config.dim_f > self._config.n_fft // 2 + 1:
+            raise ValueError("dim_f must not exceed the number of FFT bins.")
+        if self.generated_size <= 0:
+            raise ValueError("dim_t is too small for the FFT size.")
+
+        self._model_options = _ModelOptions(
+            model_path=self._config.model_path,
+            cpu_threads=self._config.cpu_threads,
+            n_fft=self._config.n_fft,
+            hop_length=self._config.hop_length,
+            dim_f=self._config.dim_f,
+            compensate=self._config.compensate,
+        )
+        self._pool = ProcessPool(self._config.processes, executor)
+
+    @property
+    def chunk_size(self) -> int:
+        # Gives exactly dim_t frames with a centered STFT
+        return self._config.hop_length * (self._config.dim_t - 1)
+
+    @property
+    def generated_size(self) -> int:
+        return self.chunk_size - self._config.n_fft
+
+    @property
+    def cache_parameters(self) -> tuple[str, ...]:
+        return (
+            *super().cache_parameters,
+            self._config.model_path,
+            str(self._config.compensate),
+            "vocals",
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes, abandoning queued chunks."""
+        self._pool.close()
+
+    async def _remove_background(self, audio: Audio) -> Audio:
+        pcm = await decode_pcm(audio, MDX_SAMPLE_RATE)
+        samples = pcm.samples.astype(np.float32) / 32768.0
+        trim = self._config.n_fft // 2
+        length = len(samples)
+        padding = self.generated_size - length % self.generated_size
+        padded = np.concatenate(
+            [np.zeros(trim), samples, np.zeros(padding + trim)]
+        ).astype(np.float32)
+
+        chunks = await asyncio.gather(
+            *(
+                self._pool.run(
+                    _separate_chunk,
+                    self._model_options,
+                    padded[start : start + self.chunk_size].tobytes(),
+                )
+                for start in range(0, length + padding, self.generated_size)
+            )
+        )
+
+        vocals = np.concatenate(
+            [np.frombuffer(chunk, dtype=np.float32)[trim:-trim] for chunk in chunks]
+        )[:length]
+        samples_i16 = np.clip(vocals * 32768.0, -32768, 32767).astype(np.int16)
+        return PCMAudio(samples=samples_i16, sample_rate=MDX_SAMPLE_RATE).to_wav()
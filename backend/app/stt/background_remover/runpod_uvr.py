@@ -1,15 +1,23 @@
 from ..abstract import BackgroundRemover
 from ...shared.data import Audio, AudioExtension
+from ...shared.http import HTTPTransport
+from ..exception import RunpodHTTPError
+from ..object_store import ObjectStore
+from ..runpod import RunpodClient
+from ..upload import AudioFields, create_audio_uploader
 
-from dataclasses import dataclass
-from aiohttp import ClientSession
-from base64 import b64encode, b64decode
+from dataclasses import dataclass, field
+from base64 import b64decode
 
 
 @dataclass(frozen=True)
 class RunpodUVRConfig:
     api_key: str
     endpoint: str
+    # Submission mode and polling of Runpod jobs, see RunpodJobConfig
+    job: dict = field(default_factory=dict)
+    # How the audio is sent, see AudioUploaderConfig
+    upload: dict = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -22,14 +30,24 @@ class RunpodUVR(BackgroundRemover):
         AudioExtension.MP3,
         AudioExtension.OGG,
         AudioExtension.WAV,
+        AudioExtension.FLAC,
+        AudioExtension.OPUS,
     )
     _output_audio_extension = AudioExtension.OGG
+    _audio_fields = AudioFields(base64="audio", url="audio_url")
 
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        transport: HTTPTransport,
+        object_store: ObjectStore | None = None,
+    ):
         """Initialize RunpodUVR with configuration.
 
         Args:
             config: Dictionary containing api_key and endpoint.
+            transport: Shared HTTPTransport, closed by its owner.
+            object_store: Store for presigned URL uploads.
 
         Raises:
             ValueError: If required configuration keys are missing or empty.
@@ -41,28 +59,31 @@ class RunpodUVR(BackgroundRemover):
         if not self._config.endpoint:
             raise ValueError("endpoint must be provided in the configuration.")
 
-        self._session = ClientSession(
-            base_url=self._config.endpoint,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": self._config.api_key,
-            },
+        self._transport = transport
+        self._uploader = create_audio_uploader(
+            self._config.upload, self._transport, object_store
         )
+        self._client = RunpodClient(
+            self._config.api_key,
+            self._config.endpoint,
+            self._transport,
+            self._config.job,
+            self._uploader,
+        )
+
+    @property
+    def cache_parameters(self) -> tuple[str, ...]:
+        return (*super().cache_parameters, self._config.endpoint, "vocals")
 
     async def _remove_background(self, audio: Audio) -> Audio:
-        response = await self._session.post(
-            "/runsync",
-            json={
-                "input": {
-                    "audio": b64encode(audio.binary).decode("utf-8"),
-                    "parts": ["vocals"],
-                },
-            },
-        )
-        if response.status != 200:
-            raise RuntimeError(f"Runpod UVR API returned status {response.status}")
+        try:
+            output = await self._client.run(
+                {"parts": ["vocals"]}, audio, self._audio_fields
+            )
+        except RunpodHTTPError as e:
+            raise RuntimeError(f"Runpod UVR API returned status {e.status}") from e
 
-        body: RunpodUVRResponse = RunpodUVRResponse(**await response.json())
+        body: RunpodUVRResponse = RunpodUVRResponse(output=output)
         return Audio(
             binary=b64decode(body.output["vocals"]),
             extension=AudioExtension.OGG,
@@ -0,0 +1,119 @@
+from ..abstract import BackgroundRemover
+from ...shared.data import Audio, AudioExtension, AudioStream
+from .cached import CachedBackgroundRemover
+
+import pytest
+from unittest.mock import patch
+
+
+class CountingBackgroundRemover(BackgroundRemover):
+    _supported_audio_extensions = (AudioExtension.MP3, AudioExtension.WAV)
+    _output_audio_extension = AudioExtension.OGG
+
+    def __init__(self, config: dict):
+        self.model = config.get("model", "default")
+        self.calls = 0
+
+    @property
+    def cache_parameters(self) -> tuple[str, ...]:
+        return (*super().cache_parameters, self.model)
+
+    async def _remove_background(self, audio: Audio) -> Audio:
+        self.calls += 1
+        return Audio(
+            binary=b"vocals_of_" + audio.binary,
+            extension=self._output_audio_extension,
+        )
+
+
+@pytest.fixture
+def mp3_audio():
+    return Audio(binary=b"mp3_audio_data", extension=AudioExtension.MP3)
+
+
+@pytest.fixture
+def remover() -> CountingBackgroundRemover:
+    return CountingBackgroundRemover({})
+
+
+@pytest.fixture
+def cached_remover(tmp_path, remover) -> CachedBackgroundRemover:
+    return CachedBackgroundRemover({"directory": str(tmp_path)}, remover)
+
+
+def test_delegates_extensions(cached_remover: CachedBackgroundRemover):
+    assert cached_remover.supported_audio_extensions == (
+        AudioExtension.MP3,
+        AudioExtension.WAV,
+    )
+    assert cached_remover.output_audio_extension == AudioExtension.OGG
+
+
+@pytest.mark.asyncio
+async def test_second_call_is_served_from_cache(
+    cached_remover: CachedBackgroundRemover,
+    remover: CountingBackgroundRemover,
+    mp3_audio: Audio,
+):
+    first = await cached_remover.remove_background(mp3_audio)
+    second = await cached_remover.remove_background(mp3_audio)
+
+    assert remover.calls == 1
+    assert first == second
+    assert first.binary == b"vocals_of_mp3_audio_data"
+    assert first.extension == AudioExtension.OGG
+    assert cached_remover.cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_conversion(
+    cached_remover: CachedBackgroundRemover, remover: CountingBackgroundRemover
+):
+    aac_audio = Audio(binary=b"aac_audio_data", extension=AudioExtension.AAC)
+    converted = Audio(binary=b"converted", extension=AudioExtension.MP3)
+
+    with patch("app.stt.abstract.convert_audio_extension") as mock_convert:
+        mock_convert.return_value = converted
+        await cached_remover.remove_background(aac_audio)
+        await cached_remover.remove_background(aac_audio)
+
+    mock_convert.assert_called_once()
+    assert remover.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_streamed_audio_shares_entries_with_in_memory_audio(
+    cached_remover: CachedBackgroundRemover,
+    remover: CountingBackgroundRemover,
+    mp3_audio: Audio,
+):
+    await cached_remover.remove_background(AudioStream.from_audio(mp3_audio))
+    await cached_remover.remove_background(mp3_audio)
+
+    assert remover.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_model_parameters_are_part_of_the_key(tmp_path, mp3_audio: Audio):
+    config = {"directory": str(tmp_path)}
+    first_model = CountingBackgroundRemover({"model": "first"})
+    second_model = CountingBackgroundRemover({"model": "second"})
+
+    await CachedBackgroundRemover(config, first_model).remove_background(mp3_audio)
+    await CachedBackgroundRemover(config, second_model).remove_background(mp3_audio)
+
+    assert first_model.calls == 1
+    assert second_model.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_persists_across_instances(tmp_path, mp3_audio: Audio):
+    config = {"directory": str(tmp_path)}
+    first = CountingBackgroundRemover({})
+    second = CountingBackgroundRemover({})
+
+    await CachedBackgroundRemover(config, first).remove_background(mp3_audio)
+    result = await CachedBackgroundRemover(config, second).remove_background(mp3_audio)
+
+    assert second.calls == 0
+    assert result.binary == b"vocals_of_mp3_audio_data"
@@ -0,0 +1,121 @@
+from ...shared.data import Audio, AudioExtension
+from .. import process_pool
+from ..pcm import PCMAudio
+from . import local_mdx
+from .local_mdx import MDX_SAMPLE_RATE, LocalMDX, istft, stft
+
+import io
+import wave
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+
+SMALL_MODEL = {
+    "model_path": "model.onnx",
+    "n_fft": 256,
+    "hop_length": 64,
+    # Drops only the Nyquist bin
+    "dim_f": 128,
+    "dim_t": 16,
+}
+
+
+class IdentitySession:
+    """Returns its input, so separation should reproduce the track."""
+
+    def __init__(self):
+        self.shapes: list[tuple[int, ...]] = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input")]
+
+    def run(self, outputs, inputs: dict[str, np.ndarray]):
+        self.shapes.append(inputs["input"].shape)
+        return [inputs["input"]]
+
+
+def _tone(seconds: float) -> np.ndarray:
+    time = np.arange(int(seconds * MDX_SAMPLE_RATE)) / MDX_SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * 440 * time)).astype(np.float32)
+
+
+def _read_wav(audio: Audio) -> np.ndarray:
+    with wave.open(io.BytesIO(audio.binary)) as file:
+        assert file.getframerate() == MDX_SAMPLE_RATE
+        return np.frombuffer(file.readframes(file.getnframes()), dtype="<i2")
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    created: list[IdentitySession] = []
+
+    def _create_session(options):
+        created.append(IdentitySession())
+        return created[-1]
+
+    monkeypatch.setattr(process_pool, "_loaded", {})
+    monkeypatch.setattr(local_mdx, "_create_session", _create_session)
+    return created
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_istft_inverts_stft():
+    waves = np.stack([_tone(0.1), _tone(0.1)[::-1].copy()])
+    spectrogram = stft(waves, 256, 64)
+
+    assert spectrogram.shape == (2, 129, waves.shape[1] // 64 + 1)
+    restored = istft(spectrogram, 256, 64, waves.shape[1])
+    np.testing.assert_allclose(restored, waves, atol=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_stitched_back_together(sessions, executor, monkeypatch):
+    tone = _tone(0.25)
+    pcm = PCMAudio(samples=(tone * 32767).astype(np.int16), sample_rate=44100)
+    monkeypatch.setattr(local_mdx, "decode_pcm", AsyncMock(return_value=pcm))
+    remover = LocalMDX(SMALL_MODEL, executor)
+
+    vocals = await remover.remove_background(
+        Audio(binary=b"mp3_audio_data", extension=AudioExtension.MP3)
+    )
+
+    assert vocals.extension == AudioExtension.WAV
+    samples = _read_wav(vocals)
+    assert len(samples) == len(tone)
+    np.testing.assert_allclose(samples / 32768, tone, atol=2e-3)
+
+    # Every chunk is fed to the model in its trained shape
+    shapes = [shape for session in sessions for shape in session.shapes]
+    expected_chunks = -(-len(tone) // remover.generated_size)
+    assert len(shapes) in (expected_chunks, expected_chunks + 1)
+    assert set(shapes) == {(1, 4, 128, 16)}
+
+
+def test_chunk_sizes_follow_the_model():
+    remover = LocalMDX(SMALL_MODEL)
+    assert remover.chunk_size == 64 * 15
+    assert remover.generated_size == 64 * 15 - 256
+
+
+def test_invalid_config_is_rejected():
+    with pytest.raises(ValueError, match="model_path"):
+        LocalMDX({"model_path": ""})
+    with pytest.raises(ValueError, match="dim_f"):
+        LocalMDX(SMALL_MODEL | {"dim_f": 200})
+    with pytest.raises(ValueError, match="dim_t"):
+        LocalMDX(SMALL_MODEL | {"dim_t": 4})
+    with pytest.raises(ValueError, match="processes"):
+        LocalMDX(SMALL_MODEL | {"processes": 0})
+
+
+def test_cache_parameters_identify_the_model():
+    assert "model.onnx" in LocalMDX(SMALL_MODEL).cache_parameters
@@ -1,11 +1,30 @@
 from .runpod_uvr import RunpodUVR, RunpodUVRConfig, RunpodUVRResponse
 from ...shared.data import Audio, AudioExtension
+from ...shared.http import HTTPTransport
 
+import json
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from base64 import b64encode
 
 
+def _mock_request(response: Mock) -> MagicMock:
+    request = MagicMock()
+    request.return_value.__aenter__.return_value = response
+    return request
+
+
+async def _read_json_body(request: MagicMock) -> dict:
+    chunks = [chunk async for chunk in request.call_args.kwargs["data"]]
+    return json.loads(b"".join(chunks))
+
+
+@pytest.fixture
+def transport():
+    # The session is only opened by a request, the tests mock them
+    return HTTPTransport()
+
+
 @pytest.fixture
 def valid_config():
     return {
@@ -70,44 +89,60 @@ class TestRunpodUVRResponse:
 
 class TestRunpodUVR:
     @pytest.mark.asyncio
-    async def test_supported_audio_extensions(self, valid_config):
-        uvr = RunpodUVR(valid_config)
+    async def test_supported_audio_extensions(self, valid_config, transport):
+        uvr = RunpodUVR(valid_config, transport)
         expected_extensions = (
             AudioExtension.MP3,
             AudioExtension.OGG,
             AudioExtension.WAV,
+            AudioExtension.FLAC,
+            AudioExtension.OPUS,
         )
         assert uvr.supported_audio_extensions == expected_extensions
 
     @pytest.mark.asyncio
-    async def test_output_audio_extension(self, valid_config):
-        uvr = RunpodUVR(valid_config)
+    async def test_output_audio_extension(self, valid_config, transport):
+        uvr = RunpodUVR(valid_config, transport)
         assert uvr.output_audio_extension == AudioExtension.OGG
 
     @pytest.mark.asyncio
-    async def test_initialization_with_valid_config(self, valid_config):
-        uvr = RunpodUVR(valid_config)
+    async def test_initialization_with_valid_config(self, valid_config, transport):
+        uvr = RunpodUVR(valid_config, transport)
         assert uvr._config.api_key == "test_api_key"
         assert uvr._config.endpoint == "https://api.runpod.io/test/"
 
-    def test_initialization_with_missing_api_key(self, invalid_config_missing_key):
+    @pytest.mark.asyncio
+    async def test_cache_parameters_include_endpoint(self, valid_config, transport):
+        uvr = RunpodUVR(valid_config, transport)
+        assert uvr.cache_parameters == (
+            "RunpodUVR",
+            "ogg",
+            "https://api.runpod.io/test/",
+            "vocals",
+        )
+
+    def test_initialization_with_missing_api_key(
+        self, invalid_config_missing_key, transport
+    ):
         with pytest.raises(
             ValueError, match="api_key must be provided in the configuration"
         ):
-            RunpodUVR(invalid_config_missing_key)
+            RunpodUVR(invalid_config_missing_key, transport)
 
     def test_initialization_with_missing_endpoint(
-        self, invalid_config_missing_endpoint
+        self, invalid_config_missing_endpoint, transport
     ):
         with pytest.raises(
             ValueError,
             match="endpoint must be provided in the configuration",
         ):
-            RunpodUVR(invalid_config_missing_endpoint)
+            RunpodUVR(invalid_config_missing_endpoint, transport)
 
     @pytest.mark.asyncio
-    async def test_remove_background_success_with_mp3(self, valid_config, mp3_audio):
-        uvr = RunpodUVR(valid_config)
+    async def test_remove_background_success_with_mp3(
+        self, valid_config, mp3_audio, transport
+    ):
+        uvr = RunpodUVR(valid_config, transport)
 
         processed_audio_data = b"processed_vocals_data"
         mock_response_data = {
@@ -118,26 +153,35 @@ class TestRunpodUVR:
         mock_response.status = 200
         mock_response.json = AsyncMock(return_value=mock_response_data)
 
-        uvr._session.post = AsyncMock(return_value=mock_response)
+        uvr._transport.request = _mock_request(mock_response)
 
         result = await uvr._remove_background(mp3_audio)
 
-        uvr._session.post.assert_called_once_with(
+        uvr._transport.request.assert_called_once()
+        assert uvr._transport.request.call_args.args == (
+            "POST",
+            "https://api.runpod.io/test/",
             "/runsync",
-            json={
-                "input": {
-                    "audio": b64encode(mp3_audio.binary).decode("utf-8"),
-                    "parts": ["vocals"],
-                },
-            },
         )
+        assert uvr._transport.request.call_args.kwargs["headers"] == {
+            "Content-Type": "application/json",
+            "Authorization": "test_api_key",
+        }
+        assert await _read_json_body(uvr._transport.request) == {
+            "input": {
+                "parts": ["vocals"],
+                "audio": b64encode(mp3_audio.binary).decode("utf-8"),
+            },
+        }
 
         assert result.binary == processed_audio_data
         assert result.extension == AudioExtension.OGG
 
     @pytest.mark.asyncio
-    async def test_remove_background_success_with_wav(self, valid_config, wav_audio):
-        uvr = RunpodUVR(valid_config)
+    async def test_remove_background_success_with_wav(
+        self, valid_config, wav_audio, transport
+    ):
+        uvr = RunpodUVR(valid_config, transport)
 
         processed_audio_data = b"processed_wav_vocals"
         mock_response_data = {
@@ -148,7 +192,7 @@ class TestRunpodUVR:
         mock_response.status = 200
         mock_response.json = AsyncMock(return_value=mock_response_data)
 
-        uvr._session.post = AsyncMock(return_value=mock_response)
+        uvr._transport.request = _mock_request(mock_response)
 
         result = await uvr._remove_background(wav_audio)
 
@@ -156,22 +200,24 @@ class TestRunpodUVR:
         assert result.extension == AudioExtension.OGG
 
     @pytest.mark.asyncio
-    async def test_remove_background_api_error(self, valid_config, mp3_audio):
-        uvr = RunpodUVR(valid_config)
+    async def test_remove_background_api_error(
+        self, valid_config, mp3_audio, transport
+    ):
+        uvr = RunpodUVR(valid_config, transport)
 
         mock_response = Mock()
         mock_response.status = 500
 
-        uvr._session.post = AsyncMock(return_value=mock_response)
+        uvr._transport.request = _mock_request(mock_response)
 
         with pytest.raises(RuntimeError, match="Runpod UVR API returned status 500"):
             await uvr._remove_background(mp3_audio)
 
     @pytest.mark.asyncio
     async def test_remove_background_with_unsupported_format(
-        self, valid_config, aac_audio
+        self, valid_config, aac_audio, transport
     ):
-        uvr = RunpodUVR(valid_config)
+        uvr = RunpodUVR(valid_config, transport)
 
         converted_audio = Audio(
             binary=b"converted_mp3_data", extension=AudioExtension.MP3
@@ -186,7 +232,7 @@ class TestRunpodUVR:
         mock_response.status = 200
         mock_response.json = AsyncMock(return_value=mock_response_data)
 
-        uvr._session.post = AsyncMock(return_value=mock_response)
+        uvr._transport.request = _mock_request(mock_response)
 
         with patch.object(uvr, "_convert_audio") as mock_convert:
             mock_convert.return_value = converted_audio
@@ -194,15 +240,44 @@ class TestRunpodUVR:
             result = await uvr.remove_background(aac_audio)
 
             mock_convert.assert_called_once_with(aac_audio)
-            uvr._session.post.assert_called_once_with(
-                "/runsync",
-                json={
-                    "input": {
-                        "audio": b64encode(converted_audio.binary).decode("utf-8"),
-                        "parts": ["vocals"],
-                    },
+            uvr._transport.request.assert_called_once()
+            assert await _read_json_body(uvr._transport.request) == {
+                "input": {
+                    "parts": ["vocals"],
+                    "audio": b64encode(converted_audio.binary).decode("utf-8"),
                 },
-            )
+            }
 
             assert result.binary == processed_audio_data
             assert result.extension == AudioExtension.OGG
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_transport(self, valid_config):
+        transport = HTTPTransport()
+        uvr = RunpodUVR(valid_config, transport)
+        assert uvr._transport is transport
+
+    @pytest.mark.asyncio
+    async def test_remove_background_against_fake_runpod_in_run_mode(
+        self, valid_config, mp3_audio, start_fake_runpod
+    ):
+        async def _uvr(input: dict) -> dict:
+            assert input["parts"] == ["vocals"]
+            return {"vocals": b64encode(b"vocals").decode("utf-8")}
+
+        fake_runpod = await start_fake_runpod(_uvr)
+        transport = HTTPTransport()
+        uvr = RunpodUVR(
+            valid_config
+            | {
+                "endpoint": fake_runpod.endpoint,
+                "job": {"mode": "run", "poll_initial_seconds": 0.01},
+            },
+            transport,
+        )
+
+        result = await uvr.remove_background(mp3_audio)
+        await transport.close()
+
+        assert result.binary == b"vocals"
+        assert fake_runpod.requests[0] == "POST /run"
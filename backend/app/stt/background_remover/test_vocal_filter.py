@@ -0,0 +1,35 @@
+from ...shared.data import Audio, AudioExtension
+from .vocal_filter import FFmpegVocalFilter
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+@pytest.mark.asyncio
+async def test_band_passes_the_track_with_ffmpeg():
+    converter = AsyncMock()
+    converter.run.return_value = b"filtered"
+    audio = Audio(binary=b"aac_audio_data", extension=AudioExtension.AAC)
+
+    with patch(
+        "app.stt.background_remover.vocal_filter.get_audio_converter",
+        return_value=converter,
+    ):
+        vocals = await FFmpegVocalFilter({"lowpass_hz": 4000}).remove_background(audio)
+
+    converter.run.assert_awaited_once_with(
+        b"aac_audio_data",
+        ["-af", "highpass=f=120,lowpass=f=4000", "-ac", "1", "-f", "ogg"],
+    )
+    assert vocals == Audio(binary=b"filtered", extension=AudioExtension.OGG)
+
+
+def test_cache_parameters_include_the_filter():
+    narrow = FFmpegVocalFilter({"lowpass_hz": 3000}).cache_parameters
+    wide = FFmpegVocalFilter({"lowpass_hz": 6000}).cache_parameters
+    assert narrow != wide
+
+
+def test_empty_band_is_rejected():
+    with pytest.raises(ValueError, match="highpass_hz"):
+        FFmpegVocalFilter({"highpass_hz": 5000, "lowpass_hz": 100})
@@ -0,0 +1,180 @@
+from ..shared.data import Audio, AudioExtension
+
+import asyncio
+import hashlib
+import os
+import secrets
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class AudioCacheConfig:
+    directory: str
+    max_bytes: int = field(default=1024 * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class AudioCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    total_bytes: int
+
+
+@dataclass
+class _Entry:
+    path: Path
+    size: int
+    extension: AudioExtension
+
+
+def content_hash(binary: bytes) -> str:
+    """Hash audio content for use as part of a cache key.
+
+    :param binary: The audio binary data.
+    :return: Hex encoded SHA-256 digest.
+    """
+    return hashlib.sha256(binary).hexdigest()
+
+
+class AudioCache:
+    """Content-addressed on-disk audio store with LRU eviction by total bytes.
+
+    Entries are files named ``<key>.<extension>`` inside the cache directory.
+    The recency order survives restarts through file modification times, which
+    are refreshed on every hit.
+    """
+
+    def __init__(self, config: dict):
+        """Initialize AudioCache with configuration.
+
+        :param config: Dictionary containing directory and max_bytes.
+        :raises ValueError: If required configuration keys are missing or invalid.
+        """
+        self._config = AudioCacheConfig(**config)
+
+        if not self._config.directory:
+            raise ValueError("directory must be provided in the configuration.")
+        if self._config.max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer.")
+
+        self._directory = Path(self._config.directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_entries()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Build a cache key from its parts.
+
+        :param parts: Strings identifying the cached content, e.g. content hash
+            and conversion parameters.
+        :return: Hex encoded key safe to use as a file name.
+        """
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> AudioCacheStats:
+        return AudioCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            total_bytes=self._total_bytes,
+        )
+
+    async def get(self, key: str) -> Audio | None:
+        """Get cached audio and mark it as recently used.
+
+        :param key: Key built with :meth:`key`.
+        :return: The cached audio, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        try:
+            binary = await asyncio.to_thread(_read_and_touch, entry.path)
+        except FileNotFoundError:
+            # Removed behind our back, forget it
+            self._forget(key)
+            self._misses += 1
+            return None
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._hits += 1
+        return Audio(binary=binary, extension=entry.extension)
+
+    async def put(self, key: str, audio: Audio) -> None:
+        """Store audio and evict least recently used entries over the budget.
+
+        Audio larger than the whole budget is not stored.
+
+        :param key: Key built with :meth:`key`.
+        :param audio: The audio to store.
+        """
+        size = len(audio.binary)
+        if size > self._config.max_bytes:
+            return
+
+        path = self._directory / f"{key}.{audio.extension.value}"
+        await asyncio.to_thread(_write_atomic, path, audio.binary)
+
+        self._forget(key)
+        self._entries[key] = _Entry(path=path, size=size, extension=audio.extension)
+        self._total_bytes += size
+        await self._evict()
+
+    async def _evict(self) -> None:
+        while self._total_bytes > self._config.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            entry = self._entries[key]
+            self._forget(key)
+            self._evictions += 1
+            await asyncio.to_thread(entry.path.unlink, missing_ok=True)
+
+    def _forget(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def _load_entries(self) -> None:
+        extensions = {extension.value: extension for extension in AudioExtension}
+        found: list[tuple[float, str, _Entry]] = []
+        for path in self._directory.iterdir():
+            key, _, suffix = path.name.partition(".")
+            if suffix not in extensions or not path.is_file():
+                continue
+            stat = path.stat()
+            entry = _Entry(path=path, size=stat.st_size, extension=extensions[suffix])
+            found.append((stat.st_mtime, key, entry))
+
+        for _, key, entry in sorted(found, key=lambda item: item[0]):
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+
+
+def _read_and_touch(path: Path) -> bytes:
+    binary = path.read_bytes()
+    os.utime(path)
+    return binary
+
+
+def _write_atomic(path: Path, binary: bytes) -> None:
+    # Unique per write, the same track can be converted twice at once
+    temporary_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        temporary_path.write_bytes(binary)
+        os.replace(temporary_path, path)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,159 @@
+from aiohttp import BodyPartReader, web
+from aiohttp.test_utils import TestServer
+
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest_asyncio
+
+FakeRunpodHandler = Callable[[dict[str, Any]], Coroutine[Any, Any, Any]]
+
+
+@dataclass
+class FakeRunpodJob:
+    id: str
+    input: dict[str, Any]
+    task: asyncio.Task[Any]
+    polls: int = field(default=0)
+    cancelled: bool = field(default=False)
+
+
+class FakeRunpod:
+    """A local stand-in for a Runpod serverless endpoint.
+
+    Implements ``/run``, ``/runsync``, ``/status/{id}`` and ``/cancel/{id}``
+    on an aiohttp test server. Jobs run the given handler in the background;
+    ``/runsync`` waits at most ``runsync_wait_seconds`` before answering with
+    an in-progress job, like Runpod does for long jobs. Multipart submissions
+    are accepted as well; binary parts are added to the input as bytes.
+    """
+
+    def __init__(
+        self,
+        handler: FakeRunpodHandler,
+        api_key: str = "test_api_key",
+        runsync_wait_seconds: float = 1.0,
+    ):
+        """Initialize FakeRunpod.
+
+        Args:
+            handler: Computes the output of a job from its input. Exceptions
+                mark the job as FAILED.
+            api_key: The only accepted Authorization header.
+            runsync_wait_seconds: How long /runsync waits for the output.
+        """
+        self._handler = handler
+        self._api_key = api_key
+        self._runsync_wait_seconds = runsync_wait_seconds
+        self.jobs: dict[str, FakeRunpodJob] = {}
+        self.requests: list[str] = []
+
+        # Audio bodies easily exceed the default limit of 1 MiB
+        app = web.Application(client_max_size=1024**3)
+        app.router.add_post("/run", self._run)
+        app.router.add_post("/runsync", self._runsync)
+        app.router.add_get("/status/{id}", self._status)
+        app.router.add_post("/cancel/{id}", self._cancel)
+        self._server = TestServer(app)
+
+    @property
+    def endpoint(self) -> str:
+        return str(self._server.make_url(""))
+
+    async def start(self) -> None:
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        for job in self.jobs.values():
+            job.task.cancel()
+        await self._server.close()
+
+    def _check(self, request: web.Request) -> None:
+        self.requests.append(f"{request.method} {request.path}")
+        if request.headers.get("Authorization") != self._api_key:
+            raise web.HTTPUnauthorized()
+
+    async def _submit(self, request: web.Request) -> FakeRunpodJob:
+        self._check(request)
+        if request.content_type.startswith("multipart/"):
+            input = await self._read_multipart(request)
+        else:
+            input = (await request.json())["input"]
+        job_id = uuid.uuid4().hex
+        job = FakeRunpodJob(
+            id=job_id,
+            input=input,
+            task=asyncio.create_task(self._handler(input)),
+        )
+        self.jobs[job_id] = job
+        return job
+
+    async def _read_multipart(self, request: web.Request) -> dict[str, Any]:
+        input: dict[str, Any] = {}
+        files: dict[str, bytes] = {}
+        async for part in await request.multipart():
+            if not isinstance(part, BodyPartReader):
+                continue
+            if part.name == "input":
+                input.update(await part.json() or {})
+            elif part.name is not None:
+                files[part.name] = await part.read()
+        return input | files
+
+    async def _run(self, request: web.Request) -> web.Response:
+        job = await self._submit(request)
+        return web.json_response({"id": job.id, "status": "IN_QUEUE"})
+
+    async def _runsync(self, request: web.Request) -> web.Response:
+        job = await self._submit(request)
+        await asyncio.wait([job.task], timeout=self._runsync_wait_seconds)
+        return web.json_response(self._describe(job))
+
+    async def _status(self, request: web.Request) -> web.Response:
+        self._check(request)
+        job = self.jobs.get(request.match_info["id"])
+        if job is None:
+            raise web.HTTPNotFound()
+        job.polls += 1
+        return web.json_response(self._describe(job))
+
+    async def _cancel(self, request: web.Request) -> web.Response:
+        self._check(request)
+        job = self.jobs.get(request.match_info["id"])
+        if job is None:
+            raise web.HTTPNotFound()
+        job.cancelled = True
+        job.task.cancel()
+        return web.json_response({"id": job.id, "status": "CANCELLED"})
+
+    def _describe(self, job: FakeRunpodJob) -> dict[str, Any]:
+        if job.cancelled:
+            return {"id": job.id, "status": "CANCELLED"}
+        if not job.task.done():
+            return {"id": job.id, "status": "IN_PROGRESS"}
+        if job.task.exception() is not None:
+            return {
+                "id": job.id,
+                "status": "FAILED",
+                "error": str(job.task.exception()),
+            }
+        return {"id": job.id, "status": "COMPLETED", "output": job.task.result()}
+
+
+@pytest_asyncio.fixture
+async def start_fake_runpod() -> AsyncIterator[Callable[..., Awaitable[FakeRunpod]]]:
+    """Start FakeRunpod servers, all closed when the test ends."""
+    started: list[FakeRunpod] = []
+
+    async def _start(handler: FakeRunpodHandler, **kwargs: Any) -> FakeRunpod:
+        fake_runpod = FakeRunpod(handler, **kwargs)
+        await fake_runpod.start()
+        started.append(fake_runpod)
+        return fake_runpod
+
+    yield _start
+    for fake_runpod in started:
+        await fake_runpod.close()
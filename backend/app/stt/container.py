@@ -0,0 +1,240 @@
+from ..shared.http import HTTPTransport
+from .abstract import BackgroundRemover, SpeechToText
+from .background_remover import (
+    CachedBackgroundRemover,
+    FFmpegVocalFilter,
+    LocalMDX,
+    RunpodUVR,
+)
+from .ingest import AudioNormalizer
+from .object_store import LocalObjectStore, ObjectStore
+from .process import Transcribe
+from .separation_policy import EnergySeparationPolicy, SeparationPolicy
+from .speech_to_text import (
+    ChunkedSpeechToText,
+    LocalWhisper,
+    RoutedSpeechToText,
+    RunpodWhisper,
+    TrimmedSpeechToText,
+)
+
+from enum import Enum
+
+from dependency_injector import containers, providers
+
+
+class SeparationBackend(str, Enum):
+    # Remote GPU separation on Runpod
+    runpod_uvr = "runpod_uvr"
+    # MDX-Net ONNX model on the local CPU
+    local_mdx = "local_mdx"
+    # Band-pass filter through ffmpeg, no separation model
+    vocal_filter = "vocal_filter"
+
+
+def build_object_store(config: dict | None = None) -> LocalObjectStore | None:
+    """Create the object store for presigned URL uploads when configured.
+
+    Args:
+        config: Configuration of LocalObjectStore, None to disable.
+
+    Returns:
+        The object store, or None.
+    """
+    return LocalObjectStore(config) if config else None
+
+
+def build_local_mdx(
+    separation_backend: str | None = None, config: dict | None = None
+) -> LocalMDX | None:
+    """Create LocalMDX when it is the selected separation backend.
+
+    Args:
+        separation_backend: A SeparationBackend value, runpod_uvr if None.
+        config: Configuration of LocalMDX.
+
+    Returns:
+        The local separation model, or None.
+    """
+    backend = SeparationBackend(separation_backend or SeparationBackend.runpod_uvr)
+    if backend != SeparationBackend.local_mdx:
+        return None
+    return LocalMDX(config or {})
+
+
+def build_background_remover(
+    runpod_uvr: dict | None,
+    transport: HTTPTransport,
+    vocal_cache: dict | None = None,
+    object_store: ObjectStore | None = None,
+    separation_backend: str | None = None,
+    local_mdx: LocalMDX | None = None,
+    vocal_filter: dict | None = None,
+) -> BackgroundRemover:
+    """Create the selected background remover, cached on disk when configured.
+
+    Args:
+        runpod_uvr: Configuration of RunpodUVR.
+        transport: Shared HTTP transport.
+        vocal_cache: Configuration of the vocal stem cache, None to disable.
+        object_store: Store for presigned URL uploads.
+        separation_backend: A SeparationBackend value, runpod_uvr if None.
+        local_mdx: The LocalMDX built by build_local_mdx.
+        vocal_filter: Configuration of FFmpegVocalFilter.
+
+    Returns:
+        The background remover.
+    """
+    backend = SeparationBackend(separation_backend or SeparationBackend.runpod_uvr)
+    background_remover: BackgroundRemover
+    if backend == SeparationBackend.local_mdx:
+        background_remover = local_mdx or LocalMDX({})
+    elif backend == SeparationBackend.vocal_filter:
+        background_remover = FFmpegVocalFilter(vocal_filter)
+    else:
+        background_remover = RunpodUVR(runpod_uvr or {}, transport, object_store)
+    if vocal_cache:
+        background_remover = CachedBackgroundRemover(vocal_cache, background_remover)
+    return background_remover
+
+
+def build_speech_to_text(
+    runpod_whisper: dict,
+    transport: HTTPTransport,
+    chunking: dict | None = None,
+    object_store: ObjectStore | None = None,
+    routing: dict | None = None,
+    trimming: dict | None = None,
+) -> SpeechToText:
+    """Create the speech to text service, routed, chunked and trimmed as configured.
+
+    Args:
+        runpod_whisper: Configuration of RunpodWhisper.
+        transport: Shared HTTP transport.
+        chunking: Configuration of ChunkedSpeechToText, None to disable.
+        object_store: Store for presigned URL uploads.
+        routing: Configuration of RoutedSpeechToText, None to disable. Its
+            backends list holds overrides of runpod_whisper, one per
+            additional endpoint.
+        trimming: Configuration of TrimmedSpeechToText, None to disable.
+
+    Returns:
+        The speech to text service.
+    """
+    speech_to_text: SpeechToText = RunpodWhisper(
+        runpod_whisper, transport, object_store
+    )
+    if routing:
+        routing = dict(routing)
+        backends = [
+            RunpodWhisper(runpod_whisper | overrides, transport, object_store)
+            for overrides in routing.pop("backends", [])
+        ]
+        speech_to_text = RoutedSpeechToText(routing, [speech_to_text, *backends])
+    if chunking:
+        speech_to_text = ChunkedSpeechToText(chunking, speech_to_text)
+    if trimming:
+        # Outermost, so chunking and routing only see the voiced regions
+        speech_to_text = TrimmedSpeechToText(trimming, speech_to_text)
+    return speech_to_text
+
+
+def build_short_speech_to_text(
+    local_whisper: dict | None = None,
+) -> LocalWhisper | None:
+    """Create the local speech to text service for short audio when configured.
+
+    Args:
+        local_whisper: Configuration of LocalWhisper, None to disable.
+
+    Returns:
+        The speech to text service, or None.
+    """
+    return LocalWhisper(local_whisper) if local_whisper else None
+
+
+def build_separation_policy(config: dict | None = None) -> SeparationPolicy | None:
+    """Create the policy skipping needless separation when configured.
+
+    Args:
+        config: Configuration of EnergySeparationPolicy, None to always separate.
+
+    Returns:
+        The separation policy, or None.
+    """
+    return EnergySeparationPolicy(config) if config else None
+
+
+def build_audio_normalizer(config: dict | None = None) -> AudioNormalizer | None:
+    """Create the ingest step transcoding downloads when configured.
+
+    Args:
+        config: Configuration of AudioNormalizer, None to pass downloads on.
+
+    Returns:
+        The audio normalizer, or None.
+    """
+    return AudioNormalizer(config) if config else None
+
+
+class STTContainer(containers.DeclarativeContainer):
+    config = providers.Configuration()
+    transport = providers.Dependency(instance_of=HTTPTransport)
+
+    # Started and closed by the application lifespan when configured
+    object_store = providers.Singleton(build_object_store, config=config.object_store)
+
+    # Its worker processes are stopped by the application lifespan
+    local_mdx = providers.Singleton(
+        build_local_mdx,
+        separation_backend=config.separation_backend,
+        config=config.local_mdx,
+    )
+
+    # Built lazily, so the Runpod sections are only required once a job runs
+    background_remover = providers.Singleton(
+        build_background_remover,
+        runpod_uvr=config.runpod_uvr,
+        transport=transport,
+        vocal_cache=config.vocal_cache,
+        object_store=object_store,
+        separation_backend=config.separation_backend,
+        local_mdx=local_mdx,
+        vocal_filter=config.vocal_filter,
+    )
+
+    speech_to_text = providers.Singleton(
+        build_speech_to_text,
+        runpod_whisper=config.runpod_whisper,
+        transport=transport,
+        chunking=config.chunking,
+        object_store=object_store,
+        routing=config.routing,
+        trimming=config.trimming,
+    )
+
+    # Its worker processes are stopped by the application lifespan
+    short_speech_to_text = providers.Singleton(
+        build_short_speech_to_text,
+        local_whisper=config.local_whisper,
+    )
+
+    separation_policy = providers.Singleton(
+        build_separation_policy,
+        config=config.separation_policy,
+    )
+
+    normalizer = providers.Singleton(
+        build_audio_normalizer,
+        config=config.ingest,
+    )
+
+    transcribe = providers.Singleton(
+        Transcribe,
+        background_remover=background_remover,
+        stt=speech_to_text,
+        short_stt=short_speech_to_text,
+        short_max_seconds=config.short_max_seconds,
+        separation_policy=separation_policy,
+        normalizer=normalizer,
+    )
@@ -1,7 +1,252 @@
-from ..shared.data import Audio, AudioExtension
+from ..shared.data import AUDIO_CHUNK_SIZE, Audio, AudioExtension, AudioStream
+from .cache import AudioCache, content_hash
+from .exception import FFmpegError, FFmpegTimeoutError
 
 import asyncio
-from io import BytesIO
+import json
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
+
+# Only the tail of ffmpeg diagnostics is kept for error reporting
+_STDERR_TAIL_SIZE = 16 * 1024
+
+# ffprobe format names of the containers AudioExtension stands for
+_PROBED_EXTENSIONS = {
+    "aac": AudioExtension.AAC,
+    "flac": AudioExtension.FLAC,
+    "matroska,webm": AudioExtension.WEBM,
+    # YouTube serves AAC in an MP4 container, read by ffmpeg like raw AAC
+    "mov,mp4,m4a,3gp,3g2,mj2": AudioExtension.AAC,
+    "mp3": AudioExtension.MP3,
+    "ogg": AudioExtension.OGG,
+    "wav": AudioExtension.WAV,
+}
+
+
+@dataclass(frozen=True)
+class AudioConverterConfig:
+    max_concurrency: int = field(default=4)
+    timeout_seconds: float | None = field(default=300.0)
+
+
+@dataclass(frozen=True)
+class AudioProbe:
+    # None if the container is not one of AudioExtension
+    extension: AudioExtension | None
+    codec: str | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+
+
+class AudioConverter:
+    """Runs ffmpeg over real pipes with a bounded number of processes."""
+
+    def __init__(self, config: dict | None = None, cache: AudioCache | None = None):
+        """Initialize AudioConverter with configuration.
+
+        :param config: Dictionary containing max_concurrency and timeout_seconds.
+        :param cache: Optional cache of previous conversion results.
+        :raises ValueError: If max_concurrency is not positive.
+        """
+        self._config = AudioConverterConfig(**(config or {}))
+        self._cache = cache
+
+        if self._config.max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        self._semaphore = asyncio.Semaphore(self._config.max_concurrency)
+
+    @property
+    def config(self) -> AudioConverterConfig:
+        return self._config
+
+    @property
+    def cache(self) -> AudioCache | None:
+        return self._cache
+
+    async def run(self, input_binary: bytes, output_args: Sequence[str]) -> bytes:
+        """Run ffmpeg with the given binary on stdin and return its stdout.
+
+        Stdin is fed while stdout and stderr are drained concurrently, so large
+        inputs cannot deadlock on a full pipe buffer.
+
+        :param input_binary: The data written to ffmpeg stdin.
+        :param output_args: Output options placed between the input and stdout.
+        :return: Everything ffmpeg wrote to stdout.
+        :raises FFmpegTimeoutError: If the conversion exceeds the timeout.
+        :raises FFmpegError: If ffmpeg exits with a non-zero status.
+        """
+        async with self._semaphore:
+            process = await _spawn_ffmpeg(output_args)
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input_binary),
+                    timeout=self._config.timeout_seconds,
+                )
+            except TimeoutError as e:
+                await _kill(process)
+                raise FFmpegTimeoutError(self._config.timeout_seconds or 0.0) from e
+            except BaseException:
+                await _kill(process)
+                raise
+
+        if process.returncode != 0:
+            raise FFmpegError(process.returncode, stderr[-_STDERR_TAIL_SIZE:])
+        return stdout
+
+    async def probe(self, input_binary: bytes) -> AudioProbe:
+        """Detect the container and first audio stream with ffprobe.
+
+        :param input_binary: The audio data, written to ffprobe stdin.
+        :return: What ffprobe found out about the audio.
+        :raises FFmpegTimeoutError: If probing exceeds the timeout.
+        :raises FFmpegError: If ffprobe cannot read the data.
+        """
+        async with self._semaphore:
+            process = await _spawn_ffprobe()
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input_binary),
+                    timeout=self._config.timeout_seconds,
+                )
+            except TimeoutError as e:
+                await _kill(process)
+                raise FFmpegTimeoutError(self._config.timeout_seconds or 0.0) from e
+            except BaseException:
+                await _kill(process)
+                raise
+
+        if process.returncode != 0:
+            raise FFmpegError(process.returncode, stderr[-_STDERR_TAIL_SIZE:])
+
+        result = json.loads(stdout or b"{}")
+        format_name = result.get("format", {}).get("format_name")
+        streams = result.get("streams") or [{}]
+        codec = streams[0].get("codec_name")
+        extension = _PROBED_EXTENSIONS.get(format_name)
+        if extension == AudioExtension.OGG and codec == "opus":
+            extension = AudioExtension.OPUS
+        sample_rate = streams[0].get("sample_rate")
+        return AudioProbe(
+            extension=extension,
+            codec=codec,
+            sample_rate=int(sample_rate) if sample_rate else None,
+            channels=streams[0].get("channels"),
+        )
+
+    async def convert(
+        self,
+        audio: Audio,
+        target_extension: AudioExtension,
+        output_args: Sequence[str] | None = None,
+    ) -> Audio:
+        """Convert audio binary data to the specified audio extension.
+
+        With a cache configured, the result is looked up by the source content
+        hash, target extension and ffmpeg arguments before running ffmpeg.
+
+        :param audio: The original audio.
+        :param target_extension: The target audio extension to convert to.
+        :param output_args: Output options, only the target format if None.
+        :return: Converted audio.
+        """
+        output_args = list(output_args or ["-f", target_extension.value])
+        if self._cache is None:
+            binary = await self.run(audio.binary, output_args)
+            return Audio(binary=binary, extension=target_extension)
+
+        source_hash = await asyncio.to_thread(content_hash, audio.binary)
+        key = AudioCache.key(source_hash, target_extension.value, *output_args)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        binary = await self.run(audio.binary, output_args)
+        converted = Audio(binary=binary, extension=target_extension)
+        await self._cache.put(key, converted)
+        return converted
+
+    def convert_stream(
+        self,
+        origin_stream: AudioStream,
+        target_extension: AudioExtension,
+        output_args: Sequence[str] | None = None,
+    ) -> AudioStream:
+        """Convert streamed audio to the specified extension without buffering it.
+
+        FFmpeg is started lazily once the returned stream is consumed and holds a
+        concurrency slot until the stream is exhausted or closed. Its stdin is fed
+        from the origin chunks while stdout is yielded, so only a few chunks are in
+        memory at any time. The timeout applies to each stdout read, since the
+        overall duration depends on how fast the consumer reads.
+
+        :param origin_stream: The audio stream to convert.
+        :param target_extension: The target audio extension to convert to.
+        :param output_args: Output options, only the target format if None.
+        :return: A stream of the converted audio.
+        """
+        args = list(output_args or ["-f", target_extension.value])
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            async with self._semaphore:
+                process = await _spawn_ffmpeg(args)
+                assert process.stdin is not None and process.stdout is not None
+                feeder = asyncio.create_task(
+                    _feed_stdin(process.stdin, origin_stream.chunks)
+                )
+                stderr = asyncio.create_task(_drain_stderr(process.stderr))
+                try:
+                    while chunk := await self._read_stdout(process.stdout, stderr):
+                        yield chunk
+                    await feeder
+                    await process.wait()
+                    if process.returncode != 0:
+                        raise FFmpegError(process.returncode, await stderr)
+                finally:
+                    # The consumer may stop early; never leave ffmpeg behind
+                    for task in (feeder, stderr):
+                        if not task.done():
+                            task.cancel()
+                    await _kill(process)
+
+        return AudioStream(chunks=_chunks(), extension=target_extension)
+
+    async def _read_stdout(
+        self, stdout: asyncio.StreamReader, stderr: "asyncio.Task[bytes]"
+    ) -> bytes:
+        try:
+            return await asyncio.wait_for(
+                stdout.read(AUDIO_CHUNK_SIZE), timeout=self._config.timeout_seconds
+            )
+        except TimeoutError as e:
+            stderr.cancel()
+            raise FFmpegTimeoutError(self._config.timeout_seconds or 0.0) from e
+
+
+_audio_converter: AudioConverter | None = None
+
+
+def get_audio_converter() -> AudioConverter:
+    """Get the process-wide converter used by the module level helpers."""
+    global _audio_converter
+    if _audio_converter is None:
+        _audio_converter = AudioConverter()
+    return _audio_converter
+
+
+def configure_audio_converter(config: dict | None = None) -> AudioConverter:
+    """Replace the process-wide converter with one built from configuration.
+
+    :param config: Dictionary containing max_concurrency, timeout_seconds and an
+        optional cache section with directory and max_bytes.
+    :return: The newly configured converter.
+    """
+    global _audio_converter
+    converter_config = dict(config or {})
+    cache_config = converter_config.pop("cache", None)
+    cache = AudioCache(cache_config) if cache_config else None
+    _audio_converter = AudioConverter(converter_config, cache=cache)
+    return _audio_converter
 
 
 async def convert_audio_extension(
@@ -9,25 +254,84 @@ async def convert_audio_extension(
 ) -> Audio:
     """Convert audio binary data to the specified audio extension.
 
-    :param origin_binary: The original audio binary data.
+    :param origin_audio: The original audio.
+    :param target_extension: The target audio extension to convert to.
+    :return: Converted audio.
+    """
+    return await get_audio_converter().convert(origin_audio, target_extension)
+
+
+def convert_audio_stream(
+    origin_stream: AudioStream, target_extension: AudioExtension
+) -> AudioStream:
+    """Convert streamed audio to the specified extension without buffering it.
+
+    :param origin_stream: The audio stream to convert.
     :param target_extension: The target audio extension to convert to.
-    :return: Converted audio binary data.
+    :return: A stream of the converted audio.
     """
-    origin_binary = origin_audio.binary
-    output_buffer = BytesIO()
-    process = await asyncio.subprocess.create_subprocess_exec(
+    return get_audio_converter().convert_stream(origin_stream, target_extension)
+
+
+async def _spawn_ffmpeg(output_args: Sequence[str]) -> asyncio.subprocess.Process:
+    return await asyncio.subprocess.create_subprocess_exec(
         "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
         "-i",
         "-",  # Input from stdin
-        "-f",
-        target_extension.value,  # Output format
+        *output_args,
         "-",  # Output to stdout
-        stdin=BytesIO(origin_binary),  # Provide input binary data
-        stdout=output_buffer,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+async def _spawn_ffprobe() -> asyncio.subprocess.Process:
+    return await asyncio.subprocess.create_subprocess_exec(
+        "ffprobe",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "format=format_name:stream=codec_name,sample_rate,channels",
+        "-of",
+        "json",
+        "-",  # Input from stdin
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
     )
-    await process.wait()
-    if process.returncode != 0:
-        raise RuntimeError("FFmpeg process did not complete successfully.")
-    output_buffer.seek(0)
 
-    return Audio(binary=output_buffer.read(), extension=target_extension)
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        process.kill()
+        await process.wait()
+
+
+async def _feed_stdin(
+    stdin: asyncio.StreamWriter, chunks: AsyncIterator[bytes]
+) -> None:
+    try:
+        async for chunk in chunks:
+            stdin.write(chunk)
+            await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # FFmpeg exited early, its return code reports the failure
+        pass
+    finally:
+        stdin.close()
+
+
+async def _drain_stderr(stderr: asyncio.StreamReader | None) -> bytes:
+    tail = b""
+    if stderr is None:
+        return tail
+    while chunk := await stderr.read(AUDIO_CHUNK_SIZE):
+        tail = (tail + chunk)[-_STDERR_TAIL_SIZE:]
+    return tail
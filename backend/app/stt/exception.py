@@ -0,0 +1,71 @@
+class FFmpegError(RuntimeError):
+    def __init__(
+        self,
+        returncode: int | None,
+        stderr: bytes = b"",
+        message: str = "FFmpeg process did not complete successfully.",
+    ):
+        """Initialize FFmpegError.
+
+        Args:
+            returncode: Exit code of the ffmpeg process, None if it was killed.
+            stderr: Captured ffmpeg diagnostics.
+            message: Summary of the failure.
+        """
+        self.returncode = returncode
+        self.stderr = stderr.decode("utf-8", errors="replace").strip()
+        super().__init__(f"{message} {self.stderr}" if self.stderr else message)
+
+
+class FFmpegTimeoutError(FFmpegError):
+    def __init__(self, timeout_seconds: float, stderr: bytes = b""):
+        """Initialize FFmpegTimeoutError.
+
+        Args:
+            timeout_seconds: The timeout that was exceeded.
+            stderr: Captured ffmpeg diagnostics up to the timeout.
+        """
+        self.timeout_seconds = timeout_seconds
+        super().__init__(
+            None, stderr, f"FFmpeg process timed out after {timeout_seconds}s."
+        )
+
+
+class RunpodHTTPError(RuntimeError):
+    def __init__(self, status: int, path: str):
+        """Initialize RunpodHTTPError.
+
+        Args:
+            status: HTTP status returned by Runpod.
+            path: The requested API path.
+        """
+        self.status = status
+        self.path = path
+        super().__init__(f"Runpod API returned status {status} for {path}")
+
+
+class RunpodJobError(RuntimeError):
+    def __init__(self, job_id: str | None, status: str, error: str | None = None):
+        """Initialize RunpodJobError.
+
+        Args:
+            job_id: ID of the Runpod job, None if it was never assigned.
+            status: Final status of the job, such as FAILED or TIMED_OUT.
+            error: Error reported by the worker, if any.
+        """
+        self.job_id = job_id
+        self.status = status
+        self.error = error
+        message = f"Runpod job {job_id} ended with status {status}"
+        super().__init__(f"{message}: {error}" if error else message)
+
+
+class NoBackendAvailableError(RuntimeError):
+    def __init__(self, backend_count: int):
+        """Initialize NoBackendAvailableError.
+
+        Args:
+            backend_count: Number of configured backends, all unavailable.
+        """
+        self.backend_count = backend_count
+        super().__init__(f"All {backend_count} backends have an open circuit.")
@@ -0,0 +1,102 @@
+from ..shared.data import Audio, AudioExtension, AudioStream
+from .converter import AudioProbe, get_audio_converter
+from .exception import FFmpegError
+
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class CanonicalFormat(str, Enum):
+    # Lossy, the smallest payloads at speech quality
+    opus = "opus"
+    # Lossless, larger but decoded faster
+    flac = "flac"
+
+
+@dataclass(frozen=True)
+class AudioNormalizerConfig:
+    format: CanonicalFormat = field(default=CanonicalFormat.opus)
+    sample_rate: int = field(default=16000)
+    channels: int = field(default=1)
+    opus_bitrate: str = field(default="32k")
+
+
+class AudioNormalizer:
+    """Transcodes downloaded audio once to the format every worker accepts.
+
+    The source is probed first, so tracks that already are in the canonical
+    format are passed through unchanged instead of being re-encoded, and the
+    result always carries the extension of what it actually contains.
+    """
+
+    def __init__(self, config: dict | None = None):
+        """Initialize AudioNormalizer with configuration.
+
+        :param config: Dictionary containing format, sample_rate, channels and
+            opus_bitrate.
+        :raises ValueError: If the format is unknown or a number not positive.
+        """
+        config = dict(config or {})
+        if "format" in config:
+            config["format"] = CanonicalFormat(config["format"])
+        self._config = AudioNormalizerConfig(**config)
+
+        if self._config.sample_rate < 1 or self._config.channels < 1:
+            raise ValueError("sample_rate and channels must be positive integers.")
+
+    @property
+    def config(self) -> AudioNormalizerConfig:
+        return self._config
+
+    @property
+    def extension(self) -> AudioExtension:
+        return AudioExtension(self._config.format.value)
+
+    @property
+    def output_args(self) -> list[str]:
+        config = self._config
+        args = ["-vn", "-ac", str(config.channels), "-ar", str(config.sample_rate)]
+        if config.format == CanonicalFormat.opus:
+            args += ["-c:a", "libopus", "-b:a", config.opus_bitrate]
+        else:
+            args += ["-c:a", "flac", "-sample_fmt", "s16"]
+        return [*args, "-f", self.extension.value]
+
+    def is_canonical(self, probe: AudioProbe) -> bool:
+        """Check whether probed audio needs no transcoding.
+
+        :param probe: The probe of the audio.
+        :return: True if the audio already is in the canonical format.
+        """
+        if probe.extension != self.extension or probe.channels != self._config.channels:
+            return False
+        # Opus always reports the 48 kHz it is decoded at
+        return (
+            self._config.format == CanonicalFormat.opus
+            or probe.sample_rate == self._config.sample_rate
+        )
+
+    async def normalize(self, audio: Audio | AudioStream) -> Audio:
+        """Bring audio to the canonical format.
+
+        :param audio: The downloaded audio, in any container ffmpeg reads.
+        :return: The audio in the canonical format.
+        """
+        converter = get_audio_converter()
+        if isinstance(audio, AudioStream):
+            # Probing needs the container, transcode the stream while it arrives
+            stream = converter.convert_stream(audio, self.extension, self.output_args)
+            return await stream.read()
+
+        try:
+            probe = await converter.probe(audio.binary)
+        except FFmpegError:
+            # FFmpeg may still read what ffprobe could not identify from a pipe
+            logger.warning("Could not probe the audio, transcoding it", exc_info=True)
+        else:
+            if self.is_canonical(probe):
+                return Audio(binary=audio.binary, extension=self.extension)
+        return await converter.convert(audio, self.extension, self.output_args)
@@ -0,0 +1,156 @@
+from aiohttp import web
+
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from dataclasses import dataclass, field
+from urllib.parse import quote, urlencode
+
+
+class ObjectStore(ABC):
+    """Storage that hands out presigned URLs, such as S3 or R2."""
+
+    @abstractmethod
+    async def presign(self, key: str, method: str, expires_seconds: float) -> str:
+        """Create a URL allowing one method on one object without credentials.
+
+        Args:
+            key: The object key.
+            method: "PUT" to upload or "GET" to download.
+            expires_seconds: How long the URL stays valid.
+
+        Returns:
+            The presigned URL.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete an object, ignoring missing ones.
+
+        Args:
+            key: The object key.
+        """
+        pass
+
+
+@dataclass(frozen=True)
+class LocalObjectStoreConfig:
+    directory: str
+    host: str = field(default="127.0.0.1")
+    port: int = field(default=0)
+    # URL the workers reach the store at, defaults to the bound address
+    public_url: str | None = field(default=None)
+    secret: str | None = field(default=None)
+
+
+class LocalObjectStore(ObjectStore):
+    """A local stand-in for an S3-style object store with presigned URLs.
+
+    Objects are files in ``directory`` served by a small aiohttp server.
+    URLs carry an expiry and an HMAC signature over method, key and expiry,
+    so only presigned requests are accepted. Uploads and downloads are
+    streamed in chunks.
+    """
+
+    _CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, config: dict):
+        """Initialize LocalObjectStore with configuration.
+
+        Args:
+            config: Dictionary containing directory, host, port, public_url
+                and secret. A random secret is used if none is given.
+
+        Raises:
+            ValueError: If directory is empty.
+        """
+        self._config = LocalObjectStoreConfig(**config)
+        if not self._config.directory:
+            raise ValueError("directory must be provided in the configuration.")
+
+        self._secret = (self._config.secret or secrets.token_hex(32)).encode()
+        self._runner: web.AppRunner | None = None
+        self._base_url = self._config.public_url
+
+    @property
+    def base_url(self) -> str:
+        if self._base_url is None:
+            raise RuntimeError("LocalObjectStore is not started.")
+        return self._base_url
+
+    async def start(self) -> None:
+        """Start serving the objects."""
+        if self._runner is not None:
+            return
+        os.makedirs(self._config.directory, exist_ok=True)
+
+        app = web.Application()
+        app.router.add_put("/objects/{key}", self._put)
+        app.router.add_get("/objects/{key}", self._get)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._config.host, self._config.port)
+        await site.start()
+
+        if self._base_url is None:
+            host, port = self._runner.addresses[0][:2]
+            self._base_url = f"http://{host}:{port}"
+
+    async def close(self) -> None:
+        """Stop serving the objects."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def presign(self, key: str, method: str, expires_seconds: float) -> str:
+        expires = str(int(time.time() + expires_seconds))
+        query = urlencode(
+            {"expires": expires, "signature": self._sign(method, key, expires)}
+        )
+        return f"{self.base_url}/objects/{quote(key, safe='')}?{query}"
+
+    async def delete(self, key: str) -> None:
+        with suppress(FileNotFoundError):
+            os.remove(self._path(key))
+
+    def _sign(self, method: str, key: str, expires: str) -> str:
+        message = f"{method}\n{key}\n{expires}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def _path(self, key: str) -> str:
+        # Keys are flat, anything else could escape the directory
+        if not key or "/" in key or key.startswith("."):
+            raise web.HTTPBadRequest()
+        return os.path.join(self._config.directory, key)
+
+    def _authorize(self, request: web.Request) -> str:
+        key = request.match_info["key"]
+        expires = request.query.get("expires", "")
+        signature = request.query.get("signature", "")
+        expected = self._sign(request.method, key, expires)
+        if not hmac.compare_digest(signature, expected):
+            raise web.HTTPForbidden()
+        if not expires.isdigit() or int(expires) < time.time():
+            raise web.HTTPForbidden()
+        return self._path(key)
+
+    async def _put(self, request: web.Request) -> web.Response:
+        path = self._authorize(request)
+        temporary_path = f"{path}.{secrets.token_hex(4)}.part"
+        with open(temporary_path, "wb") as file:  # noqa: ASYNC230
+            async for chunk in request.content.iter_chunked(self._CHUNK_SIZE):
+                file.write(chunk)
+        os.replace(temporary_path, path)
+        return web.Response(status=200)
+
+    async def _get(self, request: web.Request) -> web.StreamResponse:
+        path = self._authorize(request)
+        if not await asyncio.to_thread(os.path.exists, path):
+            raise web.HTTPNotFound()
+        return web.FileResponse(path, chunk_size=self._CHUNK_SIZE)
@@ -0,0 +1,78 @@
+from ..shared.data import Audio, AudioExtension
+from .converter import get_audio_converter
+
+import io
+import wave
+from dataclasses import dataclass
+
+import numpy as np
+
+# Whisper and most VAD models work on 16 kHz mono audio
+PCM_SAMPLE_RATE = 16000
+PCM_FRAME_SECONDS = 0.02
+
+
+@dataclass(frozen=True, eq=False)
+class PCMAudio:
+    """Decoded mono 16-bit PCM samples."""
+
+    samples: np.ndarray
+    sample_rate: int = PCM_SAMPLE_RATE
+
+    @property
+    def duration_seconds(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    def slice(self, start_seconds: float, end_seconds: float) -> "PCMAudio":
+        """Cut the samples between two points in time.
+
+        :param start_seconds: Start of the slice.
+        :param end_seconds: End of the slice, exclusive.
+        :return: The sliced audio, sharing memory with this one.
+        """
+        start = max(int(round(start_seconds * self.sample_rate)), 0)
+        end = min(int(round(end_seconds * self.sample_rate)), len(self.samples))
+        return PCMAudio(samples=self.samples[start:end], sample_rate=self.sample_rate)
+
+    def to_wav(self) -> Audio:
+        """Encode the samples as a WAV file.
+
+        :return: WAV audio.
+        """
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(self.samples.astype("<i2", copy=False).tobytes())
+        return Audio(binary=buffer.getvalue(), extension=AudioExtension.WAV)
+
+
+async def decode_pcm(audio: Audio, sample_rate: int = PCM_SAMPLE_RATE) -> PCMAudio:
+    """Decode audio of any supported extension to mono 16-bit PCM.
+
+    :param audio: The audio to decode.
+    :param sample_rate: Target sample rate.
+    :return: The decoded samples.
+    """
+    binary = await get_audio_converter().run(
+        audio.binary, ["-ac", "1", "-ar", str(sample_rate), "-f", "s16le"]
+    )
+    return PCMAudio(samples=np.frombuffer(binary, dtype="<i2"), sample_rate=sample_rate)
+
+
+def frame_rms(pcm: PCMAudio, frame_seconds: float = PCM_FRAME_SECONDS) -> np.ndarray:
+    """Compute the RMS level of consecutive, non-overlapping frames.
+
+    :param pcm: The audio to analyse.
+    :param frame_seconds: Length of each frame.
+    :return: RMS per frame, normalized to the 0..1 range of full scale.
+    """
+    frame_size = max(int(pcm.sample_rate * frame_seconds), 1)
+    frame_count = len(pcm.samples) // frame_size
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = pcm.samples[: frame_count * frame_size].reshape(frame_count, frame_size)
+    normalized = frames.astype(np.float32) / 32768.0
+    return np.sqrt(np.mean(normalized * normalized, axis=1))
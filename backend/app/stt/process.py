@@ -1,17 +1,125 @@
-from ..shared.data import Audio, Transcription
+from ..shared.data import Audio, AudioStream, Transcription
+from ..shared.supported import Language
 from .abstract import BackgroundRemover, SpeechToText
+from .ingest import AudioNormalizer
+from .separation_policy import SeparationDecision, SeparationPolicy
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Separation:
+    # The vocal stem, or the original audio when separation was skipped
+    audio: Audio
+    decision: SeparationDecision
 
 
 class Transcribe:
-    def __init__(self, background_remover: BackgroundRemover, stt: SpeechToText):
+    def __init__(
+        self,
+        background_remover: BackgroundRemover,
+        stt: SpeechToText,
+        short_stt: SpeechToText | None = None,
+        short_max_seconds: float | None = None,
+        separation_policy: SeparationPolicy | None = None,
+        normalizer: AudioNormalizer | None = None,
+    ):
         """Initialize the speech-to-text process with background remover and STT.
 
         :param background_remover: An instance of BackgroundRemoverAbstract.
         :param stt: An instance of SpeechToTextAbstract.
+        :param short_stt: Optional STT used for audio of known, short duration,
+            such as a local model that avoids network round-trips.
+        :param short_max_seconds: Longest duration handled by short_stt.
+        :param separation_policy: Optional policy deciding per track whether
+            separation is needed, every track is separated if None.
+        :param normalizer: Optional ingest step transcoding downloads to one
+            canonical format, downloads are passed on as they are if None.
         """
         self._background_remover = background_remover
         self._speech_to_text = stt
+        self._short_speech_to_text = short_stt
+        self._short_max_seconds = short_max_seconds or 0.0
+        self._separation_policy = separation_policy
+        self._normalizer = normalizer
+
+    def select_speech_to_text(self, duration_seconds: float | None) -> SpeechToText:
+        """Choose the STT for audio of the given duration.
+
+        :param duration_seconds: Duration of the audio, None if unknown.
+        :return: short_stt for short audio, otherwise the default STT.
+        """
+        if (
+            self._short_speech_to_text is not None
+            and duration_seconds is not None
+            and duration_seconds <= self._short_max_seconds
+        ):
+            return self._short_speech_to_text
+        return self._speech_to_text
+
+    async def normalize(self, audio: Audio | AudioStream) -> Audio | AudioStream:
+        """Run the ingest step on downloaded audio.
+
+        :param audio: The downloaded audio.
+        :return: The audio in the canonical format, or unchanged without a
+            normalizer.
+        """
+        if self._normalizer is None:
+            return audio
+        return await self._normalizer.normalize(audio)
+
+    async def remove_background(self, audio: Audio | AudioStream) -> Audio:
+        """Run the separation stage on its own.
+
+        :param audio: The original audio.
+        :return: The vocal stem.
+        """
+        return await self._background_remover.remove_background(audio)
+
+    async def separate(self, audio: Audio | AudioStream) -> Separation:
+        """Run the separation stage unless the policy finds it unnecessary.
+
+        :param audio: The original audio.
+        :return: The audio to transcribe and the decision that produced it.
+        """
+        if self._separation_policy is None:
+            decision = SeparationDecision(separate=True, reason="no_policy")
+            return Separation(await self.remove_background(audio), decision)
+
+        if isinstance(audio, AudioStream):
+            # The content has to be known to analyse it
+            audio = await audio.read()
+        decision = await self._separation_policy.decide(audio)
+        if not decision.separate:
+            return Separation(audio, decision)
+        return Separation(await self.remove_background(audio), decision)
+
+    async def transcribe(
+        self,
+        audio: Audio | AudioStream,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+        duration_seconds: float | None = None,
+    ) -> Transcription:
+        """Run the speech-to-text stage on its own.
+
+        :param audio: The vocal stem.
+        :param target_language: Language to transcribe in, detected if None.
+        :param prompt: Optional prompt guiding the transcription.
+        :param duration_seconds: Duration of the audio, selects the STT if known.
+        :return: The transcription.
+        """
+        speech_to_text = self.select_speech_to_text(duration_seconds)
+        return await speech_to_text.transcribe(audio, target_language, prompt)
 
-    async def process(self, audio: Audio) -> Transcription:
-        only_vocal_audio = await self._background_remover.remove_background(audio)
-        return await self._speech_to_text.transcribe(only_vocal_audio)
+    async def process(
+        self,
+        audio: Audio | AudioStream,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+        duration_seconds: float | None = None,
+    ) -> Transcription:
+        separation = await self.separate(audio)
+        return await self.transcribe(
+            separation.audio, target_language, prompt, duration_seconds
+        )
@@ -0,0 +1,71 @@
+import asyncio
+import multiprocessing
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+# Models loaded in this process, keyed by their loader and options
+_loaded: dict[tuple[Callable[..., Any], Hashable], Any] = {}
+
+
+def load_once(load: Callable[[K], T], options: K) -> T:
+    """Load a model once per worker process and keep it for later calls.
+
+    :param load: Creates the model from its options. Optional dependencies
+        are imported inside it, so only the worker processes need them.
+    :param options: Hashable options identifying the model.
+    :return: The model loaded earlier with the same options, or a new one.
+    """
+    key = (load, options)
+    if key not in _loaded:
+        _loaded[key] = load(options)
+    return _loaded[key]
+
+
+class ProcessPool:
+    """Runs blocking inference in a bounded pool of worker processes.
+
+    Work in a separate process neither blocks the event loop nor competes for
+    the GIL. The pool is only started on first use, so configured but unused
+    local backends cost nothing.
+    """
+
+    def __init__(self, processes: int, executor: Executor | None = None):
+        """Initialize ProcessPool.
+
+        :param processes: Number of worker processes.
+        :param executor: Executor used instead of a process pool, for tests.
+        :raises ValueError: If processes is not positive.
+        """
+        if processes < 1:
+            raise ValueError("processes must be a positive integer.")
+        self._processes = processes
+        self._executor = executor
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a function in a worker process.
+
+        :param function: A picklable, module level function.
+        :param args: Picklable arguments of the function.
+        :return: The result of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), function, *args)
+
+    def close(self) -> None:
+        """Stop the worker processes, abandoning queued work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # Forking a process running an event loop and threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
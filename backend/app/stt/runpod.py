@@ -0,0 +1,174 @@
+from ..shared.data import Audio
+from ..shared.http import HTTPTransport
+from .exception import RunpodHTTPError, RunpodJobError
+from .upload import AudioFields, AudioUploader, JSONUploader
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+_FINAL_STATUSES = ("COMPLETED", "FAILED", "CANCELLED", "TIMED_OUT")
+
+
+class RunpodMode(str, Enum):
+    # Hold the connection until the job finishes, polling if Runpod gives up
+    sync = "sync"
+    # Submit with /run and poll /status, releasing the connection in between
+    run = "run"
+
+
+@dataclass(frozen=True)
+class RunpodJobConfig:
+    mode: RunpodMode = field(default=RunpodMode.sync)
+    poll_initial_seconds: float = field(default=1.0)
+    poll_max_seconds: float = field(default=15.0)
+    poll_multiplier: float = field(default=1.5)
+    # Jobs still unfinished after this long are cancelled, None to wait forever
+    timeout_seconds: float | None = field(default=3600.0)
+
+
+class RunpodClient:
+    """Submits jobs to a Runpod serverless endpoint and waits for their output.
+
+    In ``run`` mode a job is submitted with ``/run`` and ``/status/{id}`` is
+    polled with exponential backoff, so a connection is only held for the
+    duration of each short request and many GPU jobs can be in flight over a
+    few pooled connections. In ``sync`` mode ``/runsync`` is used, falling
+    back to polling when Runpod returns before the job has finished.
+
+    A job whose waiting coroutine is cancelled or times out is cancelled on
+    Runpod as well. Audio sent with a job is encoded by an ``AudioUploader``,
+    which keeps any uploaded object alive until the job has finished.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        endpoint: str,
+        transport: HTTPTransport,
+        config: dict | None = None,
+        uploader: AudioUploader | None = None,
+    ):
+        """Initialize RunpodClient.
+
+        Args:
+            api_key: Runpod API key.
+            endpoint: Base URL of the serverless endpoint.
+            transport: HTTPTransport sending the requests.
+            config: Dictionary containing mode, poll_initial_seconds,
+                poll_max_seconds, poll_multiplier and timeout_seconds.
+            uploader: Encodes the audio of jobs, embedded in JSON if None.
+
+        Raises:
+            ValueError: If the polling configuration is invalid.
+        """
+        self._config = RunpodJobConfig(**(config or {}))
+        if self._config.poll_initial_seconds <= 0:
+            raise ValueError("poll_initial_seconds must be positive.")
+        if self._config.poll_max_seconds < self._config.poll_initial_seconds:
+            raise ValueError("poll_max_seconds must not be below the initial delay.")
+        if self._config.poll_multiplier < 1:
+            raise ValueError("poll_multiplier must be at least 1.")
+
+        self._mode = RunpodMode(self._config.mode)
+        self._endpoint = endpoint
+        self._transport = transport
+        self._uploader = uploader or JSONUploader()
+        self._headers = {"Authorization": api_key}
+
+    @property
+    def config(self) -> RunpodJobConfig:
+        return self._config
+
+    @property
+    def uploader(self) -> AudioUploader:
+        return self._uploader
+
+    async def run(
+        self,
+        input: dict[str, Any],
+        audio: Audio | None = None,
+        fields: AudioFields | None = None,
+    ) -> Any:
+        """Run a job and return its output.
+
+        Args:
+            input: The job input, without the audio.
+            audio: Audio sent with the job by the uploader.
+            fields: Where the worker expects the audio, required with audio.
+
+        Returns:
+            The output of the completed job.
+
+        Raises:
+            ValueError: If audio is given without fields.
+            RunpodHTTPError: If Runpod answers with a non-200 status.
+            RunpodJobError: If the job fails, is cancelled or times out.
+        """
+        if audio is None:
+            return await self._run({"json": {"input": input}})
+        if fields is None:
+            raise ValueError("fields must be provided with audio.")
+
+        async with self._uploader.prepare(input, audio, fields) as body:
+            return await self._run(body)
+
+    async def _run(self, body: dict[str, Any]) -> Any:
+        path = "/runsync" if self._mode == RunpodMode.sync else "/run"
+        job = await self._request("POST", path, **body)
+        if self._config.timeout_seconds is None:
+            return await self._wait(job)
+
+        try:
+            async with asyncio.timeout(self._config.timeout_seconds):
+                return await self._wait(job)
+        except TimeoutError as e:
+            raise RunpodJobError(job.get("id"), "TIMED_OUT") from e
+
+    async def _wait(self, job: dict[str, Any]) -> Any:
+        job_id = job.get("id")
+        try:
+            delay = self._config.poll_initial_seconds
+            # /runsync replies without a status when the output is inline
+            while (status := job.get("status", "COMPLETED")) not in _FINAL_STATUSES:
+                if job_id is None:
+                    raise RunpodJobError(None, status, "Runpod did not return a job id")
+                await asyncio.sleep(delay)
+                delay = min(
+                    delay * self._config.poll_multiplier, self._config.poll_max_seconds
+                )
+                job = await self._request("GET", f"/status/{job_id}")
+        except asyncio.CancelledError:
+            # The caller gave up or timed out, stop the GPU work as well
+            if job_id is not None:
+                await self._cancel(job_id)
+            raise
+
+        if status != "COMPLETED":
+            raise RunpodJobError(job_id, status, job.get("error"))
+        return job.get("output")
+
+    async def _cancel(self, job_id: str) -> None:
+        # Best effort, the job times out on Runpod eventually
+        with suppress(Exception):
+            await self._request("POST", f"/cancel/{job_id}")
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        async with self._transport.request(
+            method,
+            self._endpoint,
+            path,
+            headers={**self._headers, **(headers or {})},
+            **kwargs,
+        ) as response:
+            if response.status != 200:
+                raise RunpodHTTPError(response.status, path)
+            return await response.json()
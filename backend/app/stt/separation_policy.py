@@ -0,0 +1,167 @@
+from ..shared.data import Audio
+from .pcm import decode_pcm
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SeparationDecision:
+    separate: bool
+    # Short machine-readable cause, stored with the job
+    reason: str
+    # Measurements the decision was based on, empty if nothing was measured
+    features: dict[str, float] = field(default_factory=dict)
+
+
+class SeparationPolicy(ABC):
+    """Decides whether a track needs vocal separation before transcription."""
+
+    @abstractmethod
+    async def decide(self, audio: Audio) -> SeparationDecision:
+        """Analyse the track and decide whether to separate it.
+
+        :param audio: The original audio.
+        :return: The decision and the features it was based on.
+        """
+        pass
+
+
+class AlwaysSeparate(SeparationPolicy):
+    """Separates every track, without analysing it."""
+
+    async def decide(self, audio: Audio) -> SeparationDecision:
+        return SeparationDecision(separate=True, reason="always")
+
+
+@dataclass(frozen=True)
+class EnergySeparationPolicyConfig:
+    # Analysis runs on downsampled mono audio
+    sample_rate: int = field(default=16000)
+    frame_size: int = field(default=1024)
+    # Band holding most of the energy of the singing or speaking voice
+    vocal_low_hz: float = field(default=250.0)
+    vocal_high_hz: float = field(default=4000.0)
+    # Bass and kick drums live below, cymbals and hi-hats above these
+    bass_cutoff_hz: float = field(default=150.0)
+    treble_cutoff_hz: float = field(default=6000.0)
+    # Separation is skipped only if all three limits hold
+    min_vocal_ratio: float = field(default=0.7)
+    max_bass_ratio: float = field(default=0.05)
+    max_treble_ratio: float = field(default=0.05)
+    # Frames quieter than this, in dBFS, are left out of the analysis
+    silence_db: float = field(default=-50.0)
+
+
+class EnergySeparationPolicy(SeparationPolicy):
+    """Skips separation for tracks whose energy sits in the vocal band.
+
+    Accompaniment shows up as energy below and above the voice: bass lines
+    and kick drums at the bottom, cymbals and hi-hats at the top. A cappella
+    clips and talk have almost none there. The share of spectral energy per
+    band is measured over all non-silent frames with a single vectorized FFT.
+    """
+
+    def __init__(self, config: dict | None = None):
+        """Initialize EnergySeparationPolicy with configuration.
+
+        :param config: Dictionary of EnergySeparationPolicyConfig fields.
+        :raises ValueError: If the bands are inconsistent.
+        """
+        self._config = EnergySeparationPolicyConfig(**(config or {}))
+        bands = (
+            self._config.bass_cutoff_hz,
+            self._config.vocal_low_hz,
+            self._config.vocal_high_hz,
+            self._config.treble_cutoff_hz,
+            self._config.sample_rate / 2,
+        )
+        if bands[0] <= 0 or list(bands) != sorted(bands) or bands[1] == bands[2]:
+            raise ValueError("Bands must be ordered bass, vocal, treble.")
+        if self._config.frame_size < 2:
+            raise ValueError("frame_size must be at least 2.")
+
+    @property
+    def config(self) -> EnergySeparationPolicyConfig:
+        return self._config
+
+    async def decide(self, audio: Audio) -> SeparationDecision:
+        pcm = await decode_pcm(audio, self._config.sample_rate)
+        features = await asyncio.to_thread(self.measure, pcm.samples)
+        decision = self.judge(features)
+        logger.info(
+            f"Separation {'needed' if decision.separate else 'skipped'}: "
+            f"{decision.reason} {features}"
+        )
+        return decision
+
+    def measure(self, samples: np.ndarray) -> dict[str, float]:
+        """Compute the share of energy per band over the non-silent frames.
+
+        :param samples: Mono 16-bit PCM at the configured sample rate.
+        :return: vocal_ratio, bass_ratio, treble_ratio and active_ratio, or an
+            empty dict if no frame is louder than the silence threshold.
+        """
+        config = self._config
+        frame_count = len(samples) // config.frame_size
+        if frame_count == 0:
+            return {}
+
+        frames = samples[: frame_count * config.frame_size].reshape(
+            frame_count, config.frame_size
+        )
+        normalized = frames.astype(np.float32) / 32768.0
+
+        # Loudness is judged before windowing, on the plain frame RMS
+        rms = np.sqrt(np.mean(normalized * normalized, axis=1))
+        active = rms > 10 ** (config.silence_db / 20)
+        if not active.any():
+            return {}
+
+        window = np.hanning(config.frame_size).astype(np.float32)
+        spectrum = np.fft.rfft(normalized[active] * window, axis=1)
+        power = (spectrum.real**2 + spectrum.imag**2).sum(axis=0)
+        total = float(power.sum())
+        if total <= 0:
+            return {}
+
+        frequencies = np.fft.rfftfreq(config.frame_size, 1 / config.sample_rate)
+        vocal = (frequencies >= config.vocal_low_hz) & (
+            frequencies <= config.vocal_high_hz
+        )
+        return {
+            "vocal_ratio": float(power[vocal].sum()) / total,
+            "bass_ratio": float(power[frequencies < config.bass_cutoff_hz].sum())
+            / total,
+            "treble_ratio": float(power[frequencies > config.treble_cutoff_hz].sum())
+            / total,
+            "active_ratio": float(active.mean()),
+        }
+
+    def judge(self, features: dict[str, float]) -> SeparationDecision:
+        """Turn measured features into a decision.
+
+        :param features: The result of ``measure``.
+        :return: The decision.
+        """
+        config = self._config
+        if not features:
+            return SeparationDecision(separate=False, reason="silent")
+
+        if features["bass_ratio"] > config.max_bass_ratio:
+            reason = "bass"
+        elif features["treble_ratio"] > config.max_treble_ratio:
+            reason = "treble"
+        elif features["vocal_ratio"] < config.min_vocal_ratio:
+            reason = "wideband"
+        else:
+            return SeparationDecision(
+                separate=False, reason="clean_vocals", features=features
+            )
+        return SeparationDecision(separate=True, reason=reason, features=features)
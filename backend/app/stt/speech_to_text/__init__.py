@@ -0,0 +1,13 @@
+from .chunked import ChunkedSpeechToText
+from .local_whisper import LocalWhisper
+from .routed import RoutedSpeechToText
+from .runpod_whisper import RunpodWhisper
+from .trimmed import TrimmedSpeechToText
+
+__all__ = [
+    "ChunkedSpeechToText",
+    "LocalWhisper",
+    "RoutedSpeechToText",
+    "RunpodWhisper",
+    "TrimmedSpeechToText",
+]
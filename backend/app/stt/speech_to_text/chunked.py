@@ -0,0 +1,148 @@
+from ...shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from ...shared.supported import Language
+from ...shared.vtt import Cue, format_vtt, parse_vtt
+from ..abstract import SpeechToText
+from ..pcm import PCM_FRAME_SECONDS, PCMAudio, decode_pcm, frame_rms
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ChunkedSpeechToTextConfig:
+    window_seconds: float = field(default=300.0)
+    overlap_seconds: float = field(default=5.0)
+    max_concurrency: int = field(default=4)
+    split_on_silence: bool = field(default=True)
+    silence_search_seconds: float = field(default=15.0)
+
+
+class ChunkedSpeechToText(SpeechToText):
+    """Splits long audio into chunks transcribed concurrently by another STT.
+
+    Cut points are placed at the quietest frame shortly before each window
+    boundary, or exactly on it when silence splitting is disabled. Every chunk is
+    padded with ``overlap_seconds`` of context on both sides; after shifting the
+    returned cues back to track time, a cue is kept only by the chunk whose
+    un-padded span contains its midpoint, which removes the duplicates produced
+    by the overlap.
+    """
+
+    # Any input is decoded to PCM by ffmpeg before splitting
+    _supported_audio_extensions = tuple(AudioExtension)
+    _output_subtitle_extension = SubtitleExtension.VTT
+
+    def __init__(self, config: dict, speech_to_text: SpeechToText):
+        """Initialize ChunkedSpeechToText with configuration.
+
+        Args:
+            config: Dictionary containing window_seconds, overlap_seconds,
+                max_concurrency, split_on_silence and silence_search_seconds.
+            speech_to_text: The speech to text service transcribing each chunk.
+
+        Raises:
+            ValueError: If the configuration is inconsistent or the wrapped
+                service does not produce WebVTT.
+        """
+        self._config = ChunkedSpeechToTextConfig(**config)
+
+        if self._config.window_seconds <= 0:
+            raise ValueError("window_seconds must be positive.")
+        if not 0 <= self._config.overlap_seconds < self._config.window_seconds / 2:
+            raise ValueError("overlap_seconds must be less than half the window.")
+        if self._config.max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        if speech_to_text.output_subtitle_extension != SubtitleExtension.VTT:
+            raise ValueError("Chunked transcription requires a WebVTT output.")
+
+        self._speech_to_text = speech_to_text
+
+    async def _transcribe(
+        self,
+        audio: Audio,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+    ) -> Transcription:
+        pcm = await decode_pcm(audio)
+        cuts = self.plan_cuts(pcm)
+        if len(cuts) <= 2:
+            # Short enough for a single request, send the original encoding
+            return await self._speech_to_text.transcribe(audio, target_language, prompt)
+
+        semaphore = asyncio.Semaphore(self._config.max_concurrency)
+        last_index = len(cuts) - 2
+
+        async def _transcribe_chunk(index: int) -> tuple[Language | None, list[Cue]]:
+            start, end = cuts[index], cuts[index + 1]
+            padded_start = max(start - self._config.overlap_seconds, 0.0)
+            padded_end = min(end + self._config.overlap_seconds, pcm.duration_seconds)
+            chunk = pcm.slice(padded_start, padded_end).to_wav()
+
+            async with semaphore:
+                transcription = await self._speech_to_text.transcribe(
+                    chunk, target_language, prompt
+                )
+
+            cues = [
+                cue.shifted(padded_start) for cue in parse_vtt(transcription.content)
+            ]
+            owned = [
+                cue
+                for cue in cues
+                if start <= cue.midpoint and (cue.midpoint < end or index == last_index)
+            ]
+            return transcription.language, owned
+
+        results = await asyncio.gather(
+            *(_transcribe_chunk(index) for index in range(len(cuts) - 1))
+        )
+
+        language = target_language
+        if language is None:
+            detected = Counter(lang for lang, _ in results if lang is not None)
+            language = detected.most_common(1)[0][0] if detected else None
+
+        cues = sorted(
+            (cue for _, chunk_cues in results for cue in chunk_cues),
+            key=lambda cue: cue.start,
+        )
+        return Transcription(
+            content=format_vtt(cues),
+            extension=self.output_subtitle_extension,
+            language=language,
+        )
+
+    def plan_cuts(self, pcm: PCMAudio) -> list[float]:
+        """Choose the points in time where the audio is split.
+
+        Args:
+            pcm: The decoded audio.
+
+        Returns:
+            Increasing cut points starting at 0 and ending at the duration.
+        """
+        config = self._config
+        duration = pcm.duration_seconds
+        levels = frame_rms(pcm) if config.split_on_silence else None
+
+        cuts = [0.0]
+        while duration - cuts[-1] > config.window_seconds:
+            cut = cuts[-1] + config.window_seconds
+            if levels is not None and len(levels) > 0:
+                # Never search back further than half a window
+                search_start = max(
+                    cut - config.silence_search_seconds,
+                    cuts[-1] + config.window_seconds / 2,
+                )
+                first = int(search_start / PCM_FRAME_SECONDS)
+                last = min(int(cut / PCM_FRAME_SECONDS), len(levels))
+                if last > first:
+                    quietest = first + int(np.argmin(levels[first:last]))
+                    cut = (quietest + 0.5) * PCM_FRAME_SECONDS
+            cuts.append(cut)
+
+        cuts.append(duration)
+        return cuts
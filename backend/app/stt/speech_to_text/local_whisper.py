@@ -0,0 +1,149 @@
+from ...shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from ...shared.supported import Language
+from ...shared.vtt import Cue, format_vtt
+from ..abstract import SpeechToText
+from ..pcm import decode_pcm
+from ..process_pool import ProcessPool, load_once
+
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class LocalWhisperConfig:
+    # A faster-whisper model name or a path to a converted CTranslate2 model
+    model: str = field(default="small")
+    compute_type: str = field(default="int8")
+    # Worker processes, each holding its own copy of the model
+    processes: int = field(default=1)
+    # Threads per process, 0 for the CTranslate2 default
+    cpu_threads: int = field(default=0)
+    beam_size: int = field(default=5)
+    vad_filter: bool = field(default=False)
+    download_root: str | None = field(default=None)
+
+
+@dataclass(frozen=True)
+class _ModelOptions:
+    model: str
+    compute_type: str
+    cpu_threads: int
+    download_root: str | None
+
+
+def _create_model(options: _ModelOptions) -> Any:
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        options.model,
+        device="cpu",
+        compute_type=options.compute_type,
+        cpu_threads=options.cpu_threads,
+        download_root=options.download_root,
+    )
+
+
+def _run_whisper(
+    options: _ModelOptions,
+    samples: bytes,
+    language: str | None,
+    prompt: str | None,
+    beam_size: int,
+    vad_filter: bool,
+) -> tuple[list[tuple[float, float, str]], str | None]:
+    model = load_once(_create_model, options)
+
+    audio = np.frombuffer(samples, dtype="<i2").astype(np.float32) / 32768.0
+    segments, info = model.transcribe(
+        audio,
+        language=language,
+        initial_prompt=prompt,
+        beam_size=beam_size,
+        vad_filter=vad_filter,
+    )
+    # Segments are generated lazily, decode them here rather than in the parent
+    return [
+        (segment.start, segment.end, segment.text.strip()) for segment in segments
+    ], info.language
+
+
+class LocalWhisper(SpeechToText):
+    """Transcribes on the CPU with faster-whisper, without a GPU or network.
+
+    Inference runs in a pool of worker processes, so it neither blocks the
+    event loop nor competes for the GIL; every process loads the model once
+    and keeps it for later requests. Audio is decoded to 16 kHz mono PCM by
+    ffmpeg in the parent. Requires the ``local-whisper`` extra.
+    """
+
+    # Any input is decoded to PCM by ffmpeg before inference
+    _supported_audio_extensions = tuple(AudioExtension)
+    _output_subtitle_extension = SubtitleExtension.VTT
+
+    def __init__(self, config: dict, executor: Executor | None = None):
+        """Initialize LocalWhisper with configuration.
+
+        Args:
+            config: Dictionary containing model, compute_type, processes,
+                cpu_threads, beam_size, vad_filter and download_root.
+            executor: Executor running the inference, a process pool of
+                ``processes`` workers is created on first use if None.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        self._config = LocalWhisperConfig(**config)
+
+        if not self._config.model:
+            raise ValueError("model must be provided in the configuration.")
+
+        self._model_options = _ModelOptions(
+            model=self._config.model,
+            compute_type=self._config.compute_type,
+            cpu_threads=self._config.cpu_threads,
+            download_root=self._config.download_root,
+        )
+        self._pool = ProcessPool(self._config.processes, executor)
+
+    @property
+    def config(self) -> LocalWhisperConfig:
+        return self._config
+
+    def close(self) -> None:
+        """Stop the worker processes, abandoning queued requests."""
+        self._pool.close()
+
+    async def _transcribe(
+        self,
+        audio: Audio,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+    ) -> Transcription:
+        pcm = await decode_pcm(audio)
+        segments, detected_language = await self._pool.run(
+            _run_whisper,
+            self._model_options,
+            pcm.samples.tobytes(),
+            target_language.value if target_language else None,
+            prompt,
+            self._config.beam_size,
+            self._config.vad_filter,
+        )
+
+        language = target_language
+        if language is None:
+            try:
+                language = Language(detected_language)
+            except ValueError:
+                language = None
+
+        return Transcription(
+            content=format_vtt(
+                Cue(start=start, end=end, text=text) for start, end, text in segments
+            ),
+            extension=self.output_subtitle_extension,
+            language=language,
+        )
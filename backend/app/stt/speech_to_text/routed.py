@@ -0,0 +1,249 @@
+from ...shared.circuit_breaker import CircuitBreaker, CircuitState
+from ...shared.data import Audio, Transcription
+from ...shared.supported import Language
+from ..abstract import SpeechToText
+from ..exception import NoBackendAvailableError
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class RoutedSpeechToTextConfig:
+    # Race a slow request against another backend once it exceeds the percentile
+    hedge: bool = field(default=True)
+    hedge_percentile: float = field(default=0.95)
+    # Latencies observed before hedging starts
+    hedge_min_samples: int = field(default=20)
+    # Never hedge earlier, so short requests are not duplicated
+    hedge_min_delay_seconds: float = field(default=1.0)
+    latency_window: int = field(default=200)
+    # Backends tried for one request, hedges and failovers included
+    max_attempts: int = field(default=2)
+    # Per-backend breaker, see CircuitBreakerConfig
+    circuit_breaker: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class RoutedBackendStats:
+    name: str
+    state: CircuitState
+    outstanding: int
+    requests: int
+    failures: int
+
+
+@dataclass
+class _Backend:
+    name: str
+    speech_to_text: SpeechToText
+    breaker: CircuitBreaker
+    outstanding: int = field(default=0)
+    requests: int = field(default=0)
+    failures: int = field(default=0)
+
+
+class RoutedSpeechToText(SpeechToText):
+    """Distributes transcriptions over several speech to text backends.
+
+    Each request goes to the available backend with the fewest requests
+    outstanding. When the request is still running after the recent
+    ``hedge_percentile`` latency, typically because a GPU worker is cold
+    starting, a duplicate is sent to another backend and the first answer
+    wins; the other request is cancelled. A failed request is retried on
+    another backend right away. Backends that keep failing are skipped by
+    their circuit breaker until they recover.
+    """
+
+    def __init__(self, config: dict, speech_to_texts: Sequence[SpeechToText]):
+        """Initialize RoutedSpeechToText with configuration.
+
+        Args:
+            config: Dictionary containing hedge, hedge_percentile,
+                hedge_min_samples, hedge_min_delay_seconds, latency_window,
+                max_attempts and circuit_breaker.
+            speech_to_texts: The backends, in order of preference on ties.
+
+        Raises:
+            ValueError: If the configuration is invalid or the backends do not
+                share an audio and subtitle extension.
+        """
+        self._config = RoutedSpeechToTextConfig(**config)
+
+        if not speech_to_texts:
+            raise ValueError("At least one backend must be provided.")
+        if not 0 < self._config.hedge_percentile <= 1:
+            raise ValueError("hedge_percentile must be in (0, 1].")
+        if self._config.max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer.")
+
+        output_extensions = {stt.output_subtitle_extension for stt in speech_to_texts}
+        if len(output_extensions) != 1:
+            raise ValueError("Backends must produce the same subtitle extension.")
+        self._output_subtitle_extension = output_extensions.pop()
+
+        # Converted once here instead of by every backend a request reaches
+        self._supported_audio_extensions = tuple(
+            extension
+            for extension in speech_to_texts[0].supported_audio_extensions
+            if all(
+                extension in stt.supported_audio_extensions for stt in speech_to_texts
+            )
+        )
+        if not self._supported_audio_extensions:
+            raise ValueError("Backends must share a supported audio extension.")
+
+        self._backends = [
+            _Backend(
+                name=f"{index}:{type(stt).__name__}",
+                speech_to_text=stt,
+                breaker=CircuitBreaker(self._config.circuit_breaker),
+            )
+            for index, stt in enumerate(speech_to_texts)
+        ]
+        self._latencies: deque[float] = deque(maxlen=self._config.latency_window)
+        self._hedged = 0
+
+    @property
+    def stats(self) -> list[RoutedBackendStats]:
+        return [
+            RoutedBackendStats(
+                name=backend.name,
+                state=backend.breaker.state,
+                outstanding=backend.outstanding,
+                requests=backend.requests,
+                failures=backend.failures,
+            )
+            for backend in self._backends
+        ]
+
+    @property
+    def hedged(self) -> int:
+        return self._hedged
+
+    def hedge_delay(self) -> float | None:
+        """Get how long a request runs before it is hedged.
+
+        Returns:
+            The delay in seconds, None while hedging is disabled or too few
+            latencies have been observed.
+        """
+        config = self._config
+        if not config.hedge or len(self._latencies) < config.hedge_min_samples:
+            return None
+
+        ordered = sorted(self._latencies)
+        rank = math.ceil(config.hedge_percentile * len(ordered)) - 1
+        return max(ordered[max(rank, 0)], config.hedge_min_delay_seconds)
+
+    async def _transcribe(
+        self,
+        audio: Audio,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+    ) -> Transcription:
+        attempts: set[asyncio.Task[Transcription]] = set()
+        tried: set[str] = set()
+        errors: list[BaseException] = []
+
+        def _launch() -> bool:
+            backend = self._pick(tried)
+            if backend is None:
+                return False
+            tried.add(backend.name)
+            attempts.add(self._start(backend, audio, target_language, prompt))
+            return True
+
+        if not _launch():
+            raise NoBackendAvailableError(len(self._backends))
+
+        hedging = True
+        try:
+            while attempts:
+                timeout = None
+                if hedging and len(tried) < self._config.max_attempts:
+                    timeout = self.hedge_delay()
+                done, _ = await asyncio.wait(
+                    attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Slower than usual, race it against another backend
+                    hedging = _launch()
+                    if hedging:
+                        self._hedged += 1
+                    continue
+
+                for task in done:
+                    attempts.discard(task)
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    errors.append(error)
+
+                if not attempts and len(tried) < self._config.max_attempts:
+                    _launch()
+        finally:
+            for task in attempts:
+                task.cancel()
+            if attempts:
+                await asyncio.wait(attempts)
+
+        raise errors[-1]
+
+    def _pick(self, excluded: set[str]) -> _Backend | None:
+        candidates = [
+            backend
+            for backend in self._backends
+            if backend.name not in excluded and backend.breaker.available
+        ]
+        if not candidates:
+            return None
+
+        backend = min(candidates, key=lambda b: (b.outstanding, b.requests))
+        return backend if backend.breaker.allow() else None
+
+    def _start(
+        self,
+        backend: _Backend,
+        audio: Audio,
+        target_language: Language | None,
+        prompt: str | None,
+    ) -> asyncio.Task[Transcription]:
+        # Counted before the task runs, so concurrent picks see each other
+        backend.outstanding += 1
+        backend.requests += 1
+        task = asyncio.create_task(self._call(backend, audio, target_language, prompt))
+        task.add_done_callback(lambda task: self._finish(backend, task))
+        return task
+
+    def _finish(self, backend: _Backend, task: asyncio.Task[Transcription]) -> None:
+        backend.outstanding -= 1
+        if task.cancelled():
+            # Lost a race, says nothing about the backend's health
+            backend.breaker.release()
+
+    async def _call(
+        self,
+        backend: _Backend,
+        audio: Audio,
+        target_language: Language | None,
+        prompt: str | None,
+    ) -> Transcription:
+        started_at = time.monotonic()
+        try:
+            transcription = await backend.speech_to_text.transcribe(
+                audio, target_language, prompt
+            )
+        except Exception:
+            backend.failures += 1
+            backend.breaker.record_failure()
+            raise
+
+        backend.breaker.record_success()
+        self._latencies.append(time.monotonic() - started_at)
+        return transcription
@@ -1,10 +1,13 @@
 from ...shared.supported import Language
 from ...shared.data import Audio, Transcription, AudioExtension, SubtitleExtension
+from ...shared.http import HTTPTransport
 from ..abstract import SpeechToText
+from ..exception import RunpodHTTPError
+from ..object_store import ObjectStore
+from ..runpod import RunpodClient
+from ..upload import AudioFields, create_audio_uploader
 
 from dataclasses import dataclass, field
-from aiohttp import ClientSession
-from base64 import b64encode
 
 
 @dataclass(frozen=True)
@@ -23,6 +26,10 @@ class RunpodWhisperConfig:
     compression_ratio_threshold: float = field(default=2.4)
     logprob_threshold: float = field(default=-1.0)
     no_speech_threshold: float = field(default=0.6)
+    # Submission mode and polling of Runpod jobs, see RunpodJobConfig
+    job: dict = field(default_factory=dict)
+    # How the audio is sent, see AudioUploaderConfig
+    upload: dict = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -40,14 +47,24 @@ class RunpodWhisper(SpeechToText):
         AudioExtension.MP3,
         AudioExtension.OGG,
         AudioExtension.WAV,
+        AudioExtension.FLAC,
+        AudioExtension.OPUS,
     )
     _output_subtitle_extension = SubtitleExtension.VTT
+    _audio_fields = AudioFields(base64="audio_base64", url="audio")
 
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        transport: HTTPTransport,
+        object_store: ObjectStore | None = None,
+    ):
         """Initialize RunpodWhisper with configuration.
 
         Args:
             config: Dictionary containing api_key, endpoint, and other parameters.
+            transport: Shared HTTPTransport, closed by its owner.
+            object_store: Store for presigned URL uploads.
 
         Raises:
             ValueError: If required configuration keys are missing or empty.
@@ -61,12 +78,16 @@ class RunpodWhisper(SpeechToText):
         if not self._config.model:
             raise ValueError("model must be provided in the configuration.")
 
-        self._session = ClientSession(
-            base_url=self._config.endpoint,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": self._config.api_key,
-            },
+        self._transport = transport
+        self._uploader = create_audio_uploader(
+            self._config.upload, self._transport, object_store
+        )
+        self._client = RunpodClient(
+            self._config.api_key,
+            self._config.endpoint,
+            self._transport,
+            self._config.job,
+            self._uploader,
         )
 
     async def _transcribe(
@@ -77,7 +98,6 @@ class RunpodWhisper(SpeechToText):
     ) -> Transcription:
         config = self._config
         input = {
-            "audio_base64": b64encode(audio.binary).decode("utf-8"),
             "model": config.model,
             "language": target_language.value if target_language else None,
             "transcription": "vtt",
@@ -97,21 +117,18 @@ class RunpodWhisper(SpeechToText):
         temperature_increment_on_fallback = config.temperature_increment_on_fallback
         input["temperature_increment_on_fallback"] = temperature_increment_on_fallback
 
-        response = await self._session.post(
-            "/runsync",
-            json={"input": input},
-        )
-
-        if response.status != 200:
-            raise RuntimeError(f"Failed to transcribe audio: {response.status}")
+        try:
+            output = await self._client.run(input, audio, self._audio_fields)
+        except RunpodHTTPError as e:
+            raise RuntimeError(f"Failed to transcribe audio: {e.status}") from e
 
-        data = RunpodWhisperResponse(**(await response.json())["output"])
+        data = RunpodWhisperResponse(**output)
         language = target_language
-        try:
-            if not target_language:
-                Language(data.detected_language)
-        except ValueError:
-            language = None
+        if not target_language:
+            try:
+                language = Language(data.detected_language)
+            except ValueError:
+                language = None
 
         return Transcription(
             content=data.transcription,
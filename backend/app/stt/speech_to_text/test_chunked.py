@@ -0,0 +1,162 @@
+from ...shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from ...shared.supported import Language
+from ...shared.vtt import Cue, format_vtt, parse_vtt
+from ..abstract import SpeechToText
+from ..pcm import PCMAudio
+from .chunked import ChunkedSpeechToText
+
+import asyncio
+import io
+import wave
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+class SecondsSpeechToText(SpeechToText):
+    """Emits one half-second cue at every whole second of the received audio."""
+
+    _supported_audio_extensions = (AudioExtension.WAV, AudioExtension.MP3)
+    _output_subtitle_extension = SubtitleExtension.VTT
+
+    def __init__(self, config: dict):
+        self.languages = config.get("languages", [])
+        self.received: list[Audio] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def _transcribe(
+        self,
+        audio: Audio,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+    ) -> Transcription:
+        self.received.append(audio)
+        language = target_language
+        if language is None and self.languages:
+            language = self.languages[(len(self.received) - 1) % len(self.languages)]
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+
+        seconds = 0
+        if audio.extension == AudioExtension.WAV:
+            with wave.open(io.BytesIO(audio.binary)) as wav:
+                seconds = int(wav.getnframes() / wav.getframerate())
+        cues = [Cue(start=s, end=s + 0.5, text="word") for s in range(seconds)]
+        return Transcription(
+            content=format_vtt(cues),
+            extension=self._output_subtitle_extension,
+            language=language,
+        )
+
+
+def _pcm(seconds: float) -> PCMAudio:
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-8000, 8000, int(seconds * 16000)).astype(np.int16)
+    return PCMAudio(samples=samples)
+
+
+@pytest.fixture
+def mp3_audio():
+    return Audio(binary=b"mp3_audio_data", extension=AudioExtension.MP3)
+
+
+def test_invalid_overlap():
+    with pytest.raises(ValueError, match="overlap_seconds must be less than half"):
+        ChunkedSpeechToText(
+            {"window_seconds": 10, "overlap_seconds": 5}, SecondsSpeechToText({})
+        )
+
+
+def test_requires_vtt_output():
+    srt = SecondsSpeechToText({})
+    srt._output_subtitle_extension = SubtitleExtension.SRT
+    with pytest.raises(ValueError, match="requires a WebVTT output"):
+        ChunkedSpeechToText({}, srt)
+
+
+def test_plan_fixed_windows():
+    stt = ChunkedSpeechToText(
+        {"window_seconds": 10, "overlap_seconds": 1, "split_on_silence": False},
+        SecondsSpeechToText({}),
+    )
+    assert stt.plan_cuts(_pcm(25)) == [0.0, 10.0, 20.0, 25.0]
+    assert stt.plan_cuts(_pcm(10)) == [0.0, 10.0]
+
+
+def test_plan_cuts_at_silence():
+    pcm = _pcm(25)
+    # Silence between 8.0s and 8.2s, inside the search range before 10s
+    pcm.samples[8 * 16000 : int(8.2 * 16000)] = 0
+    stt = ChunkedSpeechToText(
+        {"window_seconds": 10, "overlap_seconds": 1, "silence_search_seconds": 3},
+        SecondsSpeechToText({}),
+    )
+
+    cuts = stt.plan_cuts(pcm)
+
+    assert 8.0 <= cuts[1] <= 8.2
+    assert cuts[-1] == 25.0
+    assert all(b - a <= 10 for a, b in zip(cuts, cuts[1:], strict=False))
+
+
+@pytest.mark.asyncio
+async def test_short_audio_is_sent_unchanged(mp3_audio: Audio):
+    inner = SecondsSpeechToText({})
+    stt = ChunkedSpeechToText({"window_seconds": 10, "overlap_seconds": 1}, inner)
+
+    with patch(
+        "app.stt.speech_to_text.chunked.decode_pcm",
+        AsyncMock(return_value=_pcm(5)),
+    ):
+        await stt.transcribe(mp3_audio)
+
+    assert inner.received == [mp3_audio]
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_stitched_without_duplicates(mp3_audio: Audio):
+    inner = SecondsSpeechToText({})
+    stt = ChunkedSpeechToText(
+        {
+            "window_seconds": 10,
+            "overlap_seconds": 2,
+            "split_on_silence": False,
+            "max_concurrency": 2,
+        },
+        inner,
+    )
+
+    with patch(
+        "app.stt.speech_to_text.chunked.decode_pcm",
+        AsyncMock(return_value=_pcm(45)),
+    ):
+        result = await stt.transcribe(mp3_audio, Language.english, "prompt")
+
+    assert len(inner.received) == 5
+    assert inner.max_running == 2
+    assert result.extension == SubtitleExtension.VTT
+    assert result.language == Language.english
+    cues = parse_vtt(result.content)
+    assert [cue.start for cue in cues] == [float(s) for s in range(45)]
+
+
+@pytest.mark.asyncio
+async def test_language_is_voted_across_chunks(mp3_audio: Audio):
+    inner = SecondsSpeechToText(
+        {"languages": [Language.korean, Language.korean, Language.english]}
+    )
+    stt = ChunkedSpeechToText(
+        {"window_seconds": 10, "overlap_seconds": 0, "split_on_silence": False},
+        inner,
+    )
+
+    with patch(
+        "app.stt.speech_to_text.chunked.decode_pcm",
+        AsyncMock(return_value=_pcm(30)),
+    ):
+        result = await stt.transcribe(mp3_audio)
+
+    assert result.language == Language.korean
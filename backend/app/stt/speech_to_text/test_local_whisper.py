@@ -0,0 +1,108 @@
+from ...shared.data import Audio, AudioExtension, SubtitleExtension
+from ...shared.supported import Language
+from ...shared.vtt import parse_vtt
+from .. import process_pool
+from ..pcm import PCMAudio
+from . import local_whisper
+from .local_whisper import LocalWhisper
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+
+
+class FakeWhisperModel:
+    def __init__(self, detected_language: str = "ja"):
+        self.detected_language = detected_language
+        self.calls: list[dict] = []
+
+    def transcribe(self, audio: np.ndarray, **kwargs):
+        self.calls.append({"samples": len(audio), **kwargs})
+        segments = (
+            SimpleNamespace(start=0.0, end=0.5, text=" first"),
+            SimpleNamespace(start=0.5, end=1.0, text=" second "),
+        )
+        return iter(segments), SimpleNamespace(language=self.detected_language)
+
+
+@pytest.fixture
+def models(monkeypatch):
+    created: list[FakeWhisperModel] = []
+
+    def _create_model(options):
+        created.append(FakeWhisperModel())
+        return created[-1]
+
+    monkeypatch.setattr(process_pool, "_loaded", {})
+    monkeypatch.setattr(local_whisper, "_create_model", _create_model)
+    # Decoding is covered by the pcm tests and needs ffmpeg
+    pcm = PCMAudio(samples=np.zeros(16000, dtype=np.int16))
+    monkeypatch.setattr(local_whisper, "decode_pcm", AsyncMock(return_value=pcm))
+    return created
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def audio():
+    return Audio(binary=b"mp3_audio_data", extension=AudioExtension.MP3)
+
+
+@pytest.mark.asyncio
+async def test_transcribes_to_vtt_with_detected_language(models, executor, audio):
+    whisper = LocalWhisper({"model": "tiny"}, executor)
+
+    transcription = await whisper.transcribe(audio)
+
+    assert transcription.extension == SubtitleExtension.VTT
+    assert transcription.language == Language.japanese
+    assert [
+        (cue.start, cue.end, cue.text) for cue in parse_vtt(transcription.content)
+    ] == [
+        (0.0, 0.5, "first"),
+        (0.5, 1.0, "second"),
+    ]
+    assert models[0].calls[0]["samples"] == 16000
+
+
+@pytest.mark.asyncio
+async def test_honors_target_language_and_prompt(models, executor, audio):
+    whisper = LocalWhisper({"model": "tiny", "beam_size": 2}, executor)
+
+    transcription = await whisper.transcribe(audio, Language.korean, "lyrics")
+
+    assert transcription.language == Language.korean
+    call = models[0].calls[0]
+    assert call["language"] == "ko"
+    assert call["initial_prompt"] == "lyrics"
+    assert call["beam_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_model_is_loaded_once_per_process(models, executor, audio):
+    whisper = LocalWhisper({"model": "tiny"}, executor)
+
+    await whisper.transcribe(audio)
+    await whisper.transcribe(audio)
+
+    assert len(models) == 1
+    assert len(models[0].calls) == 2
+
+
+def test_accepts_any_audio_extension():
+    assert LocalWhisper({}).supported_audio_extensions == tuple(AudioExtension)
+
+
+def test_invalid_config_is_rejected():
+    with pytest.raises(ValueError, match="processes"):
+        LocalWhisper({"processes": 0})
+    with pytest.raises(ValueError, match="model"):
+        LocalWhisper({"model": ""})
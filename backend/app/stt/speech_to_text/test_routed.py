@@ -0,0 +1,174 @@
+from ...shared.circuit_breaker import CircuitState
+from ...shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from ...shared.supported import Language
+from ..abstract import SpeechToText
+from ..exception import NoBackendAvailableError
+from .routed import RoutedSpeechToText
+
+import asyncio
+import pytest
+
+
+class DelayedSpeechToText(SpeechToText):
+    """Answers with its name after a delay, or fails when told to."""
+
+    _supported_audio_extensions = (AudioExtension.WAV, AudioExtension.MP3)
+    _output_subtitle_extension = SubtitleExtension.VTT
+
+    def __init__(self, config: dict):
+        self.name = config["name"]
+        self.delay = config.get("delay", 0.0)
+        self.fail = config.get("fail", False)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def _transcribe(
+        self,
+        audio: Audio,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+    ) -> Transcription:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return Transcription(
+            content=self.name,
+            extension=self._output_subtitle_extension,
+            language=target_language,
+        )
+
+
+@pytest.fixture
+def audio():
+    return Audio(binary=b"wav_audio_data", extension=AudioExtension.WAV)
+
+
+def _backends(*configs: dict) -> list[DelayedSpeechToText]:
+    return [
+        DelayedSpeechToText({"name": f"backend-{i}"} | config)
+        for i, config in enumerate(configs)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_requests_go_to_the_least_outstanding_backend(audio):
+    backends = _backends({"delay": 0.05}, {"delay": 0.05}, {"delay": 0.05})
+    router = RoutedSpeechToText({"hedge": False}, backends)
+
+    await asyncio.gather(*(router.transcribe(audio) for _ in range(6)))
+
+    assert [backend.calls for backend in backends] == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_to_another_backend(audio):
+    backends = _backends({"delay": 0.01}, {"delay": 0.01})
+    router = RoutedSpeechToText(
+        {"hedge_min_samples": 4, "hedge_min_delay_seconds": 0.02}, backends
+    )
+    for _ in range(4):
+        await router.transcribe(audio)
+    assert router.hedge_delay() == pytest.approx(0.02)
+
+    # The next request goes to backend-0, which is cold starting
+    backends[0].delay = 1.0
+    transcription = await router.transcribe(audio)
+
+    assert transcription.content == "backend-1"
+    assert router.hedged == 1
+    assert backends[0].cancelled == 1
+    assert all(stats.outstanding == 0 for stats in router.stats)
+
+
+@pytest.mark.asyncio
+async def test_no_hedging_before_enough_latencies_are_known(audio):
+    backends = _backends({"delay": 0.05}, {"delay": 0.0})
+    router = RoutedSpeechToText({"hedge_min_samples": 10}, backends)
+
+    transcription = await router.transcribe(audio)
+
+    assert transcription.content == "backend-0"
+    assert router.hedge_delay() is None
+    assert backends[1].calls == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_request_fails_over(audio):
+    backends = _backends({"fail": True}, {})
+    router = RoutedSpeechToText({}, backends)
+
+    transcription = await router.transcribe(audio)
+
+    assert transcription.content == "backend-1"
+    assert [stats.failures for stats in router.stats] == [1, 0]
+
+
+@pytest.mark.asyncio
+async def test_last_error_is_raised_when_every_attempt_fails(audio):
+    router = RoutedSpeechToText({}, _backends({"fail": True}, {"fail": True}))
+
+    with pytest.raises(RuntimeError, match="failed"):
+        await router.transcribe(audio)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_the_backend(audio):
+    backends = _backends({"fail": True}, {})
+    router = RoutedSpeechToText(
+        {
+            "max_attempts": 1,
+            "circuit_breaker": {"failure_threshold": 1, "recovery_seconds": 60},
+        },
+        backends,
+    )
+
+    with pytest.raises(RuntimeError):
+        await router.transcribe(audio)
+    assert router.stats[0].state == CircuitState.open
+
+    for _ in range(3):
+        assert (await router.transcribe(audio)).content == "backend-1"
+    assert backends[0].calls == 1
+
+
+@pytest.mark.asyncio
+async def test_all_circuits_open_raises(audio):
+    router = RoutedSpeechToText(
+        {"circuit_breaker": {"failure_threshold": 1, "recovery_seconds": 60}},
+        _backends({"fail": True}),
+    )
+    with pytest.raises(RuntimeError):
+        await router.transcribe(audio)
+
+    with pytest.raises(NoBackendAvailableError):
+        await router.transcribe(audio)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_cancels_every_attempt(audio):
+    backends = _backends({"delay": 1.0})
+    router = RoutedSpeechToText({}, backends)
+
+    task = asyncio.create_task(router.transcribe(audio))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert backends[0].cancelled == 1
+    assert router.stats[0].outstanding == 0
+
+
+def test_backends_must_share_extensions():
+    class SRTSpeechToText(DelayedSpeechToText):
+        _output_subtitle_extension = SubtitleExtension.SRT
+
+    with pytest.raises(ValueError, match="subtitle extension"):
+        RoutedSpeechToText({}, [*_backends({}), SRTSpeechToText({"name": "srt"})])
+    with pytest.raises(ValueError, match="At least one backend"):
+        RoutedSpeechToText({}, [])
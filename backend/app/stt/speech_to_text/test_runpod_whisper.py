@@ -1,15 +1,24 @@
 from ...shared.data import Audio, AudioExtension, SubtitleExtension
+from ...shared.http import HTTPTransport
+from ...shared.supported import Language
 from .runpod_whisper import (
     RunpodWhisper,
     RunpodWhisperConfig,
     RunpodWhisperResponse,
 )
 
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest import mock
 
 
+def _mock_request(response: mock.Mock) -> mock.MagicMock:
+    request = mock.MagicMock()
+    request.return_value.__aenter__.return_value = response
+    return request
+
+
 @pytest.fixture
 def valid_config():
     return {
@@ -131,7 +140,7 @@ def test_response_creation_with_valid_data(valid_response):
     assert valid_response.detected_language == "en"
 
 
-def test_response_is_frozen(valid_response):
+def test_response_is_frozen(valid_response, transport):
     with pytest.raises(AttributeError):
         valid_response.transcription = "new transcription"
     with pytest.raises(AttributeError):
@@ -141,30 +150,36 @@ def test_response_is_frozen(valid_response):
 # Test cases for RunpodWhisper class methods
 
 
+@pytest.fixture
+def transport():
+    # The session is only opened by a request, the tests mock them
+    return HTTPTransport()
+
+
 @pytest_asyncio.fixture
-async def runpod_whisper(valid_config):
-    return RunpodWhisper(config=valid_config)
+async def runpod_whisper(valid_config, transport):
+    return RunpodWhisper(config=valid_config, transport=transport)
 
 
-def test_missing_api_key_raises_error(invalid_config_missing_api_key):
+def test_missing_api_key_raises_error(invalid_config_missing_api_key, transport):
     with pytest.raises(
         ValueError, match="api_key must be provided in the configuration."
     ):
-        RunpodWhisper(invalid_config_missing_api_key)
+        RunpodWhisper(invalid_config_missing_api_key, transport)
 
 
-def test_missing_endpoint_raises_error(invalid_config_missing_endpoint):
+def test_missing_endpoint_raises_error(invalid_config_missing_endpoint, transport):
     with pytest.raises(
         ValueError, match="endpoint must be provided in the configuration."
     ):
-        RunpodWhisper(invalid_config_missing_endpoint)
+        RunpodWhisper(invalid_config_missing_endpoint, transport)
 
 
-def test_missing_model_raises_error(invalid_config_missing_model):
+def test_missing_model_raises_error(invalid_config_missing_model, transport):
     with pytest.raises(
         ValueError, match="model must be provided in the configuration."
     ):
-        RunpodWhisper(invalid_config_missing_model)
+        RunpodWhisper(invalid_config_missing_model, transport)
 
 
 @pytest.mark.asyncio
@@ -173,6 +188,8 @@ async def test_supported_audio_extensions(runpod_whisper):
         AudioExtension.MP3,
         AudioExtension.OGG,
         AudioExtension.WAV,
+        AudioExtension.FLAC,
+        AudioExtension.OPUS,
     )
     assert runpod_whisper._supported_audio_extensions == expected_extensions
 
@@ -197,18 +214,62 @@ async def test_transcribe_success_with_mp3(runpod_whisper, mp3_audio):
         }
     )
 
-    runpod_whisper._session.post = mock.AsyncMock(return_value=mock_response)
+    runpod_whisper._transport.request = _mock_request(mock_response)
 
     transcription = await runpod_whisper.transcribe(mp3_audio)
     assert transcription.content == "This is a test transcription."
     assert transcription.extension == SubtitleExtension.VTT
 
+    method, endpoint, path = runpod_whisper._transport.request.call_args.args
+    assert (method, endpoint, path) == (
+        "POST",
+        "https://api.runpod.io/test/",
+        "/runsync",
+    )
+    assert runpod_whisper._transport.request.call_args.kwargs["headers"] == {
+        "Content-Type": "application/json",
+        "Authorization": "test_api_key",
+    }
+
 
 @pytest.mark.asyncio
 async def test_transcribe_api_error(runpod_whisper, mp3_audio):
     mock_response = mock.Mock()
     mock_response.status = 500
 
-    runpod_whisper._session.post = mock.AsyncMock(return_value=mock_response)
+    runpod_whisper._transport.request = _mock_request(mock_response)
     with pytest.raises(RuntimeError, match="Failed to transcribe audio: 500"):
         await runpod_whisper.transcribe(mp3_audio)
+
+
+@pytest.mark.asyncio
+async def test_transcribe_against_fake_runpod_in_run_mode(
+    valid_config, mp3_audio, start_fake_runpod
+):
+    async def _whisper(input: dict) -> dict:
+        assert input["audio_base64"] == "bXAzX2F1ZGlvX2RhdGE="
+        await asyncio.sleep(0.02)
+        return {
+            "segments": [],
+            "transcription": "WEBVTT\n",
+            "detected_language": "ko",
+            "model": input["model"],
+        }
+
+    fake_runpod = await start_fake_runpod(_whisper)
+    transport = HTTPTransport()
+    runpod_whisper = RunpodWhisper(
+        valid_config
+        | {
+            "endpoint": fake_runpod.endpoint,
+            "job": {"mode": "run", "poll_initial_seconds": 0.01},
+        },
+        transport,
+    )
+
+    transcription = await runpod_whisper.transcribe(mp3_audio)
+    await transport.close()
+
+    assert transcription.content == "WEBVTT\n"
+    assert transcription.language == Language.korean
+    assert fake_runpod.requests[0] == "POST /run"
@@ -0,0 +1,117 @@
+from ...shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from ...shared.supported import Language
+from ...shared.vtt import Cue, format_vtt, parse_vtt
+from ..abstract import SpeechToText
+from ..pcm import PCMAudio
+from .trimmed import TrimmedSpeechToText
+
+import io
+import wave
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+class RecordingSpeechToText(SpeechToText):
+    """Emits one cue per second of the received WAV audio."""
+
+    _supported_audio_extensions = (AudioExtension.WAV, AudioExtension.MP3)
+    _output_subtitle_extension = SubtitleExtension.VTT
+
+    def __init__(self, config: dict):
+        self.received: list[Audio] = []
+
+    async def _transcribe(
+        self,
+        audio: Audio,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+    ) -> Transcription:
+        self.received.append(audio)
+        seconds = 0
+        if audio.extension == AudioExtension.WAV:
+            with wave.open(io.BytesIO(audio.binary)) as wav:
+                seconds = int(wav.getnframes() / wav.getframerate())
+        cues = [Cue(start=s, end=s + 0.5, text="word") for s in range(seconds)]
+        return Transcription(
+            content=format_vtt(cues),
+            extension=self._output_subtitle_extension,
+            language=target_language or Language.korean,
+        )
+
+
+def _track(*spans: tuple[float, float], seconds: float = 60) -> PCMAudio:
+    rng = np.random.default_rng(0)
+    samples = np.zeros(int(seconds * 16000), dtype=np.int16)
+    for start, end in spans:
+        first, last = int(start * 16000), int(end * 16000)
+        samples[first:last] = rng.integers(-8000, 8000, last - first)
+    return PCMAudio(samples=samples)
+
+
+@pytest.fixture
+def mp3_audio():
+    return Audio(binary=b"mp3_audio_data", extension=AudioExtension.MP3)
+
+
+def _trimmed(inner: SpeechToText, **config) -> TrimmedSpeechToText:
+    config.setdefault("voice_activity", {"padding_seconds": 0})
+    return TrimmedSpeechToText(config, inner)
+
+
+def test_requires_vtt_output():
+    srt = RecordingSpeechToText({})
+    srt._output_subtitle_extension = SubtitleExtension.SRT
+    with pytest.raises(ValueError, match="requires a WebVTT output"):
+        TrimmedSpeechToText({}, srt)
+
+
+@pytest.mark.asyncio
+async def test_sends_voiced_regions_in_original_time(mp3_audio: Audio):
+    inner = RecordingSpeechToText({})
+    stt = _trimmed(inner, gap_seconds=1)
+
+    with patch(
+        "app.stt.speech_to_text.trimmed.decode_pcm",
+        AsyncMock(return_value=_track((10, 15), (40, 43))),
+    ):
+        result = await stt.transcribe(mp3_audio, Language.english)
+
+    # 5 + 1 + 3 seconds instead of 60
+    assert len(inner.received) == 1
+    with wave.open(io.BytesIO(inner.received[0].binary)) as wav:
+        assert wav.getnframes() / wav.getframerate() == pytest.approx(9, abs=0.05)
+
+    assert result.language == Language.english
+    starts = [cue.start for cue in parse_vtt(result.content)]
+    assert starts == pytest.approx([10, 11, 12, 13, 14, 15, 40, 41, 42], abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_silent_audio_is_not_sent(mp3_audio: Audio):
+    inner = RecordingSpeechToText({})
+    stt = _trimmed(inner)
+
+    with patch(
+        "app.stt.speech_to_text.trimmed.decode_pcm",
+        AsyncMock(return_value=_track()),
+    ):
+        result = await stt.transcribe(mp3_audio, Language.japanese)
+
+    assert inner.received == []
+    assert parse_vtt(result.content) == []
+    assert result.language == Language.japanese
+
+
+@pytest.mark.asyncio
+async def test_small_savings_send_original(mp3_audio: Audio):
+    inner = RecordingSpeechToText({})
+    stt = _trimmed(inner, min_trimmed_seconds=10)
+
+    with patch(
+        "app.stt.speech_to_text.trimmed.decode_pcm",
+        AsyncMock(return_value=_track((2, 58))),
+    ):
+        await stt.transcribe(mp3_audio)
+
+    assert inner.received == [mp3_audio]
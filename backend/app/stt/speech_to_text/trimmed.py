@@ -0,0 +1,105 @@
+from ...shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from ...shared.supported import Language
+from ...shared.vtt import format_vtt, parse_vtt
+from ..abstract import SpeechToText
+from ..pcm import decode_pcm
+from ..vad import TrimmedTimeline, VoiceActivityDetector
+
+import logging
+from dataclasses import dataclass, field, replace
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TrimmedSpeechToTextConfig:
+    # Silence between the voiced regions, keeps words of different lines apart
+    gap_seconds: float = field(default=0.5)
+    # Trimming less than this sends the original encoding instead
+    min_trimmed_seconds: float = field(default=10.0)
+    # Configuration of the VoiceActivityDetector
+    voice_activity: dict = field(default_factory=dict)
+
+
+class TrimmedSpeechToText(SpeechToText):
+    """Sends only the voiced regions of a vocal stem to another STT.
+
+    Instrumental intros, outros and breaks are found by a
+    VoiceActivityDetector and cut; the remaining regions are concatenated
+    with a short silence between them and transcribed in one request. The
+    returned cues are then mapped back to the time of the original track.
+    Audio without any voice is not sent at all.
+    """
+
+    # Any input is decoded to PCM by ffmpeg before trimming
+    _supported_audio_extensions = tuple(AudioExtension)
+    _output_subtitle_extension = SubtitleExtension.VTT
+
+    def __init__(self, config: dict, speech_to_text: SpeechToText):
+        """Initialize TrimmedSpeechToText with configuration.
+
+        Args:
+            config: Dictionary containing gap_seconds, min_trimmed_seconds and
+                voice_activity, the configuration of the VoiceActivityDetector.
+            speech_to_text: The speech to text service transcribing the
+                voiced regions.
+
+        Raises:
+            ValueError: If the configuration is inconsistent or the wrapped
+                service does not produce WebVTT.
+        """
+        self._config = TrimmedSpeechToTextConfig(**config)
+        if self._config.gap_seconds < 0:
+            raise ValueError("gap_seconds must not be negative.")
+        if speech_to_text.output_subtitle_extension != SubtitleExtension.VTT:
+            raise ValueError("Trimmed transcription requires a WebVTT output.")
+
+        self._detector = VoiceActivityDetector(self._config.voice_activity)
+        self._speech_to_text = speech_to_text
+
+    @property
+    def detector(self) -> VoiceActivityDetector:
+        return self._detector
+
+    async def _transcribe(
+        self,
+        audio: Audio,
+        target_language: Language | None = None,
+        prompt: str | None = None,
+    ) -> Transcription:
+        pcm = await decode_pcm(audio)
+        regions = self._detector.detect(pcm)
+        if not regions:
+            # Nothing is sung, there is nothing to pay for
+            return Transcription(
+                content=format_vtt([]),
+                extension=self.output_subtitle_extension,
+                language=target_language,
+            )
+
+        timeline = TrimmedTimeline.concatenate(regions, self._config.gap_seconds)
+        trimmed = pcm.duration_seconds - timeline.voiced_seconds
+        if trimmed < self._config.min_trimmed_seconds:
+            return await self._speech_to_text.transcribe(audio, target_language, prompt)
+
+        logger.info(
+            f"Trimmed {trimmed:.1f}s of {pcm.duration_seconds:.1f}s "
+            f"in {len(regions)} voiced regions"
+        )
+        voiced = timeline.render(pcm).to_wav()
+        transcription = await self._speech_to_text.transcribe(
+            voiced, target_language, prompt
+        )
+        cues = [
+            replace(
+                cue,
+                start=timeline.to_original(cue.start),
+                end=timeline.to_original(cue.end),
+            )
+            for cue in parse_vtt(transcription.content)
+        ]
+        return Transcription(
+            content=format_vtt(cues),
+            extension=self.output_subtitle_extension,
+            language=transcription.language,
+        )
@@ -1,4 +1,10 @@
-from ..shared.data import Audio, Transcription, AudioExtension, SubtitleExtension
+from ..shared.data import (
+    Audio,
+    AudioStream,
+    Transcription,
+    AudioExtension,
+    SubtitleExtension,
+)
 from ..shared.supported import Language
 from .abstract import _AudioWorker, BackgroundRemover, SpeechToText
 
@@ -114,6 +120,35 @@ class TestAudioWorker:
             )
             assert result == expected_audio
 
+    @pytest.mark.asyncio
+    async def test_convert_audio_stream_with_supported_format(
+        self, audio_worker: ConcreteAudioWorker, mp3_audio: Audio
+    ):
+        with patch("app.stt.abstract.convert_audio_stream") as mock_convert:
+            result = await audio_worker._convert_audio(
+                AudioStream.from_audio(mp3_audio, chunk_size=3)
+            )
+
+            mock_convert.assert_not_called()
+            assert result == mp3_audio
+
+    @pytest.mark.asyncio
+    async def test_convert_audio_stream_with_unsupported_format(
+        self, audio_worker: ConcreteAudioWorker, aac_audio: Audio
+    ):
+        converted_audio = Audio(binary=b"converted_data", extension=AudioExtension.MP3)
+        origin_stream = AudioStream.from_audio(aac_audio)
+
+        with patch("app.stt.abstract.convert_audio_stream") as mock_convert:
+            mock_convert.return_value = AudioStream.from_audio(converted_audio)
+
+            result = await audio_worker._convert_audio(origin_stream)
+
+            mock_convert.assert_called_once_with(
+                origin_stream=origin_stream, target_extension=AudioExtension.MP3
+            )
+            assert result == converted_audio
+
 
 class TestBackgroundRemover:
     def test_abstract_class_cannot_be_instantiated(self):
@@ -0,0 +1,111 @@
+from ..shared.data import Audio, AudioExtension
+from .cache import AudioCache, content_hash
+
+import asyncio
+import os
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path) -> AudioCache:
+    return AudioCache({"directory": str(tmp_path), "max_bytes": 10})
+
+
+def test_missing_directory_raises_error():
+    with pytest.raises(ValueError, match="directory must be provided"):
+        AudioCache({"directory": ""})
+
+
+def test_invalid_max_bytes_raises_error(tmp_path):
+    with pytest.raises(ValueError, match="max_bytes must be a positive integer"):
+        AudioCache({"directory": str(tmp_path), "max_bytes": 0})
+
+
+def test_key_depends_on_every_part():
+    source = content_hash(b"audio")
+    assert AudioCache.key(source, "wav") == AudioCache.key(source, "wav")
+    assert AudioCache.key(source, "wav") != AudioCache.key(source, "ogg")
+    assert AudioCache.key(source, "wav") != AudioCache.key(content_hash(b"x"), "wav")
+
+
+@pytest.mark.asyncio
+async def test_put_and_get(cache: AudioCache):
+    audio = Audio(binary=b"abc", extension=AudioExtension.WAV)
+
+    assert await cache.get("key") is None
+    await cache.put("key", audio)
+
+    assert await cache.get("key") == audio
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.entries == 1
+    assert stats.total_bytes == 3
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_by_bytes(cache: AudioCache):
+    await cache.put("first", Audio(binary=b"1111", extension=AudioExtension.WAV))
+    await cache.put("second", Audio(binary=b"2222", extension=AudioExtension.WAV))
+    # Touch the first entry so the second one becomes the eviction candidate
+    await cache.get("first")
+    await cache.put("third", Audio(binary=b"3333", extension=AudioExtension.OGG))
+
+    assert await cache.get("second") is None
+    assert await cache.get("first") is not None
+    assert await cache.get("third") is not None
+    assert cache.stats.evictions == 1
+    assert cache.stats.total_bytes == 8
+
+
+@pytest.mark.asyncio
+async def test_audio_larger_than_budget_is_not_stored(cache: AudioCache):
+    await cache.put("large", Audio(binary=b"x" * 11, extension=AudioExtension.WAV))
+
+    assert await cache.get("large") is None
+    assert cache.stats.entries == 0
+
+
+@pytest.mark.asyncio
+async def test_entries_survive_restart_in_recency_order(tmp_path):
+    config = {"directory": str(tmp_path), "max_bytes": 10}
+    cache = AudioCache(config)
+    await cache.put("old", Audio(binary=b"1111", extension=AudioExtension.WAV))
+    await cache.put("new", Audio(binary=b"2222", extension=AudioExtension.MP3))
+    os.utime(tmp_path / "old.wav", (1, 1))
+
+    restarted = AudioCache(config)
+    assert restarted.stats.entries == 2
+    await restarted.put("next", Audio(binary=b"3333", extension=AudioExtension.WAV))
+
+    assert await restarted.get("old") is None
+    assert await restarted.get("new") == Audio(
+        binary=b"2222", extension=AudioExtension.MP3
+    )
+
+
+@pytest.mark.asyncio
+async def test_file_removed_externally_is_a_miss(cache: AudioCache, tmp_path):
+    await cache.put("key", Audio(binary=b"abc", extension=AudioExtension.WAV))
+    (tmp_path / "key.wav").unlink()
+
+    assert await cache.get("key") is None
+    assert cache.stats.entries == 0
+    assert cache.stats.total_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_puts_of_the_same_key(cache: AudioCache, tmp_path):
+    await asyncio.gather(
+        *(
+            cache.put("key", Audio(binary=bytes([i]) * 3, extension=AudioExtension.WAV))
+            for i in range(8)
+        )
+    )
+
+    audio = await cache.get("key")
+    assert audio is not None
+    assert len(audio.binary) == 3
+    assert cache.stats.total_bytes == 3
+    # No temporary file is left behind
+    assert [path.name for path in tmp_path.iterdir()] == ["key.wav"]
@@ -1,9 +1,18 @@
+import asyncio
+from dataclasses import asdict
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
-from io import BytesIO
 
-from .converter import convert_audio_extension
-from ..shared.data import Audio, AudioExtension
+from .cache import AudioCache
+from .converter import (
+    AudioConverter,
+    configure_audio_converter,
+    convert_audio_extension,
+    convert_audio_stream,
+    get_audio_converter,
+)
+from .exception import FFmpegError, FFmpegTimeoutError
+from ..shared.data import Audio, AudioExtension, AudioStream
 
 
 @pytest.fixture
@@ -26,118 +35,332 @@ def aac_audio():
     return Audio(binary=b"aac_audio_data", extension=AudioExtension.AAC)
 
 
+def _communicating_process(
+    stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0
+) -> Mock:
+    process = Mock()
+    process.returncode = None
+
+    async def communicate(input_binary):
+        process.returncode = returncode
+        return stdout, stderr
+
+    process.communicate = AsyncMock(side_effect=communicate)
+    process.wait = AsyncMock(return_value=returncode)
+    return process
+
+
 class TestConvertAudioExtension:
     @pytest.mark.asyncio
     async def test_convert_audio_ffmpeg_failure(self, mp3_audio: Audio):
-        mock_process = Mock()
-        mock_process.wait = AsyncMock(return_value=None)
-        mock_process.returncode = 1
+        mock_process = _communicating_process(stderr=b"Invalid data", returncode=1)
 
         with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
             mock_create.return_value = mock_process
 
             with pytest.raises(
                 RuntimeError, match="FFmpeg process did not complete successfully"
-            ):
+            ) as error:
                 await convert_audio_extension(mp3_audio, AudioExtension.WAV)
 
+        assert isinstance(error.value, FFmpegError)
+        assert error.value.returncode == 1
+        assert error.value.stderr == "Invalid data"
+
     @pytest.mark.asyncio
     async def test_basic_functionality_parameters(self, mp3_audio: Audio):
-        mock_process = Mock()
-        mock_process.wait = AsyncMock(return_value=None)
-        mock_process.returncode = 0
+        mock_process = _communicating_process(stdout=b"test_result")
 
         with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
             mock_create.return_value = mock_process
 
-            # Create a real output buffer
-            output_buffer = BytesIO(b"test_result")
+            result = await convert_audio_extension(mp3_audio, AudioExtension.WAV)
 
-            with patch(
-                "app.stt.converter.BytesIO", side_effect=[BytesIO(), output_buffer]
-            ):
-                result = await convert_audio_extension(mp3_audio, AudioExtension.WAV)
+            # Verify the basic call structure
+            mock_create.assert_called_once()
+            args, kwargs = mock_create.call_args
 
-                # Verify the basic call structure
-                mock_create.assert_called_once()
-                args, kwargs = mock_create.call_args
+            assert args[0] == "ffmpeg"
+            assert "-i" in args
+            assert "-" in args
+            assert "-f" in args
+            assert "wav" in args
+            assert kwargs["stdin"] == asyncio.subprocess.PIPE
+            assert kwargs["stdout"] == asyncio.subprocess.PIPE
+            assert kwargs["stderr"] == asyncio.subprocess.PIPE
 
-                assert args[0] == "ffmpeg"
-                assert "-i" in args
-                assert "-" in args
-                assert "-f" in args
-                assert "wav" in args
-                assert "stdin" in kwargs
-                assert "stdout" in kwargs
+            # Input is fed through the pipe while output is drained
+            mock_process.communicate.assert_awaited_once_with(mp3_audio.binary)
 
-                # Verify result structure
-                assert isinstance(result, Audio)
-                assert result.extension == AudioExtension.WAV
+            # Verify result structure
+            assert isinstance(result, Audio)
+            assert result.binary == b"test_result"
+            assert result.extension == AudioExtension.WAV
 
     @pytest.mark.asyncio
-    async def test_integration_with_real_bytesio(self, mp3_audio: Audio):
-        """Test the actual behavior with real BytesIO without mocking subprocess"""
-        # This test verifies the data flow without external dependencies
+    async def test_different_audio_extensions(self):
+        """Test conversion between different audio formats"""
+        test_cases = [
+            (AudioExtension.MP3, AudioExtension.WAV),
+            (AudioExtension.WAV, AudioExtension.OGG),
+            (AudioExtension.OGG, AudioExtension.AAC),
+            (AudioExtension.AAC, AudioExtension.MP3),
+        ]
+
+        for source_ext, target_ext in test_cases:
+            source_audio = Audio(binary=b"test_data", extension=source_ext)
+            output = f"converted_to_{target_ext.value}".encode()
 
-        # Mock only the subprocess part
+            with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+                mock_create.return_value = _communicating_process(stdout=output)
+
+                result = await convert_audio_extension(source_audio, target_ext)
+
+                # Verify the ffmpeg call contains the target format
+                args, kwargs = mock_create.call_args
+                assert target_ext.value in args
+
+                assert result.binary == output
+                assert result.extension == target_ext
+
+
+class TestAudioConverter:
+    def test_default_config(self):
+        converter = AudioConverter()
+        assert converter.config.max_concurrency == 4
+        assert converter.config.timeout_seconds == 300.0
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency must be a positive"):
+            AudioConverter({"max_concurrency": 0})
+
+    def test_configure_replaces_module_converter(self):
+        previous = get_audio_converter()
+        try:
+            converter = configure_audio_converter({"max_concurrency": 2})
+            assert get_audio_converter() is converter
+            assert converter.config.max_concurrency == 2
+        finally:
+            configure_audio_converter(asdict(previous.config))
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self, mp3_audio: Audio):
+        converter = AudioConverter({"timeout_seconds": 0.01})
         mock_process = Mock()
-        mock_process.wait = AsyncMock(return_value=None)
-        mock_process.returncode = 0
+        mock_process.returncode = None
+        mock_process.wait = AsyncMock(return_value=-9)
+
+        async def communicate(input_binary):
+            await asyncio.sleep(1)
 
-        test_output = b"converted_test_data"
+        mock_process.communicate = communicate
 
         with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
             mock_create.return_value = mock_process
 
-            # Use a real BytesIO that we control for output
-            output_buffer = BytesIO()
-            output_buffer.write(test_output)
-            output_buffer.seek(0)
+            with pytest.raises(FFmpegTimeoutError, match="timed out after 0.01s"):
+                await converter.convert(mp3_audio, AudioExtension.WAV)
 
-            # Mock only the output BytesIO call (second call)
-            original_bytesio = BytesIO
+        mock_process.kill.assert_called_once()
 
-            def bytesio_side_effect(*args, **kwargs):
-                if args and args[0] == mp3_audio.binary:
-                    return original_bytesio(*args, **kwargs)
-                else:
-                    return output_buffer
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, mp3_audio: Audio):
+        converter = AudioConverter({"max_concurrency": 2})
+        running = 0
+        max_running = 0
+
+        def create_process(*args, **kwargs):
+            process = Mock()
+            process.returncode = None
+
+            async def communicate(input_binary):
+                nonlocal running, max_running
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                process.returncode = 0
+                return b"converted", b""
+
+            process.communicate = communicate
+            return process
+
+        with patch(
+            "asyncio.subprocess.create_subprocess_exec",
+            AsyncMock(side_effect=create_process),
+        ):
+            results = await asyncio.gather(
+                *(converter.convert(mp3_audio, AudioExtension.WAV) for _ in range(5))
+            )
+
+        assert max_running == 2
+        assert all(result.binary == b"converted" for result in results)
 
-            with patch("app.stt.converter.BytesIO", side_effect=bytesio_side_effect):
-                result = await convert_audio_extension(mp3_audio, AudioExtension.OGG)
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("format_name", "codec", "extension"),
+        [
+            ("ogg", "opus", AudioExtension.OPUS),
+            ("ogg", "vorbis", AudioExtension.OGG),
+            ("matroska,webm", "opus", AudioExtension.WEBM),
+            ("mov,mp4,m4a,3gp,3g2,mj2", "aac", AudioExtension.AAC),
+            ("flac", "flac", AudioExtension.FLAC),
+            ("amr", "amr_nb", None),
+        ],
+    )
+    async def test_probe_detects_extension(
+        self, aac_audio: Audio, format_name: str, codec: str, extension
+    ):
+        stdout = (
+            f'{{"streams": [{{"codec_name": "{codec}", "sample_rate": "48000", '
+            f'"channels": 2}}], "format": {{"format_name": "{format_name}"}}}}'
+        ).encode()
+        mock_process = _communicating_process(stdout=stdout)
 
-                assert result.binary == test_output
-                assert result.extension == AudioExtension.OGG
+        with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+            mock_create.return_value = mock_process
+            probe = await AudioConverter().probe(aac_audio.binary)
+
+        assert mock_create.call_args.args[0] == "ffprobe"
+        assert probe.extension == extension
+        assert probe.codec == codec
+        assert probe.sample_rate == 48000
+        assert probe.channels == 2
 
     @pytest.mark.asyncio
-    async def test_different_audio_extensions(self):
-        """Test conversion between different audio formats"""
-        test_cases = [
-            (AudioExtension.MP3, AudioExtension.WAV),
-            (AudioExtension.WAV, AudioExtension.OGG),
-            (AudioExtension.OGG, AudioExtension.AAC),
-            (AudioExtension.AAC, AudioExtension.MP3),
-        ]
+    async def test_probe_failure(self, aac_audio: Audio):
+        mock_process = _communicating_process(stderr=b"Invalid data", returncode=1)
 
-        for source_ext, target_ext in test_cases:
-            source_audio = Audio(binary=b"test_data", extension=source_ext)
+        with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+            mock_create.return_value = mock_process
+            with pytest.raises(FFmpegError):
+                await AudioConverter().probe(aac_audio.binary)
 
-            mock_process = Mock()
-            mock_process.wait = AsyncMock(return_value=None)
-            mock_process.returncode = 0
+    @pytest.mark.asyncio
+    async def test_convert_with_output_args(self, aac_audio: Audio):
+        mock_process = _communicating_process(stdout=b"opus")
 
-            with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
-                mock_create.return_value = mock_process
+        with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+            mock_create.return_value = mock_process
+            result = await AudioConverter().convert(
+                aac_audio, AudioExtension.OPUS, ["-ac", "1", "-f", "opus"]
+            )
+
+        assert result == Audio(binary=b"opus", extension=AudioExtension.OPUS)
+        args = mock_create.call_args.args
+        assert list(args[-5:]) == ["-ac", "1", "-f", "opus", "-"]
+
+    @pytest.mark.asyncio
+    async def test_cached_conversion_skips_ffmpeg(self, tmp_path, mp3_audio: Audio):
+        cache = AudioCache({"directory": str(tmp_path)})
+        converter = AudioConverter(cache=cache)
+
+        with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+            mock_create.return_value = _communicating_process(stdout=b"converted")
 
-                output_buffer = BytesIO(f"converted_to_{target_ext.value}".encode())
+            first = await converter.convert(mp3_audio, AudioExtension.WAV)
+            second = await converter.convert(mp3_audio, AudioExtension.WAV)
 
-                with patch(
-                    "app.stt.converter.BytesIO", side_effect=[BytesIO(), output_buffer]
-                ):
-                    result = await convert_audio_extension(source_audio, target_ext)
+        mock_create.assert_called_once()
+        assert first == second == Audio(b"converted", AudioExtension.WAV)
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
 
-                    # Verify the ffmpeg call contains the target format
-                    args, kwargs = mock_create.call_args
-                    assert target_ext.value in args
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_target_extension(
+        self, tmp_path, mp3_audio: Audio
+    ):
+        converter = AudioConverter(cache=AudioCache({"directory": str(tmp_path)}))
+
+        with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+            mock_create.side_effect = [
+                _communicating_process(stdout=b"as_wav"),
+                _communicating_process(stdout=b"as_ogg"),
+            ]
+
+            wav = await converter.convert(mp3_audio, AudioExtension.WAV)
+            ogg = await converter.convert(mp3_audio, AudioExtension.OGG)
+
+        assert mock_create.call_count == 2
+        assert wav.binary == b"as_wav"
+        assert ogg.binary == b"as_ogg"
+
+    def test_configure_with_cache_section(self, tmp_path):
+        previous = get_audio_converter()
+        try:
+            converter = configure_audio_converter(
+                {"cache": {"directory": str(tmp_path), "max_bytes": 100}}
+            )
+            assert converter.cache is not None
+            assert converter.config.max_concurrency == 4
+        finally:
+            configure_audio_converter(asdict(previous.config))
+
+
+def _streaming_process(output: bytes, returncode: int, stderr: bytes = b"") -> Mock:
+    def _reader(data: bytes) -> asyncio.StreamReader:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    process = Mock()
+    process.stdin = Mock()
+    process.stdin.drain = AsyncMock()
+    process.stdout = _reader(output)
+    process.stderr = _reader(stderr)
+    process.returncode = None
+
+    async def wait():
+        process.returncode = returncode
+        return returncode
+
+    process.wait = wait
+    return process
+
+
+class TestConvertAudioStream:
+    @pytest.mark.asyncio
+    async def test_streams_input_and_output_through_pipes(self, mp3_audio: Audio):
+        process = _streaming_process(b"converted_stream", returncode=0)
+
+        with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+            mock_create.return_value = process
+
+            stream = convert_audio_stream(
+                AudioStream.from_audio(mp3_audio, chunk_size=4), AudioExtension.WAV
+            )
+            # ffmpeg is only started once the stream is consumed
+            mock_create.assert_not_called()
+
+            result = await stream.read()
+
+        args, kwargs = mock_create.call_args
+        assert "wav" in args
+        assert kwargs["stdin"] == asyncio.subprocess.PIPE
+        assert kwargs["stdout"] == asyncio.subprocess.PIPE
+
+        written = b"".join(call.args[0] for call in process.stdin.write.call_args_list)
+        assert written == mp3_audio.binary
+        process.stdin.close.assert_called_once()
+
+        assert result.binary == b"converted_stream"
+        assert result.extension == AudioExtension.WAV
+
+    @pytest.mark.asyncio
+    async def test_ffmpeg_failure(self, mp3_audio: Audio):
+        process = _streaming_process(b"", returncode=1, stderr=b"Invalid data")
+
+        with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+            mock_create.return_value = process
+
+            stream = convert_audio_stream(
+                AudioStream.from_audio(mp3_audio), AudioExtension.WAV
+            )
+            with pytest.raises(
+                RuntimeError, match="FFmpeg process did not complete successfully"
+            ) as error:
+                await stream.read()
 
-                    assert result.extension == target_ext
+        assert isinstance(error.value, FFmpegError)
+        assert error.value.stderr == "Invalid data"
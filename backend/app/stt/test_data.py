@@ -1,4 +1,10 @@
-from ..shared.data import Audio, Transcription, AudioExtension, SubtitleExtension
+from ..shared.data import (
+    Audio,
+    AudioStream,
+    Transcription,
+    AudioExtension,
+    SubtitleExtension,
+)
 
 import pytest
 
@@ -9,13 +15,19 @@ class TestAudioExtension:
         assert AudioExtension.MP3.value == "mp3"
         assert AudioExtension.OGG.value == "ogg"
         assert AudioExtension.WAV.value == "wav"
+        assert AudioExtension.FLAC.value == "flac"
+        assert AudioExtension.OPUS.value == "opus"
+        assert AudioExtension.WEBM.value == "webm"
 
     def test_audio_extension_enum_members(self):
-        assert len(AudioExtension) == 4
+        assert len(AudioExtension) == 7
         assert AudioExtension.AAC in AudioExtension
         assert AudioExtension.MP3 in AudioExtension
         assert AudioExtension.OGG in AudioExtension
         assert AudioExtension.WAV in AudioExtension
+        assert AudioExtension.FLAC in AudioExtension
+        assert AudioExtension.OPUS in AudioExtension
+        assert AudioExtension.WEBM in AudioExtension
 
 
 class TestAudio:
@@ -77,6 +89,50 @@ class TestAudio:
         assert audio.extension == AudioExtension.WAV
 
 
+class TestAudioStream:
+    @pytest.mark.asyncio
+    async def test_from_audio_yields_chunks(self):
+        audio = Audio(binary=b"0123456789", extension=AudioExtension.MP3)
+
+        stream = AudioStream.from_audio(audio, chunk_size=4)
+        chunks = [chunk async for chunk in stream.chunks]
+
+        assert chunks == [b"0123", b"4567", b"89"]
+        assert stream.extension == AudioExtension.MP3
+
+    @pytest.mark.asyncio
+    async def test_read_joins_chunks(self):
+        audio = Audio(binary=b"x" * 10000, extension=AudioExtension.WAV)
+
+        result = await AudioStream.from_audio(audio, chunk_size=1000).read()
+
+        assert result == audio
+
+    @pytest.mark.asyncio
+    async def test_spool_rolls_over_to_disk(self):
+        audio = Audio(binary=b"y" * 10000, extension=AudioExtension.OGG)
+
+        spooled = await AudioStream.from_audio(audio, chunk_size=1000).spool(
+            max_memory_size=100
+        )
+        try:
+            assert spooled._rolled
+            assert spooled.read() == audio.binary
+        finally:
+            spooled.close()
+
+    @pytest.mark.asyncio
+    async def test_spool_stays_in_memory_when_small(self):
+        audio = Audio(binary=b"small", extension=AudioExtension.OGG)
+
+        spooled = await AudioStream.from_audio(audio).spool()
+        try:
+            assert not spooled._rolled
+            assert spooled.read() == b"small"
+        finally:
+            spooled.close()
+
+
 class TestTranscription:
     def test_transcription_creation_with_valid_data(self):
         content = "Hello, this is a test transcription."
@@ -0,0 +1,120 @@
+from ..shared.data import Audio, AudioExtension, AudioStream
+from .converter import AudioProbe
+from .exception import FFmpegError
+from .ingest import AudioNormalizer
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+WEBM = Audio(binary=b"webm_audio_data", extension=AudioExtension.AAC)
+
+
+def _converter(probe: AudioProbe | Exception) -> MagicMock:
+    converter = MagicMock()
+    if isinstance(probe, Exception):
+        converter.probe = AsyncMock(side_effect=probe)
+    else:
+        converter.probe = AsyncMock(return_value=probe)
+    converter.convert = AsyncMock(
+        side_effect=lambda audio, extension, args: Audio(b"normalized", extension)
+    )
+    return converter
+
+
+def test_output_args():
+    assert AudioNormalizer().output_args == [
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        "16000",
+        "-c:a",
+        "libopus",
+        "-b:a",
+        "32k",
+        "-f",
+        "opus",
+    ]
+    flac = AudioNormalizer({"format": "flac", "sample_rate": 22050})
+    assert flac.extension == AudioExtension.FLAC
+    assert flac.output_args[-6:] == ["-c:a", "flac", "-sample_fmt", "s16", "-f", "flac"]
+
+
+def test_invalid_format():
+    with pytest.raises(ValueError):
+        AudioNormalizer({"format": "mp3"})
+
+
+@pytest.mark.asyncio
+async def test_transcodes_other_formats():
+    converter = _converter(
+        AudioProbe(AudioExtension.WEBM, "opus", sample_rate=48000, channels=2)
+    )
+    normalizer = AudioNormalizer()
+
+    with patch("app.stt.ingest.get_audio_converter", return_value=converter):
+        result = await normalizer.normalize(WEBM)
+
+    assert result == Audio(b"normalized", AudioExtension.OPUS)
+    converter.convert.assert_awaited_once_with(
+        WEBM, AudioExtension.OPUS, normalizer.output_args
+    )
+
+
+@pytest.mark.asyncio
+async def test_passes_canonical_audio_through():
+    converter = _converter(
+        AudioProbe(AudioExtension.FLAC, "flac", sample_rate=16000, channels=1)
+    )
+    normalizer = AudioNormalizer({"format": "flac"})
+    # Labeled wrongly, the probe decides
+    audio = Audio(binary=b"flac_audio_data", extension=AudioExtension.AAC)
+
+    with patch("app.stt.ingest.get_audio_converter", return_value=converter):
+        result = await normalizer.normalize(audio)
+
+    assert result == Audio(audio.binary, AudioExtension.FLAC)
+    converter.convert.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_resamples_canonical_container_at_other_rate():
+    converter = _converter(
+        AudioProbe(AudioExtension.FLAC, "flac", sample_rate=44100, channels=1)
+    )
+    normalizer = AudioNormalizer({"format": "flac"})
+
+    with patch("app.stt.ingest.get_audio_converter", return_value=converter):
+        result = await normalizer.normalize(WEBM)
+
+    assert result.binary == b"normalized"
+
+
+@pytest.mark.asyncio
+async def test_transcodes_when_probe_fails():
+    converter = _converter(FFmpegError(1, b"Invalid data"))
+    normalizer = AudioNormalizer()
+
+    with patch("app.stt.ingest.get_audio_converter", return_value=converter):
+        result = await normalizer.normalize(WEBM)
+
+    assert result == Audio(b"normalized", AudioExtension.OPUS)
+
+
+@pytest.mark.asyncio
+async def test_streams_are_transcoded_without_probing():
+    converter = _converter(AudioProbe(None))
+    converter.convert_stream = MagicMock(
+        return_value=AudioStream.from_audio(Audio(b"normalized", AudioExtension.OPUS))
+    )
+    normalizer = AudioNormalizer()
+    stream = AudioStream.from_audio(WEBM)
+
+    with patch("app.stt.ingest.get_audio_converter", return_value=converter):
+        result = await normalizer.normalize(stream)
+
+    assert result == Audio(b"normalized", AudioExtension.OPUS)
+    converter.probe.assert_not_awaited()
+    converter.convert_stream.assert_called_once_with(
+        stream, AudioExtension.OPUS, normalizer.output_args
+    )
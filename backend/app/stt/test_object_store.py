@@ -0,0 +1,75 @@
+from ..shared.http import HTTPTransport
+from .object_store import LocalObjectStore
+
+import pytest
+import pytest_asyncio
+from urllib.parse import parse_qs, urlsplit
+
+
+@pytest_asyncio.fixture
+async def transport():
+    transport = HTTPTransport()
+    yield transport
+    await transport.close()
+
+
+@pytest_asyncio.fixture
+async def object_store(tmp_path):
+    object_store = LocalObjectStore({"directory": str(tmp_path)})
+    await object_store.start()
+    yield object_store
+    await object_store.close()
+
+
+async def _send(transport: HTTPTransport, method: str, url: str, **kwargs):
+    async with transport.request(method, url, "", **kwargs) as response:
+        return response.status, await response.read()
+
+
+@pytest.mark.asyncio
+async def test_round_trip_through_presigned_urls(object_store, transport):
+    put_url = await object_store.presign("track.mp3", "PUT", 60)
+    assert (await _send(transport, "PUT", put_url, data=b"audio"))[0] == 200
+
+    get_url = await object_store.presign("track.mp3", "GET", 60)
+    assert await _send(transport, "GET", get_url) == (200, b"audio")
+
+
+@pytest.mark.asyncio
+async def test_url_is_bound_to_its_method(object_store, transport):
+    get_url = await object_store.presign("track.mp3", "GET", 60)
+    status, _ = await _send(transport, "PUT", get_url, data=b"audio")
+    assert status == 403
+
+
+@pytest.mark.asyncio
+async def test_tampered_signature_is_rejected(object_store, transport):
+    url = await object_store.presign("track.mp3", "PUT", 60)
+    status, _ = await _send(transport, "PUT", url.replace("track", "other"))
+    assert status == 403
+
+
+@pytest.mark.asyncio
+async def test_expired_url_is_rejected(object_store, transport):
+    url = await object_store.presign("track.mp3", "PUT", -1)
+    assert int(parse_qs(urlsplit(url).query)["expires"][0]) > 0
+    status, _ = await _send(transport, "PUT", url, data=b"audio")
+    assert status == 403
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_the_object(object_store, transport, tmp_path):
+    put_url = await object_store.presign("track.mp3", "PUT", 60)
+    await _send(transport, "PUT", put_url, data=b"audio")
+
+    await object_store.delete("track.mp3")
+    await object_store.delete("track.mp3")
+
+    assert list(tmp_path.iterdir()) == []
+    get_url = await object_store.presign("track.mp3", "GET", 60)
+    assert (await _send(transport, "GET", get_url))[0] == 404
+
+
+def test_directory_is_required():
+    with pytest.raises(ValueError, match="directory"):
+        LocalObjectStore({"directory": ""})
@@ -0,0 +1,62 @@
+from ..shared.data import Audio, AudioExtension
+from .pcm import PCMAudio, decode_pcm, frame_rms
+
+import io
+import wave
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+
+
+def _pcm(seconds: float, amplitude: int = 1000) -> PCMAudio:
+    samples = np.full(int(seconds * 16000), amplitude, dtype=np.int16)
+    return PCMAudio(samples=samples)
+
+
+def test_duration_and_slice():
+    pcm = _pcm(2.0)
+
+    assert pcm.duration_seconds == 2.0
+    assert pcm.slice(0.5, 1.0).duration_seconds == 0.5
+    assert pcm.slice(1.5, 5.0).duration_seconds == 0.5
+
+
+def test_to_wav():
+    audio = _pcm(0.5).to_wav()
+
+    assert audio.extension == AudioExtension.WAV
+    with wave.open(io.BytesIO(audio.binary)) as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getframerate() == 16000
+        assert wav.getnframes() == 8000
+
+
+def test_frame_rms():
+    samples = np.concatenate(
+        [np.zeros(320, dtype=np.int16), np.full(320, 16384, dtype=np.int16)]
+    )
+    levels = frame_rms(PCMAudio(samples=samples))
+
+    assert levels.shape == (2,)
+    assert levels[0] == 0.0
+    assert levels[1] == pytest.approx(0.5)
+
+
+def test_frame_rms_shorter_than_a_frame():
+    assert len(frame_rms(PCMAudio(samples=np.zeros(10, dtype=np.int16)))) == 0
+
+
+@pytest.mark.asyncio
+async def test_decode_pcm_runs_ffmpeg_to_mono_s16le():
+    converter = AsyncMock()
+    converter.run.return_value = np.array([1, -2, 3], dtype="<i2").tobytes()
+    audio = Audio(binary=b"mp3_audio_data", extension=AudioExtension.MP3)
+
+    with patch("app.stt.pcm.get_audio_converter", return_value=converter):
+        pcm = await decode_pcm(audio)
+
+    converter.run.assert_awaited_once_with(
+        b"mp3_audio_data", ["-ac", "1", "-ar", "16000", "-f", "s16le"]
+    )
+    assert pcm.samples.tolist() == [1, -2, 3]
+    assert pcm.sample_rate == 16000
@@ -0,0 +1,123 @@
+from ..shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from .abstract import BackgroundRemover, SpeechToText
+from .ingest import AudioNormalizer
+from .process import Transcribe
+from .separation_policy import SeparationDecision, SeparationPolicy
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+AUDIO = Audio(binary=b"vocals", extension=AudioExtension.OGG)
+
+
+def _speech_to_text(content: str) -> MagicMock:
+    speech_to_text = MagicMock(spec=SpeechToText)
+    speech_to_text.transcribe = AsyncMock(
+        return_value=Transcription(
+            content=content, extension=SubtitleExtension.VTT, language=None
+        )
+    )
+    return speech_to_text
+
+
+@pytest.fixture
+def transcribe():
+    return Transcribe(
+        MagicMock(spec=BackgroundRemover),
+        _speech_to_text("remote"),
+        short_stt=_speech_to_text("local"),
+        short_max_seconds=120,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("duration_seconds", "expected"),
+    [(30, "local"), (120, "local"), (121, "remote"), (None, "remote")],
+)
+async def test_short_audio_uses_the_short_stt(transcribe, duration_seconds, expected):
+    transcription = await transcribe.transcribe(AUDIO, None, None, duration_seconds)
+    assert transcription.content == expected
+
+
+@pytest.mark.asyncio
+async def test_without_short_stt_everything_uses_the_default():
+    transcribe = Transcribe(
+        MagicMock(spec=BackgroundRemover), _speech_to_text("remote")
+    )
+    transcription = await transcribe.transcribe(AUDIO, duration_seconds=1)
+    assert transcription.content == "remote"
+
+
+def _policy(separate: bool) -> MagicMock:
+    policy = MagicMock(spec=SeparationPolicy)
+    policy.decide = AsyncMock(
+        return_value=SeparationDecision(separate=separate, reason="test")
+    )
+    return policy
+
+
+def _background_remover() -> MagicMock:
+    background_remover = MagicMock(spec=BackgroundRemover)
+    background_remover.remove_background = AsyncMock(
+        return_value=Audio(binary=b"separated", extension=AudioExtension.OGG)
+    )
+    return background_remover
+
+
+@pytest.mark.asyncio
+async def test_policy_skips_separation():
+    background_remover = _background_remover()
+    transcribe = Transcribe(
+        background_remover, _speech_to_text("remote"), separation_policy=_policy(False)
+    )
+
+    separation = await transcribe.separate(AUDIO)
+
+    assert separation.audio is AUDIO
+    assert not separation.decision.separate
+    background_remover.remove_background.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_policy_requests_separation():
+    transcribe = Transcribe(
+        _background_remover(),
+        _speech_to_text("remote"),
+        separation_policy=_policy(True),
+    )
+
+    separation = await transcribe.separate(AUDIO)
+
+    assert separation.audio.binary == b"separated"
+    assert separation.decision.reason == "test"
+
+
+@pytest.mark.asyncio
+async def test_without_policy_every_track_is_separated():
+    stt = _speech_to_text("remote")
+    transcribe = Transcribe(_background_remover(), stt)
+
+    await transcribe.process(AUDIO)
+
+    separated = stt.transcribe.await_args.args[0]
+    assert separated.binary == b"separated"
+
+
+@pytest.mark.asyncio
+async def test_normalize_without_normalizer_passes_audio_on():
+    transcribe = Transcribe(_background_remover(), _speech_to_text("remote"))
+    assert await transcribe.normalize(AUDIO) is AUDIO
+
+
+@pytest.mark.asyncio
+async def test_normalize_uses_the_normalizer():
+    normalized = Audio(binary=b"normalized", extension=AudioExtension.OPUS)
+    normalizer = MagicMock(spec=AudioNormalizer)
+    normalizer.normalize = AsyncMock(return_value=normalized)
+    transcribe = Transcribe(
+        _background_remover(), _speech_to_text("remote"), normalizer=normalizer
+    )
+
+    assert await transcribe.normalize(AUDIO) is normalized
+    normalizer.normalize.assert_awaited_once_with(AUDIO)
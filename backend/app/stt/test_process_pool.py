@@ -0,0 +1,54 @@
+from . import process_pool
+from .process_pool import ProcessPool, load_once
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def test_load_once_keeps_one_model_per_options(monkeypatch):
+    monkeypatch.setattr(process_pool, "_loaded", {})
+    loads: list[str] = []
+
+    def _load(options: str) -> str:
+        loads.append(options)
+        return f"model {options}"
+
+    assert load_once(_load, "small") == "model small"
+    assert load_once(_load, "small") == "model small"
+    assert load_once(_load, "large") == "model large"
+    assert loads == ["small", "large"]
+
+
+def test_invalid_processes_raises_error():
+    with pytest.raises(ValueError, match="processes must be a positive integer"):
+        ProcessPool(0)
+
+
+@pytest.mark.asyncio
+async def test_runs_in_the_given_executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    pool = ProcessPool(1, executor)
+
+    assert await pool.run(_square, 3) == 9
+
+    pool.close()
+    # Closing shuts the executor down and forgets it
+    with pytest.raises(RuntimeError):
+        executor.submit(_square, 1)
+    pool.close()
+
+
+@pytest.mark.asyncio
+async def test_starts_spawned_processes_on_first_use():
+    pool = ProcessPool(1)
+    assert pool._executor is None
+
+    assert await pool.run(_square, 4) == 16
+    assert pool._executor is not None
+
+    pool.close()
+    assert pool._executor is None
@@ -0,0 +1,130 @@
+from ..shared.http import HTTPTransport
+from .exception import RunpodHTTPError, RunpodJobError
+from .runpod import RunpodClient
+
+import asyncio
+import pytest
+import pytest_asyncio
+from typing import Any
+
+FAST_POLLING = {"poll_initial_seconds": 0.01, "poll_max_seconds": 0.02}
+
+
+async def _echo(input: dict[str, Any]) -> Any:
+    await asyncio.sleep(input.get("seconds", 0))
+    if input.get("fail"):
+        raise RuntimeError("worker crashed")
+    return {"echo": input["value"]}
+
+
+@pytest_asyncio.fixture
+async def fake_runpod(start_fake_runpod):
+    return await start_fake_runpod(_echo, runsync_wait_seconds=0.05)
+
+
+@pytest_asyncio.fixture
+async def transport():
+    transport = HTTPTransport()
+    yield transport
+    await transport.close()
+
+
+def _client(fake_runpod, transport: HTTPTransport, **config) -> RunpodClient:
+    return RunpodClient(
+        "test_api_key", fake_runpod.endpoint, transport, FAST_POLLING | config
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_mode_returns_inline_output(fake_runpod, transport):
+    client = _client(fake_runpod, transport)
+
+    assert await client.run({"value": 1}) == {"echo": 1}
+    assert fake_runpod.requests == ["POST /runsync"]
+
+
+@pytest.mark.asyncio
+async def test_sync_mode_polls_when_runsync_returns_early(fake_runpod, transport):
+    client = _client(fake_runpod, transport)
+
+    assert await client.run({"value": 2, "seconds": 0.1}) == {"echo": 2}
+    assert fake_runpod.requests[0] == "POST /runsync"
+    assert fake_runpod.requests[-1].startswith("GET /status/")
+
+
+@pytest.mark.asyncio
+async def test_run_mode_submits_and_polls(fake_runpod, transport):
+    client = _client(fake_runpod, transport, mode="run")
+
+    assert await client.run({"value": 3, "seconds": 0.05}) == {"echo": 3}
+    assert fake_runpod.requests[0] == "POST /run"
+    (job,) = fake_runpod.jobs.values()
+    assert job.polls >= 1
+
+
+@pytest.mark.asyncio
+async def test_run_mode_raises_on_failed_job(fake_runpod, transport):
+    client = _client(fake_runpod, transport, mode="run")
+
+    with pytest.raises(RunpodJobError) as error:
+        await client.run({"value": 4, "fail": True})
+
+    assert error.value.status == "FAILED"
+    assert error.value.error == "worker crashed"
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_cancels_the_job(fake_runpod, transport):
+    client = _client(fake_runpod, transport, mode="run")
+
+    task = asyncio.create_task(client.run({"value": 5, "seconds": 10}))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    (job,) = fake_runpod.jobs.values()
+    assert job.cancelled
+    assert fake_runpod.requests[-1] == f"POST /cancel/{job.id}"
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_the_job(fake_runpod, transport):
+    client = _client(fake_runpod, transport, mode="run", timeout_seconds=0.05)
+
+    with pytest.raises(RunpodJobError) as error:
+        await client.run({"value": 6, "seconds": 10})
+
+    assert error.value.status == "TIMED_OUT"
+    (job,) = fake_runpod.jobs.values()
+    assert job.cancelled
+
+
+@pytest.mark.asyncio
+async def test_many_jobs_in_flight_over_few_connections(fake_runpod):
+    transport = HTTPTransport({"endpoint_concurrency": 2, "limit_per_host": 2})
+    client = _client(fake_runpod, transport, mode="run")
+
+    outputs = await asyncio.gather(
+        *(client.run({"value": index, "seconds": 0.05}) for index in range(20))
+    )
+    await transport.close()
+
+    assert outputs == [{"echo": index} for index in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_http_error_is_raised(fake_runpod, transport):
+    client = RunpodClient("wrong_key", fake_runpod.endpoint, transport)
+
+    with pytest.raises(RunpodHTTPError) as error:
+        await client.run({"value": 7})
+
+    assert error.value.status == 401
+
+
+def test_invalid_polling_config_is_rejected():
+    with pytest.raises(ValueError):
+        RunpodClient("key", "http://runpod", HTTPTransport(), {"poll_multiplier": 0.5})
+    with pytest.raises(ValueError):
+        RunpodClient("key", "http://runpod", HTTPTransport(), {"mode": "webhook"})
@@ -0,0 +1,87 @@
+from ..shared.data import Audio, AudioExtension
+from .pcm import PCMAudio
+from . import separation_policy
+from .separation_policy import AlwaysSeparate, EnergySeparationPolicy
+
+import pytest
+from unittest.mock import AsyncMock
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+AUDIO = Audio(binary=b"mp3_audio_data", extension=AudioExtension.MP3)
+
+
+def _tones(*frequencies: float, seconds: float = 2.0) -> np.ndarray:
+    time = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    mixed = sum(np.sin(2 * np.pi * frequency * time) for frequency in frequencies)
+    peak = 0.8 / len(frequencies)
+    return (mixed * peak * 32767).astype(np.int16)
+
+
+@pytest.fixture
+def policy():
+    return EnergySeparationPolicy()
+
+
+def test_voice_band_only_is_clean(policy):
+    decision = policy.judge(policy.measure(_tones(300, 800, 2000)))
+    assert not decision.separate
+    assert decision.reason == "clean_vocals"
+    assert decision.features["vocal_ratio"] > 0.9
+
+
+def test_bass_line_needs_separation(policy):
+    decision = policy.judge(policy.measure(_tones(60, 800, 2000)))
+    assert decision.separate
+    assert decision.reason == "bass"
+
+
+def test_cymbals_need_separation(policy):
+    decision = policy.judge(policy.measure(_tones(800, 7000)))
+    assert decision.separate
+    assert decision.reason == "treble"
+
+
+def test_energy_between_bands_needs_separation(policy):
+    # Neither bass nor treble, but mostly outside the vocal band
+    decision = policy.judge(policy.measure(_tones(200, 4500, 5000)))
+    assert decision.separate
+    assert decision.reason == "wideband"
+
+
+def test_silent_frames_are_ignored(policy):
+    voice = _tones(800, seconds=1.0)
+    quiet_bass = (_tones(60, seconds=1.0) * 0.001).astype(np.int16)
+    features = policy.measure(np.concatenate([voice, quiet_bass]))
+    assert features["bass_ratio"] < 0.01
+    assert features["active_ratio"] == pytest.approx(0.5, abs=0.05)
+
+
+def test_silence_skips_separation(policy):
+    decision = policy.judge(policy.measure(np.zeros(SAMPLE_RATE, dtype=np.int16)))
+    assert not decision.separate
+    assert decision.reason == "silent"
+
+
+@pytest.mark.asyncio
+async def test_decide_analyses_downsampled_pcm(policy, monkeypatch):
+    decode_pcm = AsyncMock(return_value=PCMAudio(samples=_tones(60, 800)))
+    monkeypatch.setattr(separation_policy, "decode_pcm", decode_pcm)
+
+    decision = await policy.decide(AUDIO)
+
+    decode_pcm.assert_awaited_once_with(AUDIO, SAMPLE_RATE)
+    assert decision.separate
+
+
+@pytest.mark.asyncio
+async def test_always_separate():
+    decision = await AlwaysSeparate().decide(AUDIO)
+    assert decision.separate
+    assert decision.features == {}
+
+
+def test_unordered_bands_are_rejected():
+    with pytest.raises(ValueError, match="Bands"):
+        EnergySeparationPolicy({"vocal_low_hz": 5000, "vocal_high_hz": 300})
@@ -0,0 +1,157 @@
+from ..shared.data import Audio, AudioExtension
+from ..shared.http import HTTPTransport
+from .object_store import LocalObjectStore
+from .runpod import RunpodClient
+from .upload import (
+    AudioFields,
+    Base64StreamUploader,
+    JSONUploader,
+    MultipartUploader,
+    PresignedURLUploader,
+    create_audio_uploader,
+)
+
+import json
+import os
+import pytest
+import pytest_asyncio
+from base64 import b64decode, b64encode
+from typing import Any
+
+FIELDS = AudioFields(base64="audio_base64", url="audio_url", file="audio")
+
+
+@pytest.fixture
+def audio():
+    # Not a multiple of the chunk size, so the last chunk is padded
+    return Audio(binary=os.urandom(10_001), extension=AudioExtension.MP3)
+
+
+@pytest_asyncio.fixture
+async def transport():
+    transport = HTTPTransport()
+    yield transport
+    await transport.close()
+
+
+@pytest_asyncio.fixture
+async def object_store(tmp_path):
+    object_store = LocalObjectStore({"directory": str(tmp_path / "objects")})
+    await object_store.start()
+    yield object_store
+    await object_store.close()
+
+
+@pytest_asyncio.fixture
+async def fake_runpod(transport, start_fake_runpod):
+    async def _echo_audio(input: dict[str, Any]) -> Any:
+        if "audio_url" in input:
+            async with transport.request("GET", input["audio_url"], "") as response:
+                assert response.status == 200
+                binary = await response.read()
+        elif "audio" in input:
+            binary = input["audio"]
+        else:
+            binary = b64decode(input["audio_base64"])
+        return {"audio": b64encode(binary).decode("utf-8"), "model": input["model"]}
+
+    return await start_fake_runpod(_echo_audio, runsync_wait_seconds=0.05)
+
+
+@pytest.mark.asyncio
+async def test_base64_stream_matches_json_document(audio):
+    uploader = Base64StreamUploader(chunk_size=1000)
+    async with uploader.prepare({"model": "m"}, audio, FIELDS) as body:
+        chunks = [chunk async for chunk in body["data"]]
+
+    assert body["headers"] == {"Content-Type": "application/json"}
+    # Chunks are encoded independently, so none of them may carry padding
+    assert all(not chunk.endswith(b"=") for chunk in chunks[1:-2])
+    assert json.loads(b"".join(chunks)) == {
+        "input": {
+            "model": "m",
+            "audio_base64": b64encode(audio.binary).decode("utf-8"),
+        }
+    }
+
+
+def test_base64_stream_rounds_chunk_size_to_a_multiple_of_three():
+    assert Base64StreamUploader(chunk_size=1000)._chunk_size == 999
+    assert Base64StreamUploader(chunk_size=1)._chunk_size == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", ["json", "base64", "multipart", "presigned_url"])
+async def test_strategies_deliver_the_audio_to_the_worker(
+    strategy, audio, transport, object_store, fake_runpod
+):
+    uploader = create_audio_uploader({"strategy": strategy}, transport, object_store)
+    client = RunpodClient(
+        "test_api_key", fake_runpod.endpoint, transport, uploader=uploader
+    )
+
+    output = await client.run({"model": "m"}, audio, FIELDS)
+
+    assert b64decode(output["audio"]) == audio.binary
+    assert output["model"] == "m"
+
+
+@pytest.mark.asyncio
+async def test_presigned_upload_is_deleted_after_the_job(
+    audio, transport, object_store, fake_runpod, tmp_path
+):
+    uploader = PresignedURLUploader(object_store, transport, 60, 4096)
+    client = RunpodClient(
+        "test_api_key", fake_runpod.endpoint, transport, uploader=uploader
+    )
+
+    await client.run({"model": "m"}, audio, FIELDS)
+
+    job = next(iter(fake_runpod.jobs.values()))
+    assert set(job.input) == {"model", "audio_url"}
+    assert os.listdir(tmp_path / "objects") == []
+
+
+@pytest.mark.asyncio
+async def test_presigned_uploads_share_one_limiter(audio, transport, object_store):
+    uploader = PresignedURLUploader(object_store, transport, 60, 4096)
+
+    for _ in range(3):
+        async with uploader.prepare({"model": "m"}, audio, FIELDS):
+            pass
+
+    assert list(transport._limiters) == [object_store.base_url]
+
+
+@pytest.mark.asyncio
+async def test_multipart_sends_raw_audio(audio):
+    async with MultipartUploader(4096).prepare({"model": "m"}, audio, FIELDS) as body:
+        writer = body["data"]
+
+    assert writer.content_type.startswith("multipart/form-data")
+    assert [part.headers["Content-Type"] for part, *_ in writer._parts] == [
+        "application/json",
+        "audio/mp3",
+    ]
+
+
+def test_create_audio_uploader_selects_strategy(transport, object_store):
+    assert isinstance(create_audio_uploader(), Base64StreamUploader)
+    assert isinstance(create_audio_uploader({"strategy": "json"}), JSONUploader)
+    assert isinstance(
+        create_audio_uploader({"strategy": "multipart"}), MultipartUploader
+    )
+    assert isinstance(
+        create_audio_uploader({"strategy": "presigned_url"}, transport, object_store),
+        PresignedURLUploader,
+    )
+
+
+def test_presigned_url_requires_an_object_store(transport):
+    with pytest.raises(ValueError, match="object store"):
+        create_audio_uploader({"strategy": "presigned_url"}, transport)
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        create_audio_uploader({"strategy": "carrier_pigeon"})
@@ -0,0 +1,72 @@
+from .pcm import PCMAudio
+from .vad import TrimmedTimeline, VoiceActivityDetector
+
+import numpy as np
+import pytest
+
+
+def _track(*spans: tuple[float, float], seconds: float = 60) -> PCMAudio:
+    """Quiet bleed everywhere and loud noise in the given spans."""
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-30, 30, int(seconds * 16000)).astype(np.int16)
+    for start, end in spans:
+        first, last = int(start * 16000), int(end * 16000)
+        samples[first:last] = rng.integers(-8000, 8000, last - first)
+    return PCMAudio(samples=samples)
+
+
+def test_detects_voiced_regions():
+    detector = VoiceActivityDetector({"padding_seconds": 0.5})
+
+    regions = detector.detect(_track((10, 20), (40, 50)))
+
+    assert len(regions) == 2
+    assert regions[0] == pytest.approx((9.5, 20.5), abs=0.05)
+    assert regions[1] == pytest.approx((39.5, 50.5), abs=0.05)
+
+
+def test_merges_short_silences():
+    detector = VoiceActivityDetector({"min_silence_seconds": 2, "padding_seconds": 0})
+
+    regions = detector.detect(_track((10, 20), (21, 30)))
+
+    assert regions == [pytest.approx((10, 30), abs=0.05)]
+
+
+def test_ignores_clicks():
+    detector = VoiceActivityDetector({"min_voice_seconds": 0.2, "padding_seconds": 0})
+
+    regions = detector.detect(_track((10, 20), (30, 30.05)))
+
+    assert regions == [pytest.approx((10, 20), abs=0.05)]
+
+
+def test_silence_has_no_regions():
+    detector = VoiceActivityDetector()
+
+    assert detector.detect(_track()) == []
+    assert detector.detect(PCMAudio(samples=np.zeros(0, dtype=np.int16))) == []
+
+
+def test_timeline_maps_back_to_original_time():
+    timeline = TrimmedTimeline.concatenate([(10, 20), (40, 50)], gap_seconds=1)
+
+    assert timeline.voiced_seconds == 20
+    assert timeline.to_original(0) == 10
+    assert timeline.to_original(5) == 15
+    # Inside the gap, the end of the first region
+    assert timeline.to_original(10.5) == 20
+    assert timeline.to_original(11) == 40
+    assert timeline.to_original(16) == 45
+
+
+def test_timeline_renders_regions_with_gaps():
+    pcm = PCMAudio(samples=np.arange(100 * 16000, dtype=np.int32).astype(np.int16))
+    timeline = TrimmedTimeline.concatenate([(1, 2), (5, 7)], gap_seconds=0.5)
+
+    rendered = timeline.render(pcm)
+
+    assert rendered.duration_seconds == pytest.approx(3.5)
+    assert np.array_equal(rendered.samples[:16000], pcm.samples[16000:32000])
+    assert not rendered.samples[16000:24000].any()
+    assert np.array_equal(rendered.samples[24000:], pcm.samples[80000:112000])
@@ -0,0 +1,266 @@
+from ..shared.data import Audio
+from ..shared.http import HTTPTransport
+from .exception import RunpodHTTPError
+from .object_store import ObjectStore
+
+import json
+import uuid
+from abc import ABC, abstractmethod
+from base64 import b64encode
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+from urllib.parse import urlsplit
+
+from aiohttp import MultipartWriter
+
+
+@dataclass(frozen=True)
+class AudioFields:
+    """Names under which a worker expects the audio in its job input."""
+
+    # Field holding the base64 encoded audio in a JSON body
+    base64: str
+    # Field holding a URL the worker downloads the audio from
+    url: str
+    # Part holding the raw audio in a multipart body
+    file: str = field(default="audio")
+
+
+class UploadStrategy(str, Enum):
+    json = "json"
+    base64 = "base64"
+    multipart = "multipart"
+    presigned_url = "presigned_url"
+
+
+@dataclass(frozen=True)
+class AudioUploaderConfig:
+    strategy: UploadStrategy = field(default=UploadStrategy.base64)
+    # Bytes of audio sent per chunk, rounded down to a multiple of 3 for base64
+    chunk_size: int = field(default=192 * 1024)
+    # Lifetime of presigned URLs, long enough for the job to be picked up
+    url_expires_seconds: float = field(default=3600.0)
+
+
+class AudioUploader(ABC):
+    """Turns a job input and its audio into the body of the submit request."""
+
+    @abstractmethod
+    def prepare(
+        self, input: dict[str, Any], audio: Audio, fields: AudioFields
+    ) -> AbstractAsyncContextManager[dict[str, Any]]:
+        """Build the request body, keeping any upload alive for the context.
+
+        Implementations are async context managers yielding keyword arguments
+        for ``HTTPTransport.request``; resources such as uploaded objects are
+        released when the context exits, after the job has finished.
+
+        Args:
+            input: The job input without the audio.
+            audio: The audio to send.
+            fields: Where the worker expects the audio.
+
+        Returns:
+            An async context manager yielding the request arguments.
+        """
+        pass
+
+
+async def _iter_chunks(binary: bytes, chunk_size: int) -> AsyncIterator[memoryview]:
+    # Slices of a memoryview are written to the socket without copying
+    view = memoryview(binary)
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
+
+class JSONUploader(AudioUploader):
+    """Embeds the whole base64 string in a JSON document built in memory."""
+
+    @asynccontextmanager
+    async def prepare(
+        self, input: dict[str, Any], audio: Audio, fields: AudioFields
+    ) -> AsyncIterator[dict[str, Any]]:
+        encoded = b64encode(audio.binary).decode("utf-8")
+        yield {
+            "headers": {"Content-Type": "application/json"},
+            "json": {"input": {**input, fields.base64: encoded}},
+        }
+
+
+class Base64StreamUploader(AudioUploader):
+    """Streams a JSON document whose audio field is base64 encoded on the fly.
+
+    The audio is encoded chunk by chunk while the body is sent, so neither the
+    full base64 string nor the serialized document is ever held in memory.
+    """
+
+    def __init__(self, chunk_size: int):
+        """Initialize Base64StreamUploader.
+
+        Args:
+            chunk_size: Bytes of audio encoded per chunk.
+        """
+        # Chunks that are a multiple of 3 bytes encode without padding
+        self._chunk_size = max(chunk_size - chunk_size % 3, 3)
+
+    @asynccontextmanager
+    async def prepare(
+        self, input: dict[str, Any], audio: Audio, fields: AudioFields
+    ) -> AsyncIterator[dict[str, Any]]:
+        yield {
+            "headers": {"Content-Type": "application/json"},
+            "data": self.stream(input, audio, fields),
+        }
+
+    async def stream(
+        self, input: dict[str, Any], audio: Audio, fields: AudioFields
+    ) -> AsyncIterator[bytes]:
+        """Yield the JSON document in chunks.
+
+        Args:
+            input: The job input without the audio.
+            audio: The audio to encode.
+            fields: Where the worker expects the audio.
+
+        Yields:
+            Consecutive parts of the document.
+        """
+        placeholder = uuid.uuid4().hex
+        document = json.dumps({"input": {**input, fields.base64: placeholder}})
+        head, tail = document.split(placeholder)
+
+        yield head.encode()
+        async for chunk in _iter_chunks(audio.binary, self._chunk_size):
+            yield b64encode(chunk)
+        yield tail.encode()
+
+
+class MultipartUploader(AudioUploader):
+    """Sends the raw audio as a binary part next to a JSON part with the input.
+
+    For self-hosted endpoints that accept multipart bodies; the audio bytes are
+    written to the socket as they are, without encoding or copying.
+    """
+
+    def __init__(self, chunk_size: int):
+        """Initialize MultipartUploader.
+
+        Args:
+            chunk_size: Bytes of audio written per chunk.
+        """
+        self._chunk_size = chunk_size
+
+    @asynccontextmanager
+    async def prepare(
+        self, input: dict[str, Any], audio: Audio, fields: AudioFields
+    ) -> AsyncIterator[dict[str, Any]]:
+        writer = MultipartWriter("form-data")
+        writer.append_json(input).set_content_disposition("form-data", name="input")
+        writer.append(
+            _iter_chunks(audio.binary, self._chunk_size),
+            {"Content-Type": f"audio/{audio.extension.value}"},
+        ).set_content_disposition(
+            "form-data",
+            name=fields.file,
+            filename=f"audio.{audio.extension.value}",
+        )
+        yield {"data": writer}
+
+
+class PresignedURLUploader(AudioUploader):
+    """Uploads the audio to an object store and sends a presigned URL to it.
+
+    The request body stays a few hundred bytes regardless of the audio size.
+    The object is deleted when the context exits.
+    """
+
+    def __init__(
+        self,
+        object_store: ObjectStore,
+        transport: HTTPTransport,
+        url_expires_seconds: float,
+        chunk_size: int,
+    ):
+        """Initialize PresignedURLUploader.
+
+        Args:
+            object_store: The store holding the uploaded audio.
+            transport: HTTPTransport used for the upload.
+            url_expires_seconds: Lifetime of the presigned URLs.
+            chunk_size: Bytes of audio written per chunk.
+        """
+        self._object_store = object_store
+        self._transport = transport
+        self._url_expires_seconds = url_expires_seconds
+        self._chunk_size = chunk_size
+
+    @asynccontextmanager
+    async def prepare(
+        self, input: dict[str, Any], audio: Audio, fields: AudioFields
+    ) -> AsyncIterator[dict[str, Any]]:
+        key = f"{uuid.uuid4().hex}.{audio.extension.value}"
+        upload_url = await self._object_store.presign(
+            key, "PUT", self._url_expires_seconds
+        )
+        # Every signed URL differs, the uploads share the limiter of the store
+        endpoint, path = _split_url(upload_url)
+        async with self._transport.request(
+            "PUT", endpoint, path, data=_iter_chunks(audio.binary, self._chunk_size)
+        ) as response:
+            if response.status != 200:
+                raise RunpodHTTPError(response.status, "object store upload")
+
+        try:
+            download_url = await self._object_store.presign(
+                key, "GET", self._url_expires_seconds
+            )
+            yield {
+                "headers": {"Content-Type": "application/json"},
+                "json": {"input": {**input, fields.url: download_url}},
+            }
+        finally:
+            await self._object_store.delete(key)
+
+
+def _split_url(url: str) -> tuple[str, str]:
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    return f"{parts.scheme}://{parts.netloc}", path
+
+
+def create_audio_uploader(
+    config: dict | None = None,
+    transport: HTTPTransport | None = None,
+    object_store: ObjectStore | None = None,
+) -> AudioUploader:
+    """Create the uploader selected by the configuration.
+
+    Args:
+        config: Dictionary containing strategy, chunk_size and
+            url_expires_seconds.
+        transport: HTTPTransport used by the presigned URL strategy.
+        object_store: ObjectStore used by the presigned URL strategy.
+
+    Returns:
+        The audio uploader.
+
+    Raises:
+        ValueError: If the strategy is unknown or its dependencies are missing.
+    """
+    parsed = AudioUploaderConfig(**(config or {}))
+    strategy = UploadStrategy(parsed.strategy)
+
+    if strategy == UploadStrategy.json:
+        return JSONUploader()
+    if strategy == UploadStrategy.multipart:
+        return MultipartUploader(parsed.chunk_size)
+    if strategy == UploadStrategy.presigned_url:
+        if object_store is None or transport is None:
+            raise ValueError("presigned_url uploads require an object store.")
+        return PresignedURLUploader(
+            object_store, transport, parsed.url_expires_seconds, parsed.chunk_size
+        )
+    return Base64StreamUploader(parsed.chunk_size)
@@ -0,0 +1,159 @@
+from .pcm import PCM_FRAME_SECONDS, PCMAudio, frame_rms
+
+import bisect
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class VoiceActivityConfig:
+    # Frames quieter than this are never voice, in dB relative to full scale
+    threshold_db: float = field(default=-45.0)
+    # Frames this far below the loud part of the track are not voice either,
+    # which ignores the bleed a separation model leaves in the vocal stem
+    relative_db: float = field(default=-30.0)
+    # Percentile of the frame levels taken as the loud part of the track
+    reference_percentile: float = field(default=95.0)
+    # Voiced runs shorter than this are clicks or breaths
+    min_voice_seconds: float = field(default=0.2)
+    # Only silences at least this long are cut, shorter ones are kept
+    min_silence_seconds: float = field(default=2.0)
+    # Kept around every voiced region so word onsets are not clipped
+    padding_seconds: float = field(default=0.3)
+
+
+class VoiceActivityDetector:
+    """Finds the voiced regions of a vocal stem from its frame energy.
+
+    A frame counts as voiced if it is louder than both ``threshold_db`` and
+    ``relative_db`` below the ``reference_percentile`` level of the track.
+    Voiced runs are padded and merged across silences shorter than
+    ``min_silence_seconds``, so only instrumental intros, outros and breaks
+    are cut.
+    """
+
+    def __init__(self, config: dict | None = None):
+        """Initialize VoiceActivityDetector with configuration.
+
+        :param config: Dictionary with the fields of VoiceActivityConfig.
+        :raises ValueError: If a duration is negative.
+        """
+        self._config = VoiceActivityConfig(**(config or {}))
+        durations = (
+            self._config.min_voice_seconds,
+            self._config.min_silence_seconds,
+            self._config.padding_seconds,
+        )
+        if min(durations) < 0:
+            raise ValueError("Durations must not be negative.")
+
+    @property
+    def config(self) -> VoiceActivityConfig:
+        return self._config
+
+    def detect(self, pcm: PCMAudio) -> list[tuple[float, float]]:
+        """Find the voiced regions of the audio.
+
+        :param pcm: The decoded vocal stem.
+        :return: Increasing, non-overlapping (start, end) pairs in seconds.
+        """
+        config = self._config
+        levels = frame_rms(pcm)
+        if len(levels) == 0:
+            return []
+
+        reference = float(np.percentile(levels, config.reference_percentile))
+        threshold = max(
+            10 ** (config.threshold_db / 20),
+            reference * 10 ** (config.relative_db / 20),
+        )
+        voiced = np.concatenate(([False], levels >= threshold, [False]))
+        # Rising and falling edges delimit the voiced runs
+        edges = np.flatnonzero(np.diff(voiced.astype(np.int8)))
+        runs = edges.reshape(-1, 2) * PCM_FRAME_SECONDS
+
+        duration = pcm.duration_seconds
+        regions: list[tuple[float, float]] = []
+        for start, end in runs:
+            if end - start < config.min_voice_seconds:
+                continue
+            start = max(float(start) - config.padding_seconds, 0.0)
+            end = min(float(end) + config.padding_seconds, duration)
+            if regions and start - regions[-1][1] < config.min_silence_seconds:
+                regions[-1] = (regions[-1][0], end)
+            else:
+                regions.append((start, end))
+        return regions
+
+
+@dataclass(frozen=True)
+class TrimmedTimeline:
+    """Maps times in audio made of concatenated regions back to the original.
+
+    :param trimmed_starts: Start of every region in the trimmed audio.
+    :param original_starts: Start of every region in the original audio.
+    :param lengths: Length of every region.
+    :param gap_seconds: Silence between consecutive regions.
+    """
+
+    trimmed_starts: tuple[float, ...]
+    original_starts: tuple[float, ...]
+    lengths: tuple[float, ...]
+    gap_seconds: float = 0.0
+
+    @classmethod
+    def concatenate(
+        cls, regions: list[tuple[float, float]], gap_seconds: float = 0.0
+    ) -> "TrimmedTimeline":
+        """Lay out regions one after another with a gap between them.
+
+        :param regions: Increasing (start, end) pairs in original time.
+        :param gap_seconds: Silence inserted between consecutive regions.
+        :return: The timeline of the concatenated audio.
+        """
+        trimmed_starts = []
+        position = 0.0
+        for start, end in regions:
+            trimmed_starts.append(position)
+            position += end - start + gap_seconds
+        return cls(
+            trimmed_starts=tuple(trimmed_starts),
+            original_starts=tuple(start for start, _ in regions),
+            lengths=tuple(end - start for start, end in regions),
+            gap_seconds=gap_seconds,
+        )
+
+    @property
+    def voiced_seconds(self) -> float:
+        return sum(self.lengths)
+
+    def to_original(self, seconds: float) -> float:
+        """Convert a time in the trimmed audio to the original audio.
+
+        Times inside a gap map to the end of the region before it.
+
+        :param seconds: Time in the trimmed audio.
+        :return: Time in the original audio.
+        """
+        index = max(bisect.bisect_right(self.trimmed_starts, seconds) - 1, 0)
+        offset = min(
+            max(seconds - self.trimmed_starts[index], 0.0), self.lengths[index]
+        )
+        return self.original_starts[index] + offset
+
+    def render(self, pcm: PCMAudio) -> PCMAudio:
+        """Build the trimmed audio from the original.
+
+        :param pcm: The original audio.
+        :return: The regions of the original, separated by silence.
+        """
+        gap_size = int(round(self.gap_seconds * pcm.sample_rate))
+        gap = np.zeros(gap_size, dtype=pcm.samples.dtype)
+        parts: list[np.ndarray] = []
+        for start, length in zip(self.original_starts, self.lengths, strict=True):
+            if parts:
+                parts.append(gap)
+            parts.append(pcm.slice(start, start + length).samples)
+        samples = np.concatenate(parts) if parts else pcm.samples[:0]
+        return PCMAudio(samples=samples, sample_rate=pcm.sample_rate)
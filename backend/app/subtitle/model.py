@@ -3,7 +3,7 @@ from ..shared.supported import Language
 from ..shared.data import SubtitleExtension
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql.schema import ForeignKey
+from sqlalchemy.sql.schema import ForeignKey, Index
 
 from typing import TYPE_CHECKING
 
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
 
 class Subtitle(AIOSqliteBase):
     __tablename__ = "subtitles"
+    # Lists filter by video and page by instance_id
+    __table_args__ = (
+        Index("ix_subtitles_video_instance_id", "video_instance_id", "instance_id"),
+    )
 
     instance_id: Mapped[int] = mapped_column(
         primary_key=True, autoincrement=True, init=False
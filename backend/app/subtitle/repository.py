@@ -1,6 +1,11 @@
 from ..database.async_sqlalchemy import AsyncSQLAlchemy
 from ..shared.exception import UnknownError
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+)
 from .model import Subtitle as SubtitleModel
 from .dto import (
     Subtitle as SubtitleDTO,
@@ -21,6 +26,7 @@ class SubtitleRepository:
             database: AsyncSQLAlchemy database instance.
         """
         self._session_factory = database.session
+        self._read_session_factory = database.read_session
 
     async def create_subtitle(self, dto: CreateSubtitle) -> SubtitleDTO:
         async with self._session_factory() as session:
@@ -44,7 +50,7 @@ class SubtitleRepository:
             return SubtitleDTO(**model.to_dict())
 
     async def get_subtitle_by_instance_id(self, instance_id: int) -> SubtitleDTO | None:
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             model = await session.get(SubtitleModel, instance_id)
             if model is None:
                 return None
@@ -53,7 +59,7 @@ class SubtitleRepository:
     async def get_paginated_subtitles(
         self, page: int = 1, size: int = 10, video_instance_id: int | None = None
     ) -> PaginatedResponse[SubtitleDTO]:
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             # Calculate offset based on page and size
             offset = (page - 1) * size
 
@@ -82,3 +88,34 @@ class SubtitleRepository:
             items = [SubtitleDTO(**model.to_dict()) for model in result.scalars()]
 
             return PaginatedResponse(items=items, total=total, page=page, size=size)
+
+    async def get_cursor_paginated_subtitles(
+        self,
+        after: str | None = None,
+        size: int = 10,
+        video_instance_id: int | None = None,
+    ) -> CursorPaginatedResponse[SubtitleDTO]:
+        after_instance_id = decode_cursor(after) if after is not None else 0
+        async with self._read_session_factory() as session:
+            # Seek past the cursor, one extra row tells if another page follows
+            query = (
+                Select(SubtitleModel)
+                .where(SubtitleModel.instance_id > after_instance_id)
+                .order_by(SubtitleModel.instance_id)
+                .limit(size + 1)
+            )
+            if video_instance_id is not None:
+                query = query.where(
+                    SubtitleModel.video_instance_id == video_instance_id
+                )
+            result = await session.execute(query)
+
+            models = list(result.scalars())
+            items = [SubtitleDTO(**model.to_dict()) for model in models[:size]]
+            next_cursor = (
+                encode_cursor(items[-1].instance_id) if len(models) > size else None
+            )
+
+            return CursorPaginatedResponse(
+                items=items, size=size, next_cursor=next_cursor
+            )
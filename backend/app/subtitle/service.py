@@ -1,6 +1,6 @@
 from .dto import CreateSubtitle, Subtitle
 from .repository import SubtitleRepository
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 
 
 class SubtitleService:
@@ -24,3 +24,13 @@ class SubtitleService:
         return await self._repository.get_paginated_subtitles(
             page, size, video_instance_id
         )
+
+    async def get_cursor_paginated_subtitles(
+        self,
+        after: str | None = None,
+        size: int = 10,
+        video_instance_id: int | None = None,
+    ) -> CursorPaginatedResponse[Subtitle]:
+        return await self._repository.get_cursor_paginated_subtitles(
+            after, size, video_instance_id
+        )
@@ -210,3 +210,32 @@ async def test_get_paginated_subtitles(client, video_id):
     # Test with invalid parameters (should use defaults)
     response = await client.get("/subtitles/?page=0&size=0")
     assert response.status_code == 422  # FastAPI validation error
+
+
+@pytest.mark.asyncio
+async def test_get_subtitles_by_cursor(client, video_id):
+    for i in range(15):
+        await client.post(
+            "/subtitles/",
+            json={
+                "language": Language.english.value,
+                "content": f"Subtitle {i}",
+                "file_format": "srt",
+                "video_instance_id": video_id,
+            },
+        )
+
+    response = await client.get(f"/subtitles/cursor?video_instance_id={video_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 10
+    assert data["next_cursor"] is not None
+
+    response = await client.get(f"/subtitles/cursor?after={data['next_cursor']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 5
+    assert data["next_cursor"] is None
+
+    response = await client.get("/subtitles/cursor?after=invalid")
+    assert response.status_code == 400
@@ -1,4 +1,5 @@
 from ..shared.data import SubtitleExtension
+from ..shared.pagination import encode_cursor
 from ..shared.supported import Language
 from ..database import AIOSqlite
 from .exception import NotFoundThingError, NotFoundThing
@@ -173,3 +174,35 @@ async def test_get_paginated_subtitles(repository, video_id):
     assert paginated.size == 10
     assert paginated.total == 15
     assert len(paginated.items) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_cursor_paginated_subtitles(repository, video_id):
+    for i in range(15):
+        dto = CreateSubtitle(
+            language=Language.english,
+            content=f"Subtitle {i}",
+            file_format=SubtitleExtension.SRT,
+            video_instance_id=video_id,
+        )
+        await repository.create_subtitle(dto)
+
+    instance_ids = []
+    cursor = None
+    for expected_size in (10, 5):
+        paginated = await repository.get_cursor_paginated_subtitles(
+            after=cursor, video_instance_id=video_id
+        )
+        assert len(paginated.items) == expected_size
+        instance_ids += [subtitle.instance_id for subtitle in paginated.items]
+        cursor = paginated.next_cursor
+
+    assert cursor is None
+    assert instance_ids == list(range(1, 16))
+
+    # Nothing follows the cursor of the last subtitle
+    paginated = await repository.get_cursor_paginated_subtitles(
+        after=encode_cursor(instance_ids[-1])
+    )
+    assert paginated.items == []
+    assert paginated.next_cursor is None
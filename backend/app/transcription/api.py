@@ -1,6 +1,7 @@
 from .container import TranscriptionContainer
 from .service import TranscriptionService
-from ..shared.pagination import PaginatedResponse
+from ..shared.exception import InvalidCursorError
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 from .dto import CreateTranscription, Transcription
 
 from fastapi.routing import APIRouter
@@ -28,6 +29,40 @@ async def create_transcription(
         )
 
 
+# Declared before /{instance_id}, which would otherwise match "cursor"
+@router.get(
+    "/cursor",
+    response_model=CursorPaginatedResponse[Transcription],
+    responses={400: {"description": "Invalid cursor"}},
+)
+@inject
+async def get_transcriptions_by_cursor(
+    after: str | None = Query(
+        None, description="Cursor of the page, next_cursor of the previous one"
+    ),
+    size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    video_instance_id: int | None = Query(
+        None, description="Filter by video instance ID"
+    ),
+    service: TranscriptionService = Depends(Provide[TranscriptionContainer.service]),
+) -> CursorPaginatedResponse[Transcription] | JSONResponse:
+    """Get a keyset paginated list of transcriptions, in instance ID order.
+
+    - **after**: Opaque cursor, omitted for the first page
+    - **size**: Items per page (1-100, default 10)
+    - **video_instance_id**: Optional filter by video instance ID
+    """
+    try:
+        return await service.get_cursor_paginated_transcriptions(
+            after, size, video_instance_id
+        )
+    except InvalidCursorError as e:
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+
 @router.get(
     "/{instance_id}",
     response_model=Transcription,
@@ -2,7 +2,7 @@ from ..database import AIOSqliteBase
 from ..shared.supported import Language
 from ..shared.data import SubtitleExtension
 
-from sqlalchemy.sql.schema import ForeignKey
+from sqlalchemy.sql.schema import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
@@ -12,6 +12,12 @@ if TYPE_CHECKING:
 
 class Transcription(AIOSqliteBase):
     __tablename__ = "transcriptions"
+    # Lists filter by video and page by instance_id
+    __table_args__ = (
+        Index(
+            "ix_transcriptions_video_instance_id", "video_instance_id", "instance_id"
+        ),
+    )
 
     instance_id: Mapped[int] = mapped_column(
         primary_key=True, autoincrement=True, init=False
@@ -1,6 +1,11 @@
 from ..database.async_sqlalchemy import AsyncSQLAlchemy
 from ..shared.exception import UnknownError
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+)
 from .model import Transcription as TranscriptionModel
 from .dto import (
     Transcription as TranscriptionDTO,
@@ -21,6 +26,7 @@ class TranscriptionRepository:
             database: AsyncSQLAlchemy database instance.
         """
         self._session_factory = database.session
+        self._read_session_factory = database.read_session
 
     async def create_transcription(self, dto: CreateTranscription) -> TranscriptionDTO:
         async with self._session_factory() as session:
@@ -46,7 +52,7 @@ class TranscriptionRepository:
     async def get_transcription_by_instance_id(
         self, instance_id: int
     ) -> TranscriptionDTO | None:
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             model = await session.get(TranscriptionModel, instance_id)
             if model is None:
                 return None
@@ -55,7 +61,7 @@ class TranscriptionRepository:
     async def get_paginated_transcriptions(
         self, page: int = 1, size: int = 10, video_instance_id: int | None = None
     ) -> PaginatedResponse[TranscriptionDTO]:
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             # Calculate offset based on page and size
             offset = (page - 1) * size
 
@@ -84,3 +90,34 @@ class TranscriptionRepository:
             items = [TranscriptionDTO(**model.to_dict()) for model in result.scalars()]
 
             return PaginatedResponse(items=items, total=total, page=page, size=size)
+
+    async def get_cursor_paginated_transcriptions(
+        self,
+        after: str | None = None,
+        size: int = 10,
+        video_instance_id: int | None = None,
+    ) -> CursorPaginatedResponse[TranscriptionDTO]:
+        after_instance_id = decode_cursor(after) if after is not None else 0
+        async with self._read_session_factory() as session:
+            # Seek past the cursor, one extra row tells if another page follows
+            query = (
+                Select(TranscriptionModel)
+                .where(TranscriptionModel.instance_id > after_instance_id)
+                .order_by(TranscriptionModel.instance_id)
+                .limit(size + 1)
+            )
+            if video_instance_id is not None:
+                query = query.where(
+                    TranscriptionModel.video_instance_id == video_instance_id
+                )
+            result = await session.execute(query)
+
+            models = list(result.scalars())
+            items = [TranscriptionDTO(**model.to_dict()) for model in models[:size]]
+            next_cursor = (
+                encode_cursor(items[-1].instance_id) if len(models) > size else None
+            )
+
+            return CursorPaginatedResponse(
+                items=items, size=size, next_cursor=next_cursor
+            )
@@ -1,6 +1,6 @@
 from .dto import CreateTranscription, Transcription
 from .repository import TranscriptionRepository
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 
 
 class TranscriptionService:
@@ -26,3 +26,13 @@ class TranscriptionService:
         return await self._repository.get_paginated_transcriptions(
             page, size, video_instance_id
         )
+
+    async def get_cursor_paginated_transcriptions(
+        self,
+        after: str | None = None,
+        size: int = 10,
+        video_instance_id: int | None = None,
+    ) -> CursorPaginatedResponse[Transcription]:
+        return await self._repository.get_cursor_paginated_transcriptions(
+            after, size, video_instance_id
+        )
@@ -202,3 +202,30 @@ async def test_get_paginated_transcriptions(client: AsyncClient, video_id: int):
     # Test with invalid parameters (should use defaults)
     response = await client.get("/transcription/?page=0&size=0")
     assert response.status_code == 422  # FastAPI validation error
+
+
+@pytest.mark.asyncio
+async def test_get_transcriptions_by_cursor(client: AsyncClient, video_id: int):
+    for i in range(15):
+        data = CreateTranscription(
+            video_instance_id=video_id,
+            content=f"paginated transcription {i}",
+            language=Language.english,
+            subtitle_extension=SubtitleExtension.VTT,
+        )
+        await client.post("/transcription/", json=asdict(data))
+
+    response = await client.get("/transcription/cursor")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 10
+    assert data["next_cursor"] is not None
+
+    response = await client.get(f"/transcription/cursor?after={data['next_cursor']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 5
+    assert data["next_cursor"] is None
+
+    response = await client.get("/transcription/cursor?after=invalid")
+    assert response.status_code == 400
@@ -196,3 +196,32 @@ async def test_transcription_repository_get_paginated_transcriptions(
     assert paginated.size == 10
     assert paginated.total == 16
     assert len(paginated.items) == 0
+
+
+@pytest.mark.asyncio
+async def test_transcription_repository_get_cursor_paginated_transcriptions(
+    transcription_repository: TranscriptionRepository,
+    normal_transcription: Transcription,
+):
+    for i in range(15):  # 16 transcriptions with normal_transcription
+        await transcription_repository.create_transcription(
+            CreateTranscription(
+                language=Language.english,
+                content=f"Transcription content {i}",
+                subtitle_extension=normal_transcription.subtitle_extension,
+                video_instance_id=1,
+            )
+        )
+
+    instance_ids = []
+    cursor = None
+    for expected_size in (10, 6):
+        paginated = await transcription_repository.get_cursor_paginated_transcriptions(
+            after=cursor, video_instance_id=1
+        )
+        assert len(paginated.items) == expected_size
+        instance_ids += [item.instance_id for item in paginated.items]
+        cursor = paginated.next_cursor
+
+    assert cursor is None
+    assert instance_ids == list(range(1, 17))
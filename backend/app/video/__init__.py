@@ -4,10 +4,11 @@ from .api import (
     get_video_by_video_id,
     get_video_by_instance_id,
     get_videos,
+    get_videos_by_cursor,
 )
 from .container import VideoContainer
 from .service import VideoService
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 from .dto import Video, RetrievalVideo
 
 __all__ = [
@@ -16,9 +17,11 @@ __all__ = [
     "get_video_by_video_id",
     "get_video_by_instance_id",
     "get_videos",
+    "get_videos_by_cursor",
     "VideoContainer",
     "VideoService",
     "Video",
     "RetrievalVideo",
     "PaginatedResponse",
+    "CursorPaginatedResponse",
 ]
@@ -1,6 +1,7 @@
 from .container import VideoContainer
 from .service import VideoService
-from ..shared.pagination import PaginatedResponse
+from ..shared.exception import InvalidCursorError
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 from .dto import RetrievalVideo, SupportedPlatform, Video
 
 from fastapi.routing import APIRouter
@@ -73,3 +74,30 @@ async def get_videos(
     - **size**: Items per page (1-100, default 10)
     """
     return await service.get_paginated_videos(page, size)
+
+
+@router.get(
+    "/cursor",
+    response_model=CursorPaginatedResponse[Video],
+    responses={400: {"description": "Invalid cursor"}},
+)
+@inject
+async def get_videos_by_cursor(
+    after: str | None = Query(
+        None, description="Cursor of the page, next_cursor of the previous one"
+    ),
+    size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    service: VideoService = Depends(Provide[VideoContainer.service]),
+) -> CursorPaginatedResponse[Video] | JSONResponse:
+    """Get a keyset paginated list of videos, in instance ID order.
+
+    - **after**: Opaque cursor, omitted for the first page
+    - **size**: Items per page (1-100, default 10)
+    """
+    try:
+        return await service.get_cursor_paginated_videos(after, size)
+    except InvalidCursorError as e:
+        return JSONResponse(
+            content={"error": str(e)},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
@@ -1,5 +1,6 @@
 from .repository import VideoRepository
 from .service import VideoService
+from ..shared.single_flight import SingleFlight
 
 from dependency_injector import containers, providers
 
@@ -13,10 +14,14 @@ class VideoContainer(containers.DeclarativeContainer):
         database=database.provided,
     )
 
+    # Services are created per request, the in-flight calls must be shared
+    single_flight = providers.Singleton(SingleFlight)
+
     service = providers.Factory(
         VideoService,
         repository=repository.provided,
         retrieval=retrieval.provided,
+        single_flight=single_flight,
     )
 
     wiring_config = containers.WiringConfiguration(
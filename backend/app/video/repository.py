@@ -6,13 +6,19 @@ from .exception import (
     NotFoundThings,
 )
 from ..shared.supported import Platform as SupportedPlatform
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+)
 from ..shared.exception import (
     UnknownError,
 )
 from ..database.async_sqlalchemy import AsyncSQLAlchemy
 
 from yt_dlp import DownloadError
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.sql import Select, and_
 from sqlalchemy.sql.functions import count
 
@@ -26,24 +32,43 @@ class VideoRepository:
             retrieval: VideoRetrieval service for fetching video information.
         """
         self._session_factory = database.session
+        self._read_session_factory = database.read_session
 
     async def retrieve_and_save_video(
         self, platform: SupportedPlatform, video_id: str, video: VideoInfo
     ) -> VideoDTO:
+        """Save a video, returning the stored row if it already exists.
+
+        The insert ignores conflicts on (platform, video_id), so a concurrent
+        retrieval of the same video gets the row saved by the winner instead
+        of an integrity error.
+        """
         try:
             # Save video to database
             async with self._session_factory() as session:
-                model = VideoModel(
-                    platform=platform,
-                    video_id=video_id,
-                    channel_id=video.channel_id,
-                    channel_name=video.channel_name,
-                    title=video.title,
-                    description=video.description,
-                    duration_seconds=video.duration_seconds,
-                    thumbnail_url=video.thumbnail_url,
+                await session.execute(
+                    insert(VideoModel)
+                    .values(
+                        platform=platform,
+                        video_id=video_id,
+                        channel_id=video.channel_id,
+                        channel_name=video.channel_name,
+                        title=video.title,
+                        description=video.description,
+                        duration_seconds=video.duration_seconds,
+                        thumbnail_url=video.thumbnail_url,
+                    )
+                    .on_conflict_do_nothing(index_elements=["platform", "video_id"])
+                )
+                result = await session.execute(
+                    Select(VideoModel).filter(
+                        and_(
+                            VideoModel.video_id == video_id,
+                            VideoModel.platform == platform.value,
+                        )
+                    )
                 )
-                session.add(model)
+                model = result.scalar_one()
                 await session.commit()
                 return _model_to_dto(model)
         except DownloadError as e:
@@ -53,7 +78,7 @@ class VideoRepository:
 
     async def get_video_by_instance_id(self, instance_id: int) -> VideoDTO | None:
         try:
-            async with self._session_factory() as session:
+            async with self._read_session_factory() as session:
                 result = await session.execute(
                     Select(VideoModel).filter(VideoModel.instance_id == instance_id)
                 )
@@ -66,7 +91,7 @@ class VideoRepository:
         self, platform: SupportedPlatform, video_id: str
     ) -> VideoDTO | None:
         try:
-            async with self._session_factory() as session:
+            async with self._read_session_factory() as session:
                 result = await session.execute(
                     Select(VideoModel).filter(
                         and_(
@@ -93,7 +118,7 @@ class VideoRepository:
             A PaginatedResponse object containing the videos.
         """
         try:
-            async with self._session_factory() as session:
+            async with self._read_session_factory() as session:
                 # Calculate offset based on page and size
                 offset = (page - 1) * size
 
@@ -114,6 +139,45 @@ class VideoRepository:
         except Exception as e:
             raise UnknownError(e) from e
 
+    async def get_cursor_paginated_videos(
+        self, after: str | None = None, size: int = 10
+    ) -> CursorPaginatedResponse[VideoDTO]:
+        """Get a keyset paginated list of videos, in instance ID order.
+
+        Args:
+            after: The cursor of the page, None for the first page.
+            size: The maximum number of items per page.
+
+        Returns:
+            A CursorPaginatedResponse with the cursor of the next page.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        after_instance_id = decode_cursor(after) if after is not None else 0
+        try:
+            async with self._read_session_factory() as session:
+                # Seek past the cursor, one extra row tells if another page follows
+                query = (
+                    Select(VideoModel)
+                    .where(VideoModel.instance_id > after_instance_id)
+                    .order_by(VideoModel.instance_id)
+                    .limit(size + 1)
+                )
+                result = await session.execute(query)
+
+                models = list(result.scalars())
+                items = [_model_to_dto(model) for model in models[:size]]
+                next_cursor = (
+                    encode_cursor(items[-1].instance_id) if len(models) > size else None
+                )
+
+                return CursorPaginatedResponse(
+                    items=items, size=size, next_cursor=next_cursor
+                )
+        except Exception as e:
+            raise UnknownError(e) from e
+
 
 def _model_to_dto(model: VideoModel) -> VideoDTO:
     return VideoDTO(**model.to_dict())
@@ -3,25 +3,41 @@ from .dto import Video
 from .exception import NotFoundError, NotFoundThings
 from ..video_retrieval.retrieval import VideoRetrieval
 from ..shared.supported import Platform as SupportedPlatform
-from ..shared.pagination import PaginatedResponse
+from ..shared.pagination import CursorPaginatedResponse, PaginatedResponse
 from ..shared.exception import UnsupportedPlatformError
+from ..shared.single_flight import SingleFlight
 from urllib.parse import urlparse
 
 
 class VideoService:
-    def __init__(self, repository: VideoRepository, retrieval: VideoRetrieval):
+    def __init__(
+        self,
+        repository: VideoRepository,
+        retrieval: VideoRetrieval,
+        single_flight: SingleFlight | None = None,
+    ):
         """Initialize VideoService with repository.
 
         Args:
             repository: VideoRepository instance for data access.
             retrieval: VideoRetrieval instance for external video information retrieval.
+            single_flight: SingleFlight shared by every service instance so that
+                concurrent retrievals of one video run a single extraction.
         """
         self._repository = repository
         self._retrieval = retrieval
+        self._single_flight = single_flight or SingleFlight()
 
     async def retrieval_video(self, video_url: str) -> Video:
         platform, video_id = self._parse_video_url(video_url)
+        return await self._single_flight.do(
+            (platform, video_id),
+            lambda: self._retrieval_video(video_url, platform, video_id),
+        )
 
+    async def _retrieval_video(
+        self, video_url: str, platform: SupportedPlatform, video_id: str
+    ) -> Video:
         # Check if video already exists in database
         existing_video = await self._repository.get_video_by_video_id(
             platform, video_id
@@ -88,3 +104,17 @@ class VideoService:
             A PaginatedResponse object containing the videos.
         """
         return await self._repository.get_paginated_videos(page, size)
+
+    async def get_cursor_paginated_videos(
+        self, after: str | None = None, size: int = 10
+    ) -> CursorPaginatedResponse[Video]:
+        """Get a keyset paginated list of videos, in instance ID order.
+
+        Args:
+            after: The cursor of the page, None for the first page.
+            size: The maximum number of items per page.
+
+        Returns:
+            A CursorPaginatedResponse with the cursor of the next page.
+        """
+        return await self._repository.get_cursor_paginated_videos(after, size)
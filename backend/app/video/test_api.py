@@ -194,3 +194,40 @@ async def test_get_paginated_videos(client: AsyncClient):
     # Test with invalid parameters (should use defaults)
     response = await client.get("/video/?page=0&size=0")
     assert response.status_code == 422  # FastAPI validation error
+
+
+@pytest.mark.asyncio
+async def test_get_videos_by_cursor(client: AsyncClient):
+    for i in range(15):
+        container.retrieval.provided().retrieval_video_info.return_value = VideoInfo(
+            video_id=f"test{i}",
+            domain="youtube.com",
+            duration_seconds=100,
+            channel_name="channel",
+            channel_id="channel_id",
+            title=f"Test Video {i}",
+            thumbnail_url="thumbnail_url",
+        )
+        container.wire()
+
+        await client.post(
+            "/video/retrieval",
+            json={"video_url": f"https://www.youtube.com/watch?v=test{i}"},
+        )
+
+    video_ids = []
+    cursor = None
+    for expected_size in (5, 5, 5):
+        params = {"size": 5} if cursor is None else {"size": 5, "after": cursor}
+        response = await client.get("/video/cursor", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) == expected_size
+        video_ids += [item["video_id"] for item in data["items"]]
+        cursor = data["next_cursor"]
+
+    assert cursor is None
+    assert video_ids == [f"test{i}" for i in range(15)]
+
+    response = await client.get("/video/cursor?after=invalid")
+    assert response.status_code == 400
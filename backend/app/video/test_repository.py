@@ -2,6 +2,7 @@ from .repository import VideoRepository
 from .dto import Video
 from ..shared.supported import Platform as SupportedPlatform
 from ..database import AIOSqlite
+from ..shared.exception import InvalidCursorError
 from ..video_retrieval import VideoInfo
 
 import pytest
@@ -70,6 +71,23 @@ async def test_retrieve_and_save_video_duplicate(
     assert normal_video.video_id == second_try.video_id
 
 
+@pytest.mark.asyncio
+async def test_retrieve_and_save_video_twice_is_idempotent(
+    normal_repository: VideoRepository,
+    normal_video: Video,
+    normal_video_info: VideoInfo,
+):
+    second_save = await normal_repository.retrieve_and_save_video(
+        platform=SupportedPlatform.youtube,
+        video_id="testestest",
+        video=normal_video_info,
+    )
+    assert second_save == normal_video
+
+    result = await normal_repository.get_paginated_videos()
+    assert result.total == 1
+
+
 @pytest.mark.asyncio
 async def test_get_video_by_instance_id_normal(
     normal_repository: VideoRepository, normal_video: Video
@@ -161,3 +179,43 @@ async def test_get_paginated_videos(
     assert paginated.size == 10
     assert paginated.total == 15
     assert len(paginated.items) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_cursor_paginated_videos(normal_repository: VideoRepository):
+    for i in range(15):
+        video_info = VideoInfo(
+            video_id=f"test{i}",
+            domain="youtube.com",
+            duration_seconds=100,
+            channel_name="channel",
+            channel_id="channel_id",
+            title=f"Test Video {i}",
+            thumbnail_url="thumbnail_url",
+        )
+        await normal_repository.retrieve_and_save_video(
+            platform=SupportedPlatform.youtube,
+            video_id=f"test{i}",
+            video=video_info,
+        )
+
+    instance_ids = []
+    cursor = None
+    for expected_size in (10, 5):
+        paginated = await normal_repository.get_cursor_paginated_videos(after=cursor)
+        assert paginated.size == 10
+        assert len(paginated.items) == expected_size
+        instance_ids += [video.instance_id for video in paginated.items]
+        cursor = paginated.next_cursor
+
+    assert cursor is None
+    assert instance_ids == list(range(1, 16))
+
+
+@pytest.mark.asyncio
+async def test_get_cursor_paginated_videos_invalid_cursor(
+    normal_repository: VideoRepository,
+):
+    # Raised as is, not wrapped into UnknownError
+    with pytest.raises(InvalidCursorError):
+        await normal_repository.get_cursor_paginated_videos(after="invalid")
@@ -5,6 +5,7 @@ from ..shared.supported import Platform as SupportedPlatform
 from ..database import AIOSqlite
 from ..video_retrieval import VideoRetrieval, VideoInfo
 
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest import mock
@@ -63,6 +64,52 @@ async def test_retrieval_video(normal_video: Video):
     assert normal_video.thumbnail_url == "thumbnail_url"
 
 
+@pytest.mark.asyncio
+async def test_retrieval_video_concurrent_calls_share_one_extraction(
+    normal_video_service: VideoService, normal_video_retrieval: VideoRetrieval
+):
+    videos = await asyncio.gather(
+        *(
+            normal_video_service.retrieval_video(
+                "https://www.youtube.com/watch?v=video_id"
+            )
+            for _ in range(10)
+        )
+    )
+
+    assert normal_video_retrieval.retrieval_video_info.await_count == 1
+    assert all(video == videos[0] for video in videos)
+
+
+@pytest.mark.asyncio
+async def test_retrieval_video_concurrent_services_save_once():
+    database = AIOSqlite(":memory:")
+    await database.reset_database()
+    retrieval = VideoRetrieval({})
+    retrieval.retrieval_video_info = mock.AsyncMock(
+        return_value=VideoInfo(
+            video_id="video_id",
+            domain="youtube.com",
+            duration_seconds=10,
+            channel_name="channel_name",
+            channel_id="channel_id",
+            title="title",
+            thumbnail_url="thumbnail_url",
+        )
+    )
+    # Without a shared SingleFlight every service extracts on its own, the
+    # idempotent insert still gives all of them the same row
+    services = [VideoService(VideoRepository(database), retrieval) for _ in range(5)]
+    videos = await asyncio.gather(
+        *(
+            service.retrieval_video("https://www.youtube.com/watch?v=video_id")
+            for service in services
+        )
+    )
+
+    assert {video.instance_id for video in videos} == {1}
+
+
 @pytest.mark.asyncio
 async def test_get_video_by_instance_id(
     normal_video_service: VideoService, normal_video: Video
@@ -1,9 +1,11 @@
-from .type import VideoInfo
-from .exception import VideoExtractError
+from .type import Captions, VideoInfo
+from .exception import SubtitleNotFoundError, VideoExtractError
 from .retrieval import VideoRetrieval
 
 __all__ = [
+    "Captions",
     "VideoInfo",
     "VideoExtractError",
+    "SubtitleNotFoundError",
     "VideoRetrieval",
 ]
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiosqlite
+
+
+@dataclass(frozen=True)
+class MetadataCacheConfig:
+    max_entries: int = field(default=1024)
+    ttl_seconds: float = field(default=24 * 60 * 60)
+    negative_ttl_seconds: float = field(default=60 * 60)
+    sqlite_path: str | None = field(default=None)
+
+
+@dataclass(frozen=True)
+class MetadataCacheStats:
+    hits: int
+    negative_hits: int
+    misses: int
+    sqlite_hits: int
+    expirations: int
+    evictions: int
+    entries: int
+
+
+@dataclass(frozen=True)
+class MetadataCacheEntry:
+    """A cached lookup, ``value`` is None for a cached "not found"."""
+
+    value: dict[str, Any] | None
+    expires_at: float
+
+    @property
+    def negative(self) -> bool:
+        return self.value is None
+
+
+class MetadataCache:
+    """TTL cache of video metadata with an optional SQLite tier.
+
+    Entries live in an in-memory LRU and, when ``sqlite_path`` is set, in a
+    SQLite table that survives restarts and is shared between processes.
+    Values are JSON-serializable dictionaries; "not found" results are stored
+    as negative entries with their own, usually shorter, TTL.
+    """
+
+    def __init__(self, config: dict, clock: Callable[[], float] = time.time):
+        """Initialize MetadataCache with configuration.
+
+        Args:
+            config: Dictionary containing max_entries, ttl_seconds,
+                negative_ttl_seconds and sqlite_path.
+            clock: Returns the current wall-clock time in seconds.
+
+        Raises:
+            ValueError: If max_entries or a TTL is not positive.
+        """
+        self._config = MetadataCacheConfig(**config)
+        if self._config.max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        if self._config.ttl_seconds <= 0 or self._config.negative_ttl_seconds <= 0:
+            raise ValueError("TTLs must be positive.")
+
+        self._clock = clock
+        self._entries: OrderedDict[str, MetadataCacheEntry] = OrderedDict()
+        self._connection: aiosqlite.Connection | None = None
+        self._connection_lock = asyncio.Lock()
+
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._sqlite_hits = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    @property
+    def config(self) -> MetadataCacheConfig:
+        return self._config
+
+    @property
+    def stats(self) -> MetadataCacheStats:
+        return MetadataCacheStats(
+            hits=self._hits,
+            negative_hits=self._negative_hits,
+            misses=self._misses,
+            sqlite_hits=self._sqlite_hits,
+            expirations=self._expirations,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
+
+    async def get(self, key: str) -> MetadataCacheEntry | None:
+        """Look up a key in memory, then in SQLite.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The live entry, or None on a miss.
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= now:
+            del self._entries[key]
+            self._expirations += 1
+            entry = None
+
+        if entry is None:
+            entry = await self._get_from_sqlite(key, now)
+            if entry is not None:
+                self._sqlite_hits += 1
+                self._remember(key, entry)
+        else:
+            self._entries.move_to_end(key)
+
+        if entry is None:
+            self._misses += 1
+        elif entry.negative:
+            self._negative_hits += 1
+        else:
+            self._hits += 1
+        return entry
+
+    async def put(self, key: str, value: dict[str, Any] | None) -> None:
+        """Store a value, or a negative entry when value is None.
+
+        Args:
+            key: The cache key.
+            value: JSON-serializable dictionary, None to remember "not found".
+        """
+        ttl = (
+            self._config.negative_ttl_seconds
+            if value is None
+            else self._config.ttl_seconds
+        )
+        entry = MetadataCacheEntry(value=value, expires_at=self._clock() + ttl)
+        self._remember(key, entry)
+
+        connection = await self._sqlite()
+        if connection is not None:
+            await connection.execute(
+                "INSERT OR REPLACE INTO metadata_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(value), entry.expires_at),
+            )
+            await connection.commit()
+
+    async def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    def _remember(self, key: str, entry: MetadataCacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._config.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def _get_from_sqlite(self, key: str, now: float) -> MetadataCacheEntry | None:
+        connection = await self._sqlite()
+        if connection is None:
+            return None
+
+        async with connection.execute(
+            "SELECT value, expires_at FROM metadata_cache WHERE key = ?", (key,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at <= now:
+            await connection.execute("DELETE FROM metadata_cache WHERE key = ?", (key,))
+            await connection.commit()
+            self._expirations += 1
+            return None
+        return MetadataCacheEntry(value=json.loads(value), expires_at=expires_at)
+
+    async def _sqlite(self) -> aiosqlite.Connection | None:
+        if self._config.sqlite_path is None:
+            return None
+        async with self._connection_lock:
+            if self._connection is None:
+                directory = os.path.dirname(self._config.sqlite_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                connection = await aiosqlite.connect(self._config.sqlite_path)
+                await connection.execute(
+                    "CREATE TABLE IF NOT EXISTS metadata_cache "
+                    "(key TEXT PRIMARY KEY, value TEXT, expires_at REAL NOT NULL)"
+                )
+                await connection.commit()
+                self._connection = connection
+        return self._connection
@@ -7,3 +7,9 @@ class VideoExtractError(Exception):
         """
         self.message = message
         super().__init__(self.message)
+
+
+class SubtitleNotFoundError(VideoExtractError):
+    """Raised when a video has no subtitle in the requested languages."""
+
+    pass
@@ -0,0 +1,108 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+
+class RetrievalBackend(str, Enum):
+    thread = "thread"
+    gevent = "gevent"
+
+
+@dataclass(frozen=True)
+class RetrievalExecutorConfig:
+    backend: RetrievalBackend = field(default=RetrievalBackend.thread)
+    max_workers: int = field(default=8)
+
+
+class RetrievalExecutor(ABC):
+    """Runs the blocking yt-dlp and YouTubeTranscriptApi calls off the loop."""
+
+    @abstractmethod
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a blocking function without blocking the event loop.
+
+        Args:
+            function: The blocking function.
+            *args: Positional arguments passed to the function.
+
+        Returns:
+            The return value of the function.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the resources of the executor."""
+        pass
+
+
+class ThreadRetrievalExecutor(RetrievalExecutor):
+    """Runs calls in a dedicated thread pool, leaving the process unpatched."""
+
+    def __init__(self, max_workers: int):
+        """Initialize ThreadRetrievalExecutor.
+
+        Args:
+            max_workers: Number of threads in the pool.
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="video-retrieval"
+        )
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, function, *args
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class GeventRetrievalExecutor(RetrievalExecutor):
+    """Runs calls in gevent greenlets on a gevent-driven event loop.
+
+    The process has to be monkey-patched by importing ``monkey_patch`` before
+    the event loop is created.
+    """
+
+    def __init__(self):
+        """Initialize GeventRetrievalExecutor, patching the process if needed."""
+        from . import monkey_patch  # noqa: F401 # type: ignore
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        import asyncio_gevent
+        import gevent
+
+        return await asyncio_gevent.greenlet_to_future(gevent.spawn(function, *args))
+
+    def close(self) -> None:
+        # Greenlets live on the gevent hub, there is no pool to shut down
+        pass
+
+
+def create_retrieval_executor(config: dict | None = None) -> RetrievalExecutor:
+    """Create the executor selected by the configuration.
+
+    Args:
+        config: Dictionary containing backend and max_workers.
+
+    Returns:
+        The retrieval executor.
+
+    Raises:
+        ValueError: If the backend is unknown or max_workers is not positive.
+    """
+    parsed = RetrievalExecutorConfig(**(config or {}))
+    backend = RetrievalBackend(parsed.backend)
+    if parsed.max_workers < 1:
+        raise ValueError("max_workers must be a positive integer.")
+
+    if backend == RetrievalBackend.gevent:
+        return GeventRetrievalExecutor()
+    return ThreadRetrievalExecutor(parsed.max_workers)
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import yt_dlp
+
+
+@dataclass(frozen=True)
+class YoutubeDLPoolConfig:
+    size: int = field(default=4)
+
+
+@dataclass(frozen=True)
+class YoutubeDLPoolStats:
+    size: int
+    created: int
+    idle: int
+    in_flight: int
+    waiting: int
+    completed: int
+    average_wait_seconds: float
+
+
+class YoutubeDLPool:
+    """A bounded pool of warm YoutubeDL instances.
+
+    Instances are created on demand up to ``size`` and handed back to the pool
+    after every call, so extractors, cookie jars and HTTP connections survive
+    between extractions. Each instance serves a single call at a time.
+    """
+
+    def __init__(self, opts: dict, config: dict | None = None):
+        """Initialize YoutubeDLPool with yt-dlp options.
+
+        Args:
+            opts: Dictionary of yt-dlp options shared by every instance.
+            config: Dictionary containing size, the number of instances.
+
+        Raises:
+            ValueError: If size is not a positive integer.
+        """
+        self._opts = opts
+        self._config = YoutubeDLPoolConfig(**(config or {}))
+        if self._config.size < 1:
+            raise ValueError("size must be a positive integer.")
+
+        self._semaphore = asyncio.Semaphore(self._config.size)
+        self._idle: list[yt_dlp.YoutubeDL] = []
+        self._created = 0
+        self._in_flight = 0
+        self._waiting = 0
+        self._completed = 0
+        self._total_wait_seconds = 0.0
+
+    @property
+    def config(self) -> YoutubeDLPoolConfig:
+        return self._config
+
+    @property
+    def stats(self) -> YoutubeDLPoolStats:
+        acquired = self._in_flight + self._completed
+        return YoutubeDLPoolStats(
+            size=self._config.size,
+            created=self._created,
+            idle=len(self._idle),
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            completed=self._completed,
+            average_wait_seconds=(
+                self._total_wait_seconds / acquired if acquired else 0.0
+            ),
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[yt_dlp.YoutubeDL]:
+        """Borrow an instance, waiting while all of them are busy.
+
+        Yields:
+            A YoutubeDL instance owned by the caller until the context exits.
+        """
+        started_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._total_wait_seconds += time.perf_counter() - started_at
+
+        try:
+            ydl = self._idle.pop() if self._idle else self._create()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self._in_flight += 1
+        try:
+            yield ydl
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._idle.append(ydl)
+            self._semaphore.release()
+
+    def close(self) -> None:
+        """Close the idle instances and their connections."""
+        idle, self._idle = self._idle, []
+        for ydl in idle:
+            ydl.close()
+
+    def _create(self) -> yt_dlp.YoutubeDL:
+        ydl = yt_dlp.YoutubeDL(self._opts)
+        self._created += 1
+        return ydl
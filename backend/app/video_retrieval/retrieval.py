@@ -1,75 +1,200 @@
-from ..shared.data import Audio, AudioExtension, SubtitleExtension, Transcription
+from ..shared.data import (
+    AUDIO_CHUNK_SIZE,
+    Audio,
+    AudioExtension,
+    AudioStream,
+    SubtitleExtension,
+    Transcription,
+)
 from ..shared.supported import Language
 from ..shared.exception import UnsupportedPlatformError
-from .monkey_patch import gevent
-from .type import VideoInfo
-from .exception import VideoExtractError
+from .cache import MetadataCache, MetadataCacheStats
+from .executor import RetrievalExecutor, create_retrieval_executor
+from .pool import YoutubeDLPool, YoutubeDLPoolStats
+from .type import Captions, VideoInfo
+from .exception import SubtitleNotFoundError, VideoExtractError
 
 import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import (
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    YouTubeTranscriptApi,
+)
 from youtube_transcript_api.formatters import WebVTTFormatter
 import asyncio
-import asyncio_gevent
+from collections.abc import AsyncIterator
+from dataclasses import asdict
 from urllib.parse import urlparse
 
+# Bytes of the download read before the stream is returned, enough for the
+# container signatures and the Opus header of an Ogg page
+_SNIFF_SIZE = 64
+
 
 class VideoRetrieval:
-    def __init__(self, opts: dict):
+    def __init__(
+        self,
+        opts: dict,
+        pool: dict | None = None,
+        executor: dict | None = None,
+        cache: dict | None = None,
+    ):
         """Initialize VideoRetrieval with yt-dlp options.
 
         Args:
             opts: Dictionary of yt-dlp options for video extraction.
+            pool: Dictionary containing size of the YoutubeDL instance pool.
+            executor: Dictionary containing backend, "thread" or "gevent", and
+                max_workers of the executor running blocking calls.
+            cache: Dictionary configuring the metadata cache in front of video
+                info and subtitle lookups, None to disable it.
         """
         self._opts = opts
+        self._pool = YoutubeDLPool(opts, pool)
+        self._executor: RetrievalExecutor = create_retrieval_executor(executor)
+        self._cache = MetadataCache(cache) if cache is not None else None
+
+    @property
+    def pool_stats(self) -> YoutubeDLPoolStats:
+        return self._pool.stats
+
+    @property
+    def cache_stats(self) -> MetadataCacheStats | None:
+        return self._cache.stats if self._cache else None
+
+    async def close(self) -> None:
+        """Release the pooled YoutubeDL instances, executor and cache."""
+        self._pool.close()
+        self._executor.close()
+        if self._cache:
+            await self._cache.close()
 
     async def retrieval_video_info(self, url: str) -> VideoInfo:
-        def _retrieval_video_info() -> VideoInfo:
-            with yt_dlp.YoutubeDL(self._opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                if info is None:
-                    raise VideoExtractError("Cannot extract video info")
-
-                return VideoInfo(
-                    video_id=info.get("display_id", ""),
-                    description=info.get("description", ""),
-                    domain=info.get("webpage_url_domain", ""),
-                    duration_seconds=info.get("duration", 0),
-                    channel_name=info.get("uploader", ""),
-                    channel_id=info.get("channel_id", ""),
-                    title=info.get("title", ""),
-                    thumbnail_url=info.get("thumbnail", ""),
-                )
+        key = f"video_info:{url}"
+        if self._cache:
+            entry = await self._cache.get(key)
+            if entry is not None and entry.value is not None:
+                return VideoInfo(**entry.value)
+
+        video_info = await self._retrieval_video_info(url)
+        if self._cache:
+            await self._cache.put(key, asdict(video_info))
+        return video_info
 
-        result: VideoInfo = await asyncio_gevent.greenlet_to_future(
-            gevent.spawn(_retrieval_video_info)
-        )
+    async def _retrieval_video_info(self, url: str) -> VideoInfo:
+        def _retrieval_video_info(ydl: yt_dlp.YoutubeDL) -> VideoInfo:
+            info = ydl.extract_info(url, download=False)
+            if info is None:
+                raise VideoExtractError("Cannot extract video info")
+
+            return VideoInfo(
+                video_id=info.get("display_id", ""),
+                description=info.get("description", ""),
+                domain=info.get("webpage_url_domain", ""),
+                duration_seconds=info.get("duration", 0),
+                channel_name=info.get("uploader", ""),
+                channel_id=info.get("channel_id", ""),
+                title=info.get("title", ""),
+                thumbnail_url=info.get("thumbnail", ""),
+            )
+
+        async with self._pool.acquire() as ydl:
+            result = await self._executor.run(_retrieval_video_info, ydl)
         return result
 
     async def retrieval_audio_of_video(self, url: str) -> Audio:
-        ytd_process = await asyncio.subprocess.create_subprocess_exec(
-            "yt-dlp",
-            "-f",
-            "bestaudio",
-            url,
-            "--no-warnings",
-            "--quiet",
-            "-o",
-            "-",
-            stdout=asyncio.subprocess.PIPE,
-        )
-
-        if ytd_process.stdout is None:
-            raise VideoExtractError("Cannot extract video audio")
-
-        binary = await ytd_process.stdout.read()
-        return Audio(
-            binary=binary,
-            extension=AudioExtension.AAC,
-        )
+        stream = await self.stream_audio_of_video(url)
+        return await stream.read()
+
+    async def stream_audio_of_video(self, url: str) -> AudioStream:
+        """Stream the best audio track of a video straight from yt-dlp stdout.
+
+        Only the first bytes are read before returning, they identify the
+        container of the track. The rest of the output is yielded chunk by
+        chunk as the stream is consumed, so the whole track is never buffered
+        in memory.
+
+        Args:
+            url: URL of the video.
+
+        Returns:
+            An AudioStream over the yt-dlp output.
+
+        Raises:
+            VideoExtractError: If yt-dlp fails or its output is not a known
+                audio container.
+        """
+
+        async def _chunks() -> AsyncIterator[bytes]:
+            ytd_process = await asyncio.subprocess.create_subprocess_exec(
+                "yt-dlp",
+                "-f",
+                "bestaudio",
+                url,
+                "--no-warnings",
+                "--quiet",
+                "-o",
+                "-",
+                stdout=asyncio.subprocess.PIPE,
+            )
+
+            try:
+                if ytd_process.stdout is None:
+                    raise VideoExtractError("Cannot extract video audio")
+
+                while chunk := await ytd_process.stdout.read(AUDIO_CHUNK_SIZE):
+                    yield chunk
+
+                await ytd_process.wait()
+                if ytd_process.returncode != 0:
+                    raise VideoExtractError("Cannot extract video audio")
+            finally:
+                if ytd_process.returncode is None:
+                    ytd_process.kill()
+                    await ytd_process.wait()
+
+        chunks = _chunks()
+        # bestaudio may be AAC in MP4 or Opus in WebM, the first bytes tell which
+        head = b""
+        while len(head) < _SNIFF_SIZE and (chunk := await anext(chunks, b"")):
+            head += chunk
+        extension = _sniff_extension(head)
+        if extension is None:
+            await chunks.aclose()
+            raise VideoExtractError("Unknown audio container")
+
+        async def _with_head() -> AsyncIterator[bytes]:
+            try:
+                yield head
+                async for chunk in chunks:
+                    yield chunk
+            finally:
+                await chunks.aclose()
+
+        return AudioStream(chunks=_with_head(), extension=extension)
 
     async def retrieval_subtitle_of_video(
         self, url: str, target_language: Language | None = None
     ) -> Transcription:
+        captions = await self.retrieval_captions_of_video(url, target_language)
+        return captions.transcription
+
+    async def retrieval_captions_of_video(
+        self, url: str, target_language: Language | None = None
+    ) -> Captions:
+        """Fetch the captions of a video, preferring uploaded over generated ones.
+
+        Args:
+            url: URL of the video.
+            target_language: Language of the captions, any supported if None.
+
+        Returns:
+            The captions as WebVTT and whether they were auto-generated.
+
+        Raises:
+            UnsupportedPlatformError: If the URL is not a YouTube video.
+            SubtitleNotFoundError: If no captions in the language exist.
+        """
         parsed_url = urlparse(url)
         hostname: str = parsed_url.hostname or ""
         video_id = ""
@@ -89,24 +214,92 @@ class VideoRetrieval:
             hostname: str = parsed_url.hostname or ""
             raise UnsupportedPlatformError(hostname)
 
-        def _retrieval_subtitle_of_video_from_youtube() -> Transcription:
+        key = f"subtitle:{video_id}:{target_language.value if target_language else ''}"
+        if self._cache:
+            entry = await self._cache.get(key)
+            if entry is not None:
+                if entry.value is None:
+                    raise SubtitleNotFoundError(f"No subtitle found for {video_id}")
+                return Captions(
+                    transcription=Transcription(
+                        content=entry.value["content"],
+                        extension=SubtitleExtension(entry.value["extension"]),
+                        language=(
+                            Language(entry.value["language"])
+                            if entry.value["language"]
+                            else None
+                        ),
+                    ),
+                    # Entries cached before the flag existed are not trusted
+                    generated=entry.value.get("generated", True),
+                )
+
+        def _retrieval_subtitle_of_video_from_youtube() -> Captions:
             ytt_api = YouTubeTranscriptApi()
-            transcript_list = ytt_api.list(video_id)
-            transcript = transcript_list.find_transcript(
-                [lang.value for lang in Language]
-                if target_language is None
-                else [target_language.value]
-            )
+            try:
+                transcript_list = ytt_api.list(video_id)
+                transcript = transcript_list.find_transcript(
+                    [lang.value for lang in Language]
+                    if target_language is None
+                    else [target_language.value]
+                )
+            except (NoTranscriptFound, TranscriptsDisabled) as e:
+                raise SubtitleNotFoundError(f"No subtitle found for {video_id}") from e
             language = Language(transcript.language_code)
             fetched_transcription = transcript.fetch()
 
             formatter = WebVTTFormatter()
             result = formatter.format_transcript(fetched_transcription)
-            return Transcription(
-                content=result, extension=SubtitleExtension.VTT, language=language
+            return Captions(
+                transcription=Transcription(
+                    content=result, extension=SubtitleExtension.VTT, language=language
+                ),
+                generated=transcript.is_generated,
             )
 
-        result = await asyncio_gevent.greenlet_to_future(
-            gevent.spawn(_retrieval_subtitle_of_video_from_youtube)
-        )
-        return result
+        try:
+            captions = await self._executor.run(
+                _retrieval_subtitle_of_video_from_youtube
+            )
+        except SubtitleNotFoundError:
+            if self._cache:
+                await self._cache.put(key, None)
+            raise
+
+        if self._cache:
+            transcription = captions.transcription
+            await self._cache.put(
+                key,
+                {
+                    "content": transcription.content,
+                    "extension": transcription.extension.value,
+                    "language": (
+                        transcription.language.value if transcription.language else None
+                    ),
+                    "generated": captions.generated,
+                },
+            )
+        return captions
+
+
+def _sniff_extension(head: bytes) -> AudioExtension | None:
+    if head[4:8] == b"ftyp":
+        # YouTube serves AAC in an MP4 container, read by ffmpeg like raw AAC
+        return AudioExtension.AAC
+    if head.startswith(b"\x1a\x45\xdf\xa3"):
+        return AudioExtension.WEBM
+    if head.startswith(b"OggS"):
+        return AudioExtension.OPUS if b"OpusHead" in head else AudioExtension.OGG
+    if head.startswith(b"fLaC"):
+        return AudioExtension.FLAC
+    if head.startswith(b"RIFF") and head[8:12] == b"WAVE":
+        return AudioExtension.WAV
+    if head.startswith(b"ID3"):
+        return AudioExtension.MP3
+    if len(head) >= 2 and head[0] == 0xFF:
+        # ADTS and MPEG audio frames share the sync word, the layer tells them apart
+        if head[1] & 0xF6 == 0xF0:
+            return AudioExtension.AAC
+        if head[1] & 0xE0 == 0xE0:
+            return AudioExtension.MP3
+    return None
@@ -0,0 +1,105 @@
+from .cache import MetadataCache
+
+import pytest
+from pathlib import Path
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_and_miss():
+    cache = MetadataCache({})
+
+    assert await cache.get("key") is None
+    await cache.put("key", {"title": "song"})
+    entry = await cache.get("key")
+
+    assert entry is not None
+    assert entry.value == {"title": "song"}
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.entries == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_entries_after_ttl():
+    clock = Clock()
+    cache = MetadataCache({"ttl_seconds": 10, "negative_ttl_seconds": 2}, clock)
+
+    await cache.put("positive", {"title": "song"})
+    await cache.put("negative", None)
+
+    clock.now += 5
+    negative = await cache.get("negative")
+    assert negative is None
+    positive = await cache.get("positive")
+    assert positive is not None
+
+    clock.now += 5
+    assert await cache.get("positive") is None
+    assert cache.stats.expirations == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_remembers_negative_results():
+    cache = MetadataCache({})
+
+    await cache.put("missing", None)
+    entry = await cache.get("missing")
+
+    assert entry is not None
+    assert entry.negative
+    assert cache.stats.negative_hits == 1
+    assert cache.stats.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    cache = MetadataCache({"max_entries": 2})
+
+    await cache.put("a", {"n": 1})
+    await cache.put("b", {"n": 2})
+    await cache.get("a")
+    await cache.put("c", {"n": 3})
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_sqlite_tier_survives_restart(tmp_path: Path):
+    clock = Clock()
+    config = {"sqlite_path": str(tmp_path / "cache" / "metadata.db")}
+
+    cache = MetadataCache(config, clock)
+    await cache.put("key", {"title": "song"})
+    await cache.put("missing", None)
+    await cache.close()
+
+    restarted = MetadataCache(config, clock)
+    entry = await restarted.get("key")
+    missing = await restarted.get("missing")
+
+    assert entry is not None
+    assert entry.value == {"title": "song"}
+    assert missing is not None
+    assert missing.negative
+    assert restarted.stats.sqlite_hits == 2
+
+    clock.now += 2 * 24 * 60 * 60
+    assert await restarted.get("key") is None
+    await restarted.close()
+
+
+def test_cache_rejects_invalid_config():
+    with pytest.raises(ValueError):
+        MetadataCache({"max_entries": 0})
+    with pytest.raises(ValueError):
+        MetadataCache({"negative_ttl_seconds": 0})
@@ -0,0 +1,68 @@
+from .executor import (
+    ThreadRetrievalExecutor,
+    create_retrieval_executor,
+)
+
+import asyncio
+import threading
+import time
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_runs_off_the_event_loop_thread():
+    executor = ThreadRetrievalExecutor(max_workers=2)
+    try:
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+    finally:
+        executor.close()
+
+    assert thread_name.startswith("video-retrieval")
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_keeps_event_loop_responsive():
+    executor = ThreadRetrievalExecutor(max_workers=1)
+    ticks = 0
+
+    async def _tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    ticker = asyncio.create_task(_tick())
+    try:
+        await executor.run(time.sleep, 0.05)
+    finally:
+        ticker.cancel()
+        executor.close()
+
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_thread_executor_propagates_exceptions():
+    def _fail() -> None:
+        raise RuntimeError("extract failed")
+
+    executor = create_retrieval_executor({"backend": "thread", "max_workers": 1})
+    try:
+        with pytest.raises(RuntimeError):
+            await executor.run(_fail)
+    finally:
+        executor.close()
+
+
+def test_create_retrieval_executor_defaults_to_threads():
+    executor = create_retrieval_executor()
+    executor.close()
+
+    assert isinstance(executor, ThreadRetrievalExecutor)
+
+
+def test_create_retrieval_executor_rejects_invalid_config():
+    with pytest.raises(ValueError):
+        create_retrieval_executor({"backend": "fork"})
+    with pytest.raises(ValueError):
+        create_retrieval_executor({"max_workers": 0})
@@ -0,0 +1,85 @@
+from .pool import YoutubeDLPool
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture
+def youtube_dl():
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
+        mock_youtube_dl.side_effect = lambda _: MagicMock()
+        yield mock_youtube_dl
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_warm_instances(youtube_dl: MagicMock):
+    pool = YoutubeDLPool({"quiet": True}, {"size": 2})
+
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        pass
+
+    assert first is second
+    youtube_dl.assert_called_once_with({"quiet": True})
+    assert pool.stats.created == 1
+    assert pool.stats.completed == 2
+    assert pool.stats.idle == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrency_and_reports_waiting(youtube_dl: MagicMock):
+    pool = YoutubeDLPool({}, {"size": 2})
+    release = asyncio.Event()
+    borrowed: set[int] = set()
+
+    async def _use() -> None:
+        async with pool.acquire() as ydl:
+            borrowed.add(id(ydl))
+            await release.wait()
+
+    tasks = [asyncio.create_task(_use()) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    assert pool.stats.in_flight == 2
+    assert pool.stats.waiting == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert len(borrowed) == 2
+    assert pool.stats.created == 2
+    assert pool.stats.in_flight == 0
+    assert pool.stats.waiting == 0
+    assert pool.stats.completed == 5
+
+
+@pytest.mark.asyncio
+async def test_pool_returns_instance_after_error(youtube_dl: MagicMock):
+    pool = YoutubeDLPool({}, {"size": 1})
+
+    with pytest.raises(RuntimeError):
+        async with pool.acquire():
+            raise RuntimeError("extract failed")
+
+    async with pool.acquire():
+        assert pool.stats.in_flight == 1
+    assert pool.stats.created == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_close_closes_idle_instances(youtube_dl: MagicMock):
+    pool = YoutubeDLPool({})
+    async with pool.acquire() as ydl:
+        pass
+
+    pool.close()
+
+    ydl.close.assert_called_once()
+    assert pool.stats.idle == 0
+
+
+def test_pool_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        YoutubeDLPool({}, {"size": 0})
@@ -1,7 +1,12 @@
-from ..shared.data import AudioExtension
+from ..shared.data import AudioExtension, SubtitleExtension, Transcription
+from ..shared.supported import Language
+from .exception import SubtitleNotFoundError, VideoExtractError
 from .retrieval import VideoRetrieval
+from .type import Captions
 
+import asyncio
 import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 
 @pytest.fixture
@@ -81,3 +86,158 @@ async def test_retrieval_audio_of_video(retrieval: VideoRetrieval):
             assert audio.extension == AudioExtension.AAC
 
     assert_between_audio_and_file()
+
+
+def _ytdlp_process(output: bytes, returncode: int) -> Mock:
+    stdout = asyncio.StreamReader()
+    stdout.feed_data(output)
+    stdout.feed_eof()
+
+    process = Mock()
+    process.stdout = stdout
+    process.returncode = None
+
+    async def wait():
+        process.returncode = returncode
+        return returncode
+
+    process.wait = wait
+    return process
+
+
+# The start of an MP4 file as yt-dlp writes YouTube's m4a tracks
+MP4_HEAD = b"\x00\x00\x00\x18ftypdash\x00\x00\x00\x00iso6mp41"
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_of_video_yields_ytdlp_output(retrieval: VideoRetrieval):
+    with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+        mock_create.return_value = _ytdlp_process(MP4_HEAD + b"audio", returncode=0)
+
+        stream = await retrieval.stream_audio_of_video("https://youtu.be/testestest")
+        audio = await stream.read()
+
+    assert mock_create.call_args.args[0] == "yt-dlp"
+    assert audio.binary == MP4_HEAD + b"audio"
+    assert audio.extension == AudioExtension.AAC
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "head, extension",
+    [
+        (MP4_HEAD, AudioExtension.AAC),
+        (b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01", AudioExtension.WEBM),
+        (b"OggS\x00\x02" + bytes(22) + b"OpusHead", AudioExtension.OPUS),
+        (b"OggS\x00\x02" + bytes(22) + b"\x01vorbis", AudioExtension.OGG),
+        (b"ID3\x04\x00\x00", AudioExtension.MP3),
+        (b"\xff\xf1\x50\x80", AudioExtension.AAC),
+    ],
+)
+async def test_stream_audio_of_video_detects_the_container(
+    retrieval: VideoRetrieval, head: bytes, extension: AudioExtension
+):
+    with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+        mock_create.return_value = _ytdlp_process(head, returncode=0)
+
+        stream = await retrieval.stream_audio_of_video("https://youtu.be/testestest")
+
+    assert stream.extension == extension
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_of_video_rejects_unknown_containers(
+    retrieval: VideoRetrieval,
+):
+    with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+        mock_create.return_value = _ytdlp_process(b"audio_bytes", returncode=0)
+
+        with pytest.raises(VideoExtractError):
+            await retrieval.stream_audio_of_video("https://youtu.be/testestest")
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_of_video_failure(retrieval: VideoRetrieval):
+    with patch("asyncio.subprocess.create_subprocess_exec") as mock_create:
+        mock_create.return_value = _ytdlp_process(b"", returncode=1)
+
+        with pytest.raises(VideoExtractError):
+            await retrieval.retrieval_audio_of_video("https://youtu.be/testestest")
+
+
+@pytest.mark.asyncio
+async def test_pooled_youtube_dl_is_reused_across_extractions():
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
+        mock_youtube_dl.return_value = MagicMock()
+        mock_youtube_dl.return_value.extract_info.return_value = {
+            "display_id": "testestest",
+            "webpage_url_domain": "youtube.com",
+            "duration": 100,
+        }
+        retrieval = VideoRetrieval({}, {"size": 2})
+
+        for _ in range(3):
+            video_info = await retrieval.retrieval_video_info(
+                "https://youtu.be/testestest"
+            )
+
+    assert video_info.video_id == "testestest"
+    assert video_info.duration_seconds == 100
+    mock_youtube_dl.assert_called_once()
+    assert retrieval.pool_stats.completed == 3
+
+
+@pytest.mark.asyncio
+async def test_video_info_is_cached():
+    with patch("yt_dlp.YoutubeDL") as mock_youtube_dl:
+        mock_youtube_dl.return_value.extract_info.return_value = {
+            "display_id": "testestest",
+            "duration": 100,
+        }
+        retrieval = VideoRetrieval({}, cache={})
+
+        first = await retrieval.retrieval_video_info("https://youtu.be/testestest")
+        second = await retrieval.retrieval_video_info("https://youtu.be/testestest")
+
+    assert first == second
+    mock_youtube_dl.return_value.extract_info.assert_called_once()
+    assert retrieval.cache_stats is not None
+    assert retrieval.cache_stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_retrieval_subtitle_of_video_is_cached():
+    retrieval = VideoRetrieval({}, cache={})
+    subtitle = Transcription(
+        content="WEBVTT\n", extension=SubtitleExtension.VTT, language=Language.korean
+    )
+    retrieval._executor = Mock()
+    retrieval._executor.run = AsyncMock(
+        return_value=Captions(transcription=subtitle, generated=False)
+    )
+
+    first = await retrieval.retrieval_subtitle_of_video(
+        "https://youtu.be/testestest", Language.korean
+    )
+    second = await retrieval.retrieval_captions_of_video(
+        "https://www.youtube.com/watch?v=testestest", Language.korean
+    )
+
+    assert first == subtitle
+    assert second == Captions(transcription=subtitle, generated=False)
+    retrieval._executor.run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_retrieval_subtitle_of_video_caches_missing_subtitles():
+    retrieval = VideoRetrieval({}, cache={})
+    retrieval._executor = Mock()
+    retrieval._executor.run = AsyncMock(side_effect=SubtitleNotFoundError("none"))
+
+    for _ in range(2):
+        with pytest.raises(SubtitleNotFoundError):
+            await retrieval.retrieval_subtitle_of_video("https://youtu.be/testestest")
+
+    retrieval._executor.run.assert_awaited_once()
+    assert retrieval.cache_stats is not None
+    assert retrieval.cache_stats.negative_hits == 1
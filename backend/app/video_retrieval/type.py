@@ -1,3 +1,5 @@
+from ..shared.data import Transcription
+
 from dataclasses import dataclass, field
 
 
@@ -11,3 +13,10 @@ class VideoInfo:
     title: str
     thumbnail_url: str
     description: str = field(default="")
+
+
+@dataclass(frozen=True)
+class Captions:
+    transcription: Transcription
+    # Produced by the platform's speech recognition rather than uploaded
+    generated: bool
@@ -0,0 +1,107 @@
+"""Compare page latency of offset and keyset pagination by depth.
+
+A database file in a temporary directory is filled with ``--lyrics`` lyrics
+spread over a few videos. Each depth is then fetched ``--repeat`` times with
+``page``/``size``, which skips every row before the page, and with the
+cursor of the item right before it, which seeks to it through the index.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.keyset_pagination
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+DEPTHS = (0.0, 0.25, 0.5, 0.99)
+VIDEOS = 4
+
+
+async def _fill(path: Path, args: argparse.Namespace):
+    from app.database import AIOSqlite
+    from app.lyric.model import Lyric
+    from app.shared.supported import Language, Platform
+    from app.video.model import Video
+
+    database = AIOSqlite(relative_path=str(path))
+    await database.create_database()
+    async with database.session() as session:
+        session.add_all(
+            Video(
+                platform=Platform.youtube,
+                video_id=f"benchmark{i}",
+                channel_id="channel",
+                channel_name="Channel",
+                title="Benchmark",
+                duration_seconds=100,
+                thumbnail_url="http://example.com/thumbnail.jpg",
+            )
+            for i in range(VIDEOS)
+        )
+        session.add_all(
+            Lyric(
+                language=Language.english,
+                content=f"Lyric {i}",
+                video_instance_id=i % VIDEOS + 1,
+            )
+            for i in range(args.lyrics)
+        )
+        await session.commit()
+    return database
+
+
+async def _time(call, repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        await call()
+    return (time.perf_counter() - started_at) / repeat
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from app.lyric.repository import LyricRepository
+    from app.shared.pagination import encode_cursor
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = await _fill(Path(directory) / "main.db", args)
+        repository = LyricRepository(database)
+        # Lyrics of one video, matching what the list endpoints filter on
+        per_video = args.lyrics // VIDEOS
+
+        print(f"{'depth':>8} {'offset ms':>10} {'cursor ms':>10}")
+        for depth in DEPTHS:
+            page = int(per_video * depth) // args.size + 1
+            # Instance IDs of video 1 are 1, 1 + VIDEOS, 1 + 2 * VIDEOS, ...
+            after = encode_cursor((page - 1) * args.size * VIDEOS)
+
+            offset = await _time(
+                lambda page=page: repository.get_paginated_lyrics(
+                    page, args.size, video_instance_id=1
+                ),
+                args.repeat,
+            )
+            cursor = await _time(
+                lambda after=after: repository.get_cursor_paginated_lyrics(
+                    after, args.size, video_instance_id=1
+                ),
+                args.repeat,
+            )
+            print(
+                f"{(page - 1) * args.size:>8} {offset * 1000:>10.2f} "
+                f"{cursor * 1000:>10.2f}"
+            )
+        await database._engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lyrics", type=int, default=200_000)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare wall time of local CPU Whisper against the Runpod Whisper endpoint.
+
+The given clip is transcribed ``--rounds`` times by each backend. The first
+round includes model loading for the local backend and a possible cold start
+for Runpod, so it is reported separately from the median of the remaining
+rounds. Backends are configured by the ``stt.local_whisper`` and
+``stt.runpod_whisper`` sections of config.yaml; a backend whose section is
+missing, or whose dependency is not installed, is skipped.
+
+Usage, from the backend directory:
+
+    uv pip install -e ".[local-whisper]"
+    python -m benchmarks.local_whisper_vs_runpod --audio clip.mp3
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import statistics
+import time
+
+import yaml
+
+
+async def _measure(speech_to_text, audio, rounds: int) -> tuple[float, float | None]:
+    seconds: list[float] = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        await speech_to_text.transcribe(audio)
+        seconds.append(time.perf_counter() - started_at)
+    warm = statistics.median(seconds[1:]) if len(seconds) > 1 else None
+    return seconds[0], warm
+
+
+async def _main(args: argparse.Namespace, config: dict, binary: bytes) -> None:
+    from app.shared.data import Audio, AudioExtension
+    from app.shared.http import HTTPTransport
+    from app.stt.converter import configure_audio_converter
+    from app.stt.pcm import decode_pcm
+    from app.stt.speech_to_text import LocalWhisper, RunpodWhisper
+
+    stt_config = config.get("stt") or {}
+    configure_audio_converter(config.get("ffmpeg"))
+
+    extension = AudioExtension(os.path.splitext(args.audio)[1].lstrip(".").lower())
+    audio = Audio(binary=binary, extension=extension)
+    duration = (await decode_pcm(audio)).duration_seconds
+    print(f"{args.audio}: {duration:.1f} s of audio, {args.rounds} rounds")
+    print(f"{'backend':<14} {'first s':>9} {'warm s':>9} {'x realtime':>11}")
+
+    transport = HTTPTransport()
+    backends = {}
+    if stt_config.get("local_whisper"):
+        if importlib.util.find_spec("faster_whisper") is None:
+            print("local_whisper: skipped, faster-whisper is not installed")
+        else:
+            backends["local_whisper"] = LocalWhisper(stt_config["local_whisper"])
+    if (stt_config.get("runpod_whisper") or {}).get("api_key"):
+        backends["runpod_whisper"] = RunpodWhisper(
+            stt_config["runpod_whisper"], transport
+        )
+
+    for name, speech_to_text in backends.items():
+        first, warm = await _measure(speech_to_text, audio, args.rounds)
+        typical = warm if warm is not None else first
+        warm_text = f"{warm:>9.2f}" if warm is not None else f"{'-':>9}"
+        print(f"{name:<14} {first:>9.2f} {warm_text} {duration / typical:>11.1f}")
+        if isinstance(speech_to_text, LocalWhisper):
+            speech_to_text.close()
+
+    await transport.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--audio", required=True)
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.config) as file:
+        config = yaml.safe_load(file) or {}
+    with open(args.audio, "rb") as file:
+        binary = file.read()
+    asyncio.run(_main(args, config, binary))
+
+
+if __name__ == "__main__":
+    main()
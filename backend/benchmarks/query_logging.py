@@ -0,0 +1,91 @@
+"""Compare repository throughput with statement echo and instrumentation.
+
+Transcriptions with ``--content-kb`` of subtitle text are created and read
+back one by one, like the transcription stage and the API do. Echoed
+statements are written to /dev/null, so only the cost of formatting them
+is measured.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.query_logging
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+SETUPS = {
+    "echo": {"echo": True},
+    "quiet": {},
+    "instrumented": {"instrumentation": {"sample_rate": 0.1}},
+}
+
+
+async def _measure(path: Path, options: dict, args: argparse.Namespace) -> float:
+    from app.database import AIOSqlite
+    from app.shared.data import SubtitleExtension
+    from app.shared.supported import Language, Platform
+    from app.transcription.dto import CreateTranscription
+    from app.transcription.repository import TranscriptionRepository
+    from app.video.model import Video
+
+    database = AIOSqlite(relative_path=str(path), **options)
+    await database.create_database()
+    async with database.session() as session:
+        session.add(
+            Video(
+                platform=Platform.youtube,
+                video_id="benchmark",
+                channel_id="channel",
+                channel_name="Channel",
+                title="Benchmark",
+                duration_seconds=100,
+                thumbnail_url="http://example.com/thumbnail.jpg",
+            )
+        )
+
+    repository = TranscriptionRepository(database)
+    content = "WEBVTT\n\n" + "lyrics " * (args.content_kb * 1024 // 7)
+    started_at = time.perf_counter()
+    for _ in range(args.operations):
+        created = await repository.create_transcription(
+            CreateTranscription(
+                language=Language.english,
+                content=content,
+                subtitle_extension=SubtitleExtension.VTT,
+                video_instance_id=1,
+            )
+        )
+        await repository.get_transcription_by_instance_id(created.instance_id)
+    return args.operations / (time.perf_counter() - started_at)
+
+
+async def _main(args: argparse.Namespace) -> dict[str, float]:
+    results = {}
+    for name, options in SETUPS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            results[name] = await _measure(Path(directory) / "main.db", options, args)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=300)
+    parser.add_argument("--content-kb", type=int, default=32)
+    args = parser.parse_args()
+
+    # Echo attaches a stdout handler when the engine is created
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = asyncio.run(_main(args))
+
+    print(f"{'setup':<14} {'ops/s':>8}")
+    for name, result in results.items():
+        print(f"{name:<14} {result:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Compare event loop latency under the video retrieval backends.
+
+Every backend runs in its own interpreter, because the gevent backend
+monkey-patches the whole process. A probe coroutine wakes up every
+``--interval`` seconds and records how late it was while ``--concurrency``
+retrievals run in the background. By default a retrieval is simulated by
+blocking I/O followed by pure-Python parsing, roughly the shape of a yt-dlp
+metadata extraction; pass ``--url`` to extract a real video instead.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.retrieval_loop_latency
+    python -m benchmarks.retrieval_loop_latency --url https://youtu.be/LHvYrn3FAgI
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+BACKENDS = ("thread", "gevent")
+
+
+def _simulated_retrieval(io_seconds: float, cpu_iterations: int) -> int:
+    time.sleep(io_seconds)
+    return sum(i * i for i in range(cpu_iterations))
+
+
+async def _probe(interval: float, lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(loop.time() - expected, 0.0))
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    from app.video_retrieval.executor import create_retrieval_executor
+    from app.video_retrieval.retrieval import VideoRetrieval
+
+    executor_config = {"backend": args.backend, "max_workers": args.concurrency}
+    retrieval = VideoRetrieval(
+        {"quiet": True}, pool={"size": args.concurrency}, executor=executor_config
+    )
+    executor = create_retrieval_executor(executor_config)
+
+    async def _retrieve() -> None:
+        if args.url:
+            await retrieval.retrieval_video_info(args.url)
+        else:
+            await executor.run(
+                _simulated_retrieval, args.io_seconds, args.cpu_iterations
+            )
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(args.interval, lags, stop))
+
+    started_at = time.perf_counter()
+    for _ in range(args.rounds):
+        await asyncio.gather(*(_retrieve() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    stop.set()
+    await probe
+    await retrieval.close()
+    executor.close()
+
+    lags.sort()
+    return {
+        "backend": args.backend,
+        "retrievals": args.rounds * args.concurrency,
+        "elapsed_seconds": elapsed,
+        "lag_p50_ms": statistics.median(lags) * 1000,
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] * 1000,
+        "lag_max_ms": lags[-1] * 1000,
+    }
+
+
+def _child(args: argparse.Namespace) -> None:
+    if args.backend == "gevent":
+        from app.monkey_patch import patch
+
+        patch()
+
+    print(json.dumps(asyncio.run(_run(args))))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=BACKENDS)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--io-seconds", type=float, default=0.05)
+    parser.add_argument("--cpu-iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    if args.backend:
+        _child(args)
+        return
+
+    print(
+        f"{'backend':<8} {'calls':>6} {'elapsed s':>10} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for backend in BACKENDS:
+        output = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.retrieval_loop_latency",
+                "--backend",
+                backend,
+                *sys.argv[1:],
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{result['backend']:<8} {result['retrievals']:>6} "
+            f"{result['elapsed_seconds']:>10.2f} {result['lag_p50_ms']:>8.2f} "
+            f"{result['lag_p99_ms']:>8.2f} {result['lag_max_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
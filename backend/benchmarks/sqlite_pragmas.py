@@ -0,0 +1,94 @@
+"""Compare job write throughput under SQLite pragma profiles and pools.
+
+Every profile gets a fresh database file in a temporary directory. Jobs are
+created and updated one commit at a time, the way pipeline stages record
+their progress, while ``--readers`` tasks keep listing videos.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.sqlite_pragmas
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+PROFILES = {
+    "rollback": {"pragmas": {"journal_mode": "delete", "synchronous": "full"}},
+    "wal": {},
+    "wal+ro": {"read_connections": 4},
+}
+
+
+async def _measure(path: Path, options: dict, args: argparse.Namespace) -> dict:
+    from app.database import AIOSqlite
+    from app.job.dto import CreateJob
+    from app.job.model import JobStatus
+    from app.job.repository import JobRepository
+    from app.shared.supported import Platform
+    from app.video.model import Video
+    from app.video.repository import VideoRepository
+
+    database = AIOSqlite(relative_path=str(path), **options)
+    await database.create_database()
+    async with database.session() as session:
+        session.add(
+            Video(
+                platform=Platform.youtube,
+                video_id="benchmark",
+                channel_id="channel",
+                channel_name="Channel",
+                title="Benchmark",
+                duration_seconds=100,
+                thumbnail_url="http://example.com/thumbnail.jpg",
+            )
+        )
+
+    jobs = JobRepository(database)
+    videos = VideoRepository(database)
+    stop = asyncio.Event()
+    reads = 0
+
+    async def _read() -> None:
+        nonlocal reads
+        while not stop.is_set():
+            await videos.get_paginated_videos(1, 10)
+            reads += 1
+
+    readers = [asyncio.create_task(_read()) for _ in range(args.readers)]
+    started_at = time.perf_counter()
+    for _ in range(args.jobs):
+        job = await jobs.create_job(CreateJob(video_instance_id=1))
+        await jobs.update_job(job.instance_id, status=JobStatus.running)
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    await asyncio.gather(*readers)
+
+    return {
+        "writes_per_second": args.jobs * 2 / elapsed,
+        "reads_per_second": reads / elapsed,
+    }
+
+
+async def _main(args: argparse.Namespace) -> None:
+    print(f"{'profile':<10} {'writes/s':>10} {'reads/s':>10}")
+    for name, options in PROFILES.items():
+        with tempfile.TemporaryDirectory() as directory:
+            result = await _measure(Path(directory) / "main.db", options, args)
+        print(
+            f"{name:<10} {result['writes_per_second']:>10.0f} "
+            f"{result['reads_per_second']:>10.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=300)
+    parser.add_argument("--readers", type=int, default=4)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compare transcription tail latency with and without routing and hedging.
+
+Backends are simulated: a request normally takes around ``--base-ms`` but
+with probability ``--cold-start-rate`` it hits a cold GPU worker and takes
+``--cold-start-ms`` longer. The same request stream is sent to one backend,
+to a router over ``--backends`` backends without hedging, and to the same
+router with hedging after the p95 latency.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.stt_routing_tail_latency
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+
+def _make_backend(args: argparse.Namespace, rng: random.Random):
+    from app.shared.data import Audio, AudioExtension, SubtitleExtension
+    from app.shared.data import Transcription
+    from app.stt.abstract import SpeechToText
+
+    class SimulatedSpeechToText(SpeechToText):
+        _supported_audio_extensions = (AudioExtension.WAV,)
+        _output_subtitle_extension = SubtitleExtension.VTT
+
+        def __init__(self, config: dict):
+            pass
+
+        async def _transcribe(
+            self, audio: Audio, target_language=None, prompt=None
+        ) -> Transcription:
+            seconds = rng.gauss(args.base_ms, args.base_ms / 10) / 1000
+            if rng.random() < args.cold_start_rate:
+                seconds += args.cold_start_ms / 1000
+            await asyncio.sleep(max(seconds, 0))
+            return Transcription(
+                content="WEBVTT\n", extension=SubtitleExtension.VTT, language=None
+            )
+
+    return SimulatedSpeechToText({})
+
+
+async def _measure(name: str, speech_to_text, args: argparse.Namespace) -> dict:
+    from app.shared.data import Audio, AudioExtension
+
+    audio = Audio(binary=b"", extension=AudioExtension.WAV)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def _request() -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            await speech_to_text.transcribe(audio)
+            latencies.append(time.perf_counter() - started_at)
+
+    await asyncio.gather(*(_request() for _ in range(args.requests)))
+    latencies.sort()
+    return {
+        "name": name,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "hedged": getattr(speech_to_text, "hedged", 0),
+    }
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from app.stt.speech_to_text import RoutedSpeechToText
+
+    rng = random.Random(args.seed)  # noqa: S311
+
+    def _backends():
+        return [_make_backend(args, rng) for _ in range(args.backends)]
+
+    hedge = {"hedge_min_samples": 20, "hedge_min_delay_seconds": 0}
+    candidates = {
+        "single": _make_backend(args, rng),
+        "routed": RoutedSpeechToText({"hedge": False}, _backends()),
+        "routed+hedge": RoutedSpeechToText(hedge, _backends()),
+    }
+
+    print(f"{'setup':<14} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'hedged':>7}")
+    for name, speech_to_text in candidates.items():
+        result = await _measure(name, speech_to_text, args)
+        print(
+            f"{result['name']:<14} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+            f"{result['p99_ms']:>8.1f} {result['hedged']:>7}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=6)
+    parser.add_argument("--base-ms", type=float, default=20.0)
+    parser.add_argument("--cold-start-ms", type=float, default=400.0)
+    parser.add_argument("--cold-start-rate", type=float, default=0.04)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare peak memory and CPU time of the audio upload strategies.
+
+Each strategy submits the same random audio ``--rounds`` times to a local
+sink server that drains the body, the way a Runpod submission would be sent.
+Peak memory is the tracemalloc peak above the baseline during one upload, CPU
+time is the process time spent per upload, including the sink reading the
+body. The presigned URL strategy uploads to a local object store instead.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.upload_memory
+    python -m benchmarks.upload_memory --megabytes 64
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+STRATEGIES = ("json", "base64", "multipart", "presigned_url")
+
+
+async def _sink(request: web.Request) -> web.Response:
+    async for _ in request.content.iter_chunked(64 * 1024):
+        pass
+    return web.json_response({"id": "sink", "status": "COMPLETED", "output": {}})
+
+
+async def _run(strategy: str, args: argparse.Namespace, directory: str) -> dict:
+    from app.shared.data import Audio, AudioExtension
+    from app.shared.http import HTTPTransport
+    from app.stt.object_store import LocalObjectStore
+    from app.stt.runpod import RunpodClient
+    from app.stt.upload import AudioFields, create_audio_uploader
+
+    app = web.Application(client_max_size=1024**3)
+    app.router.add_post("/runsync", _sink)
+    server = TestServer(app)
+    await server.start_server()
+    object_store = LocalObjectStore({"directory": directory})
+    await object_store.start()
+    transport = HTTPTransport()
+
+    uploader = create_audio_uploader({"strategy": strategy}, transport, object_store)
+    client = RunpodClient(
+        "benchmark", str(server.make_url("")), transport, uploader=uploader
+    )
+    audio = Audio(
+        binary=os.urandom(args.megabytes * 1024 * 1024),
+        extension=AudioExtension.MP3,
+    )
+    fields = AudioFields(base64="audio", url="audio_url")
+    # Warm up the connection pool outside the measurement
+    await client.run({"parts": ["vocals"]})
+
+    peaks: list[int] = []
+    cpu_seconds: list[float] = []
+    for _ in range(args.rounds):
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        started_at = time.process_time()
+        await client.run({"parts": ["vocals"]}, audio, fields)
+        cpu_seconds.append(time.process_time() - started_at)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        tracemalloc.stop()
+
+    await transport.close()
+    await object_store.close()
+    await server.close()
+    return {
+        "strategy": strategy,
+        "peak_mib": max(peaks) / 1024 / 1024,
+        "cpu_ms": min(cpu_seconds) * 1000,
+    }
+
+
+async def _main(args: argparse.Namespace) -> None:
+    print(f"{args.megabytes} MiB of audio, best of {args.rounds}")
+    print(f"{'strategy':<14} {'peak MiB':>9} {'x audio':>8} {'cpu ms':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for strategy in STRATEGIES:
+            result = await _run(strategy, args, directory)
+            print(
+                f"{result['strategy']:<14} {result['peak_mib']:>9.1f} "
+                f"{result['peak_mib'] / args.megabytes:>8.2f} "
+                f"{result['cpu_ms']:>8.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measure how much audio voice activity trimming keeps from a vocal stem.
+
+A vocal stem is synthesized: ``--seconds`` of faint separation bleed with
+sung passages between an instrumental intro, a break and an outro. The
+detector runs on the decoded samples and the seconds that would be sent to
+the STT backend are compared with the full track, along with the time the
+detection and rendering take.
+
+Usage, from the backend directory:
+
+    python -m benchmarks.vad_trimming
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+
+def _vocal_stem(args: argparse.Namespace):
+    from app.stt.pcm import PCM_SAMPLE_RATE, PCMAudio
+
+    rng = np.random.default_rng(args.seed)
+    size = int(args.seconds * PCM_SAMPLE_RATE)
+    samples = rng.integers(-40, 40, size).astype(np.int16)
+
+    # Verses and choruses between the intro, a break halfway and the outro
+    sung_end = args.seconds - args.outro_seconds
+    middle = args.seconds / 2
+    passages = [
+        (args.intro_seconds, middle - args.break_seconds / 2),
+        (middle + args.break_seconds / 2, sung_end),
+    ]
+    for start, end in passages:
+        position = start
+        while position < end:
+            line = min(rng.uniform(2, 5), end - position)
+            first = int(position * PCM_SAMPLE_RATE)
+            last = int((position + line) * PCM_SAMPLE_RATE)
+            samples[first:last] = rng.integers(-6000, 6000, last - first)
+            # Breaths between lines are kept, they are shorter than a silence
+            position += line + rng.uniform(0.2, 1.0)
+    return PCMAudio(samples=samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=240.0)
+    parser.add_argument("--intro-seconds", type=float, default=30.0)
+    parser.add_argument("--break-seconds", type=float, default=20.0)
+    parser.add_argument("--outro-seconds", type=float, default=30.0)
+    parser.add_argument("--gap-seconds", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from app.stt.vad import TrimmedTimeline, VoiceActivityDetector
+
+    pcm = _vocal_stem(args)
+    detector = VoiceActivityDetector()
+
+    started_at = time.perf_counter()
+    regions = detector.detect(pcm)
+    timeline = TrimmedTimeline.concatenate(regions, args.gap_seconds)
+    trimmed = timeline.render(pcm)
+    elapsed = time.perf_counter() - started_at
+
+    share = trimmed.duration_seconds / pcm.duration_seconds
+    print(f"track:     {pcm.duration_seconds:8.1f} s")
+    print(f"regions:   {len(regions):8d}")
+    print(f"sent:      {trimmed.duration_seconds:8.1f} s ({share:.0%} of the track)")
+    print(f"overhead:  {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,25 @@
-from app.api import api  # noqa: F401 # type: ignore
-import uvicorn
+# gevent has to patch sockets and ssl before anything imports them, and before
+# uvicorn creates the loop. The reloader runs this module again in its worker
+# process, so the patch is applied there as well. Other launchers must patch
+# the process themselves, see app.monkey_patch.
+from app.monkey_patch import configured_backend, patch
+
+gevent = configured_backend() == "gevent"
+if gevent:
+    patch()
+
+from app.api import api  # noqa: E402, F401 # type: ignore
+import uvicorn  # noqa: E402
 
 
 def main():
     print("Hello from backend!")
 
+    # The gevent backend drives asyncio through its own loop policy, any other
+    # backend leaves the process unpatched and can run on uvloop
     uvicorn.run(
         app="app.api:api",
-        loop="asyncio",
+        loop="asyncio" if gevent else "auto",
         reload=True,
     )
 